@@ -1,9 +1,16 @@
 # coding: utf-8
 
+import codecs
 import six
-import sys
 
-from il2fb.parsers.mission.exceptions import MissionParsingError
+from il2fb.parsers.mission.archives import MAX_PENDING_MEMBERS
+from il2fb.parsers.mission.archives import MISSION_FILE_PATTERN
+from il2fb.parsers.mission.archives import parse_archive
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+from il2fb.parsers.mission.context import ParsingContext
+from il2fb.parsers.mission.context import ProbingContext
+from il2fb.parsers.mission.lazy import LazyMission
+from il2fb.parsers.mission.registry import SectionParsersRegistry
 
 from il2fb.parsers.mission.sections.main import MainSectionParser
 from il2fb.parsers.mission.sections.season import SeasonSectionParser
@@ -26,19 +33,29 @@ from il2fb.parsers.mission.sections.wing import FlightSectionParser
 from il2fb.parsers.mission.sections.wing import FlightInfoSectionParser
 from il2fb.parsers.mission.sections.wing import FlightRouteSectionParser
 
-from il2fb.parsers.mission.utils import move_if_present
-from il2fb.parsers.mission.utils import set_if_present
-from il2fb.parsers.mission.utils import strip_comments
+from il2fb.parsers.mission.sources import open_binary
+from il2fb.parsers.mission.sources import open_mission
+from il2fb.parsers.mission.sources import peek_lines
+
+from il2fb.parsers.mission.utils import get_section_name
+from il2fb.parsers.mission.utils import is_section_name
+
+
+#: Names of sections which are parsed by :meth:`MissionParser.probe` by default.
+PROBE_SECTIONS = ('MAIN', 'SEASON', 'WEATHER', )
 
 
 class MissionParser(object):
     """
     Parses a whole mission file.
     View :ref:`detailed description <mission-parser>`.
+
+    Parser does not keep state of parsing between calls, so a single instance
+    can be shared by many threads.
     """
 
     def __init__(self):
-        self.parsers = [
+        self.registry = SectionParsersRegistry([
             MainSectionParser(),
             SeasonSectionParser(),
             WeatherSectionParser(),
@@ -58,192 +75,299 @@ class MissionParser(object):
             RocketSectionParser(),
             FlightSectionParser(),
             FlightRouteSectionParser(),
-        ]
+        ])
         self.flight_info_parser = FlightInfoSectionParser()
 
-    def parse(self, mission):
-        if isinstance(mission, six.string_types):
-            with open(mission, 'r') as f:
-                return self.parse_stream(f)
-        else:
-            return self.parse_stream(mission)
-
-    def parse_stream(self, sequence):
-        self._current_parser = None
-        self.data = {}
-
-        for i, line in enumerate(sequence):
-            line = strip_comments(line)
-            if self.is_section_name(line):
-                self._finalize_current_parser()
-                section_name = self.get_section_name(line)
-                self._current_parser = self._get_parser(section_name)
-            elif self._current_parser:
-                self._try_to_parse_line(i, line)
-
-        self._finalize_current_parser()
-        return self._clean()
+    @property
+    def parsers(self):
+        """
+        Registered section parsers in order of registration. Use
+        :meth:`register_parser` to add new parsers.
+
+        :rtype: :class:`tuple`
+        """
+        return self.registry.parsers
+
+    def parse(self, mission, sections=None, exclude=None, visitor=None,
+              encoding=MISSION_ENCODING, use_mmap=False, index=None,
+              raw=False, strings=None):
+        """
+        Parse a mission.
+
+        :param mission: a path to a mission file, contents of a mission given
+                        as bytes, a file object or a sequence of lines (see
+                        :func:`~il2fb.parsers.mission.sources.open_mission`)
+        :param sections: shell-style patterns of names of sections to parse
+                         (e.g. ``['MAIN', 'Wing', '*_Way']``). All sections are
+                         parsed if ``None``.
+        :param exclude: shell-style patterns of names of sections to skip
+        :param visitor: an instance of
+                        :class:`~il2fb.parsers.mission.visitors.MissionVisitor`
+                        which receives collected objects (buildings, route
+                        points, etc.) instead of the result of parsing
+        :param str encoding: encoding of a mission given as bytes. Only lines
+                             of parsed sections are decoded.
+        :param bool use_mmap: tells whether to map a file given by path into
+                              memory instead of reading it line-by-line.
+                              Sections are found directly in the mapped
+                              buffer.
+        :param index: an instance of
+                      :class:`~il2fb.parsers.mission.index.SectionIndex` built
+                      for the mission. If given, only sections which are going
+                      to be parsed are read. Mission must be given by path, as
+                      bytes or as a seekable binary file object.
+        :param bool raw: tells whether to collect buildings, stationary
+                         objects, rockets, front markers and route points as
+                         raw structures, which convert their fields on first
+                         access (see :mod:`il2fb.parsers.mission.raw`)
+        :param dict strings: a table which interns repeated strings, e.g.
+                             codes of objects and names of skins. A new one is
+                             used for each mission if ``None``. Pass the same
+                             dictionary to share strings between missions.
+
+        :returns: parsed mission
+        :rtype: :class:`dict`
+        """
+        context = ParsingContext(
+            self, sections, exclude, visitor=visitor, raw=raw, strings=strings,
+        )
+        for event in self._iter_sections(
+            context, mission, encoding, use_mmap, index,
+        ):
+            pass
+        return context.finish()
+
+    def parse_stream(self, sequence, sections=None, exclude=None,
+                     visitor=None, encoding=MISSION_ENCODING, raw=False,
+                     strings=None):
+        lines, is_binary = peek_lines(sequence)
+        context = ParsingContext(
+            self, sections, exclude, visitor=visitor, raw=raw, strings=strings,
+        )
+        context.process_lines(lines, encoding=(encoding if is_binary else None))
+        return context.finish()
+
+    def iterparse(self, mission, sections=None, exclude=None, link=True,
+                  visitor=None, encoding=MISSION_ENCODING, use_mmap=False,
+                  index=None, raw=False, strings=None):
+        """
+        Parse a mission and yield data of each section as soon as the section
+        is parsed.
+
+        :param mission: a path to a mission file, contents of a mission given
+                        as bytes, a file object or a sequence of lines
+        :param sections: shell-style patterns of names of sections to parse
+        :param exclude: shell-style patterns of names of sections to skip
+        :param bool link: tells whether to combine data of all sections into a
+                          whole mission. If ``False``, data of sections is not
+                          kept after it is yielded.
+        :param visitor: an object which receives collected objects (see
+                        :meth:`parse`)
+        :param str encoding: encoding of a mission given as bytes
+        :param bool use_mmap: tells whether to map a file given by path into
+                              memory (see :meth:`parse`)
+        :param index: index of sections of the mission (see :meth:`parse`)
+        :param bool raw: tells whether to collect raw structures (see
+                         :meth:`parse`)
+        :param dict strings: a table which interns repeated strings (see
+                             :meth:`parse`)
+
+        :returns: an iterator over ``(section_name, data)`` pairs. If ``link``
+                  is ``True``, the last pair is ``(None, mission)``, where
+                  ``mission`` is the same as a result of :meth:`parse`.
+        """
+        context = ParsingContext(
+            self, sections, exclude, retain=link, visitor=visitor, raw=raw,
+            strings=strings,
+        )
+
+        for event in self._iter_sections(
+            context, mission, encoding, use_mmap, index,
+        ):
+            yield event
+
+        event = context.finish_section()
+        if event is not None:
+            yield event
+
+        if link:
+            yield None, context.clean()
+
+    def probe(self, mission, sections=PROBE_SECTIONS,
+              encoding=MISSION_ENCODING, use_mmap=False):
+        """
+        Parse only sections from the head of a mission and stop reading as
+        soon as they are parsed or a bulky section (e.g. ``Wing``) is met.
+
+        :param mission: a path to a mission file, contents of a mission given
+                        as bytes, a file object or a sequence of lines
+        :param sections: names of sections to parse
+        :param str encoding: encoding of a mission given as bytes
+        :param bool use_mmap: tells whether to map a file given by path into
+                              memory (see :meth:`parse`)
+
+        :returns: parsed part of mission
+        :rtype: :class:`dict`
+        """
+        context = ProbingContext(self, sections)
+        for event in self._iter_sections(context, mission, encoding, use_mmap):
+            pass
+        return context.finish()
+
+    def parse_archive(self, path, pattern=MISSION_FILE_PATTERN, sections=None,
+                      exclude=None, encoding=MISSION_ENCODING, executor=None,
+                      max_pending=MAX_PENDING_MEMBERS, func=None):
+        """
+        Parse missions stored in a zip or tar archive without extracting them.
+        See :func:`~il2fb.parsers.mission.archives.parse_archive` for details.
+
+        :param str path: a path to an archive
+        :param str pattern: a shell-style pattern of names of members to parse
+        :param sections: shell-style patterns of names of sections to parse
+        :param exclude: shell-style patterns of names of sections to skip
+        :param str encoding: encoding of missions
+        :param executor: an instance of :class:`concurrent.futures.Executor`
+                         which parses members in parallel
+        :param int max_pending: max number of members which are parsed by
+                                executor at once
+        :param func: a callable which is run by executor instead of
+                     :func:`~il2fb.parsers.mission.archives.parse_data`
+
+        :returns: an iterator over ``(member_name, mission)`` pairs
+        """
+        return parse_archive(
+            self, path, pattern, sections, exclude, encoding, executor,
+            max_pending, func,
+        )
+
+    def parse_lazy(self, mission, index=None, encoding=MISSION_ENCODING,
+                   use_mmap=False):
+        """
+        Get a mission which is parsed section-by-section on demand.
+
+        :param mission: a path to a mission file, contents of a mission given
+                        as bytes or a seekable binary file object
+        :param index: index of sections of the mission (see :meth:`parse`).
+                      It is built if ``None``.
+        :param str encoding: encoding of a mission
+        :param bool use_mmap: tells whether to map a file given by path into
+                              memory (see :meth:`parse`)
+
+        :returns: a lazy mission
+        :rtype: :class:`~il2fb.parsers.mission.lazy.LazyMission`
+        """
+        return LazyMission(self, mission, index, encoding, use_mmap)
 
     @staticmethod
-    def is_section_name(line):
-        return line.startswith('[') and line.endswith(']')
-
-    @staticmethod
-    def get_section_name(line):
-        return line.strip('[]')
-
-    def _get_parser(self, section_name):
-        parser = self.flight_info_parser
-        flights = self.data.get('flights')
-
-        if flights is not None and parser.start(section_name):
-            return parser
-
-        for parser in self.parsers:
-            if parser.start(section_name):
-                return parser
-
-        return None
-
-    def _finalize_current_parser(self):
-        if not self._current_parser:
-            return
-        try:
-            data = self._current_parser.stop()
-        except Exception:
-            error_type, original_msg, traceback = sys.exc_info()
-            msg = (
-                "{0} during finalization of \"{1}\": {2}"
-                .format(error_type.__name__,
-                        self._current_parser.__class__.__name__,
-                        original_msg))
-            self._raise_error(msg, traceback)
+    def _iter_sections(context, mission, encoding, use_mmap, index=None):
+        if index is None:
+            with open_mission(mission, encoding, use_mmap) as (lines, encoding):
+                for event in context.iter_sections(lines, encoding=encoding):
+                    yield event
         else:
-            self.data.update(data)
-        finally:
-            self._current_parser = None
-
-    def _try_to_parse_line(self, line_number, line):
-        try:
-            self._current_parser.parse_line(line)
-        except Exception:
-            error_type, original_msg, traceback = sys.exc_info()
-            msg = (
-                "{0} in line #{1} (\"{2}\"): {3}"
-                .format(error_type.__name__, line_number, line, original_msg))
-            self._raise_error(msg, traceback)
-
-    @staticmethod
-    def _raise_error(message, traceback):
-        error = MissionParsingError(message)
-        six.reraise(MissionParsingError, error, traceback)
-
-    def _clean(self):
-        result = {}
-
-        move_if_present(result, self.data, 'location_loader')
-        move_if_present(result, self.data, 'player')
-        move_if_present(result, self.data, 'targets')
-
-        set_if_present(result, 'conditions', self._get_conditions())
-        set_if_present(result, 'objects', self._get_objects())
+            with open_binary(mission, use_mmap) as source:
+                for event in context.iter_indexed_sections(
+                    source, index, encoding,
+                ):
+                    yield event
 
-        return result
+    is_section_name = staticmethod(is_section_name)
+    get_section_name = staticmethod(get_section_name)
 
-    def _get_conditions(self):
-        result = {}
+    def register_parser(self, parser):
+        """
+        Add a custom section parser. It will take precedence over built-in
+        parsers of sections with same names (see
+        :meth:`~il2fb.parsers.mission.registry.SectionParsersRegistry.register`).
 
-        set_if_present(result, 'time_info', self._get_time_info())
-        set_if_present(result, 'meteorology', self._get_meteorology())
-        set_if_present(result, 'scouting', self._get_scouting())
+        :param parser: an instance of
+                       :class:`~il2fb.parsers.mission.sections.base.SectionParser`
 
-        move_if_present(result, self.data, 'respawn_time')
+        :returns: ``None``
+        """
+        self.registry.register(parser)
 
-        if 'conditions' in self.data:
-            conditions = self.data['conditions']
 
-            move_if_present(result, conditions, 'radar')
-            move_if_present(result, conditions, 'communication')
-            move_if_present(result, conditions, 'home_bases')
-            move_if_present(result, conditions, 'crater_visibility_muptipliers')
-
-        return result
-
-    def _get_time_info(self):
-        result = {}
-
-        move_if_present(result, self.data, 'date')
-        if 'time' in self.data:
-            result.update({
-                'time': self.data['time']['value'],
-                'is_fixed': self.data['time']['is_fixed'],
-            })
-
-        return result
-
-    def _get_meteorology(self):
-        result = {}
-
-        move_if_present(result, self.data, 'weather', 'weather_conditions')
-        move_if_present(result, self.data, 'cloud_base')
-
-        if 'weather' in self.data:
-            result.update(self.data.pop('weather'))
-
-        return result
-
-    def _get_scouting(self):
-        try:
-            result = self.data['conditions'].pop('scouting')
-        except KeyError:
-            result = {}
-
-        scouts = [
-            self.data[key]
-            for key in sorted(self.data.keys())
-            if key.startswith(MDSScoutsSectionParser.output_prefix)
-        ]
-        if scouts:
-            result['scouts'] = scouts
-
-        return result
-
-    def _get_objects(self):
-        result = {}
-
-        set_if_present(result, 'moving_units', self._get_moving_units())
-        set_if_present(result, 'flights', self._get_flights())
-        set_if_present(result, 'home_bases', self._get_home_bases())
+class MissionFeedParser(object):
+    """
+    Parses a mission which is given by chunks of arbitrary size, e.g. while
+    it is being received via network. Does not perform any I/O by itself.
 
-        move_if_present(result, self.data, 'stationary')
-        move_if_present(result, self.data, 'buildings')
-        move_if_present(result, self.data, 'cameras')
-        move_if_present(result, self.data, 'markers')
-        move_if_present(result, self.data, 'rockets')
+    Lines which are split between chunks are joined back. Only the last
+    incomplete line is buffered, so the whole mission is never kept in memory.
 
-        return result
+    **Example**:
 
-    def _get_moving_units(self):
-        units = self.data.pop('moving_units', [])
-        for unit in units:
-            key = "{0}{1}".format(ChiefRoadSectionParser.output_prefix, unit['id'])
-            unit['route'] = self.data.pop(key, [])
-        return units
+    .. code-block:: python
 
-    def _get_flights(self):
-        keys = self.data.pop('flights', [])
-        flights = [self.data.pop(key) for key in keys if key in self.data]
-        for flight in flights:
-            key = "{0}{1}".format(FlightRouteSectionParser.output_prefix, flight['id'])
-            flight['route'] = self.data.pop(key, [])
-        return flights
+       parser = MissionFeedParser()
+       for chunk in request.iter_content(4096):
+           parser.feed(chunk)
+       mission = parser.close()
 
-    def _get_home_bases(self):
-        home_bases = self.data.pop('home_bases', [])
-        for i, home_base in enumerate(home_bases):
-            key = "{0}{1}".format(BornPlaceAircraftsSectionParser.output_prefix, i)
-            home_base['spawning']['aircraft_limitations']['allowed_aircrafts'] = self.data.pop(key, [])
+    :param mission_parser: an instance of :class:`MissionParser` which
+                           provides section parsers. A new one is created if
+                           ``None``.
+    :param sections: shell-style patterns of names of sections to parse
+    :param exclude: shell-style patterns of names of sections to skip
+    :param visitor: an object which receives collected objects (see
+                    :meth:`MissionParser.parse`)
+    :param str encoding: encoding which is used to decode chunks of bytes
+    """
 
-            key = "{0}{1}".format(BornPlaceAirForcesSectionParser.output_prefix, i)
-            home_base['spawning']['allowed_air_forces'] = self.data.pop(key, [])
-        return home_bases
+    def __init__(self, mission_parser=None, sections=None, exclude=None,
+                 visitor=None, encoding=MISSION_ENCODING):
+        if mission_parser is None:
+            mission_parser = MissionParser()
+
+        self._context = ParsingContext(
+            mission_parser, sections, exclude, visitor=visitor,
+        )
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._tail = ''
+        self._line_number = 0
+        self._is_closed = False
+
+    def feed(self, chunk):
+        """
+        Parse next chunk of a mission.
+
+        :param chunk: a part of a mission
+        :type chunk: :class:`str` or :class:`bytes`
+
+        :returns: ``None``
+        """
+        if self._is_closed:
+            raise ValueError("feed() is called after close()")
+
+        if isinstance(chunk, six.binary_type):
+            chunk = self._decoder.decode(chunk)
+
+        lines = (self._tail + chunk).split('\n')
+        self._tail = lines.pop()
+        self._process_lines(lines)
+
+    def close(self):
+        """
+        Finish parsing of a mission.
+
+        :returns: parsed mission
+        :rtype: :class:`dict`
+        """
+        if self._is_closed:
+            raise ValueError("close() is called twice")
+
+        self._is_closed = True
+
+        tail = self._tail + self._decoder.decode(b'', final=True)
+        self._tail = ''
+        if tail:
+            self._process_lines(tail.split('\n'))
+
+        return self._context.finish()
+
+    def _process_lines(self, lines):
+        process_line = self._context.process_line
+        for i, line in enumerate(lines, self._line_number):
+            process_line(i, line)
+        self._line_number += len(lines)
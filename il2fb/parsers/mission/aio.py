@@ -0,0 +1,180 @@
+# coding: utf-8
+"""
+Parsing of missions by means of :mod:`asyncio`. Requires Python 3.5+.
+"""
+
+import asyncio
+import functools
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+from il2fb.parsers.mission.context import ParsingContext
+
+
+def _get_running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:  # Python < 3.7 pragma: no cover
+        # Returns a running loop if called from a coroutine.
+        return asyncio.get_event_loop()
+
+
+class LinesBatches(object):
+    """
+    Async iterator which groups lines read from an async iterable into lists.
+
+    :param lines: an async iterable of lines given as strings or bytes
+    :param str encoding: encoding which is used to decode lines given as bytes
+    :param int batch_size: max number of lines in a batch
+
+    Yields ``(batch, start)`` pairs, where ``start`` is a number of the first
+    line in the batch.
+    """
+
+    def __init__(self, lines, encoding, batch_size):
+        self._lines = lines.__aiter__()
+        self._encoding = encoding
+        self._batch_size = batch_size
+        self._start = 0
+        self._is_exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._is_exhausted:
+            raise StopAsyncIteration
+
+        batch = []
+
+        while len(batch) < self._batch_size:
+            try:
+                line = await self._lines.__anext__()
+            except StopAsyncIteration:
+                self._is_exhausted = True
+                break
+
+            if isinstance(line, bytes):
+                line = line.decode(self._encoding)
+            batch.append(line)
+
+        if not batch:
+            raise StopAsyncIteration
+
+        start, self._start = self._start, self._start + len(batch)
+        return batch, start
+
+
+class AsyncMissionParser(MissionParser):
+    """
+    Parses a whole mission file without blocking an event loop for a long
+    time.
+
+    **Example**:
+
+    .. code-block:: python
+
+       parser = AsyncMissionParser()
+       reader, writer = await asyncio.open_connection(host, port)
+       mission = await parser.parse_async(reader)
+
+    """
+    #: Number of lines which are parsed before control is given back to event
+    #: loop.
+    batch_size = 1000
+
+    async def parse_async(self, mission, sections=None, exclude=None,
+                          visitor=None, encoding=MISSION_ENCODING,
+                          batch_size=None):
+        """
+        Parse a mission which is read from an asynchronous source. Control is
+        given back to event loop after each ``batch_size`` lines.
+
+        :param mission: an instance of :class:`asyncio.StreamReader` or any
+                        other async iterable of lines
+        :param sections: shell-style patterns of names of sections to parse
+        :param exclude: shell-style patterns of names of sections to skip
+        :param visitor: an object which receives collected objects (see
+                        :meth:`~il2fb.parsers.mission.MissionParser.parse`)
+        :param str encoding: encoding which is used to decode lines given as
+                             bytes
+        :param int batch_size: number of lines to parse at once. Defaults to
+                               :attr:`batch_size`.
+
+        :returns: parsed mission
+        :rtype: :class:`dict`
+        """
+        batch_size = batch_size or self.batch_size
+        context = ParsingContext(self, sections, exclude, visitor=visitor)
+
+        async for batch, start in LinesBatches(mission, encoding, batch_size):
+            context.process_lines(batch, start)
+            await asyncio.sleep(0)
+
+        return context.finish()
+
+    async def parse_in_executor(self, mission, sections=None, exclude=None,
+                                visitor=None, encoding=MISSION_ENCODING,
+                                batch_size=None, executor=None, loop=None):
+        """
+        Parse a mission in a separate thread or process.
+
+        Synchronous sources (paths to files and sequences of lines) are parsed
+        by :meth:`~il2fb.parsers.mission.MissionParser.parse` in executor
+        entirely. Asynchronous sources are read by event loop in batches of
+        ``batch_size`` lines. Each batch is parsed in executor while the next
+        one is being read. Such sources require an executor which runs tasks
+        in threads, as state of parsing is shared between batches.
+
+        :param mission: a path to a mission file, a sequence of lines, an
+                        instance of :class:`asyncio.StreamReader` or any other
+                        async iterable of lines
+        :param sections: shell-style patterns of names of sections to parse
+        :param exclude: shell-style patterns of names of sections to skip
+        :param visitor: an object which receives collected objects. Its
+                        methods are called from executor.
+        :param str encoding: encoding which is used to decode lines given as
+                             bytes
+        :param int batch_size: number of lines to pass to executor at once.
+                               Defaults to :attr:`batch_size`.
+        :param executor: an instance of
+                         :class:`concurrent.futures.Executor`. Default executor
+                         of event loop is used if ``None``.
+        :param loop: an event loop. Running event loop is used if ``None``.
+
+        :returns: parsed mission
+        :rtype: :class:`dict`
+        """
+        loop = loop or _get_running_loop()
+
+        if not hasattr(mission, '__aiter__'):
+            return await loop.run_in_executor(executor, functools.partial(
+                self.parse, mission, sections, exclude, visitor, encoding,
+            ))
+
+        batch_size = batch_size or self.batch_size
+        context = ParsingContext(self, sections, exclude, visitor=visitor)
+        pending = None
+
+        try:
+            async for batch, start in LinesBatches(
+                mission, encoding, batch_size,
+            ):
+                if pending is not None:
+                    await pending
+                pending = loop.run_in_executor(
+                    executor, context.process_lines, batch, start,
+                )
+
+            if pending is not None:
+                await pending
+        finally:
+            if pending is not None and not pending.done():
+                # Reading has failed: do not leave the last batch being
+                # parsed in executor behind.
+                await asyncio.wait([pending, ])
+                if not pending.cancelled():
+                    pending.exception()
+
+        return await loop.run_in_executor(executor, context.finish)
+
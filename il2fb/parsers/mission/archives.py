@@ -0,0 +1,153 @@
+# coding: utf-8
+"""
+Parsing of missions which are stored in zip or tar archives.
+"""
+
+import collections
+import fnmatch
+import io
+import tarfile
+import zipfile
+
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+
+
+#: Default pattern of names of archive members which are parsed.
+MISSION_FILE_PATTERN = '*.mis'
+
+#: Default max number of archive members which are parsed by workers at once.
+MAX_PENDING_MEMBERS = 16
+
+
+def is_archive(path):
+    """
+    :param str path: a path to a file
+
+    :returns: `True` if a file is a zip or tar archive
+    :rtype: :class:`bool`
+    """
+    return zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
+
+
+def iter_archive_members(path, pattern=MISSION_FILE_PATTERN):
+    """
+    Iterate over files in a zip or tar archive (including compressed tar
+    archives) without extracting them.
+
+    Each file object must be read before the next one is requested.
+
+    :param str path: a path to an archive
+    :param str pattern: a case-insensitive shell-style pattern of names of
+                        members to return
+
+    :returns: an iterator over ``(member_name, file_object)`` pairs, where
+              ``file_object`` is opened in binary mode
+    """
+    pattern = pattern.lower()
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                name = info.filename
+                if name.endswith('/') or not fnmatch.fnmatch(name.lower(), pattern):
+                    continue
+                f = archive.open(info)
+                try:
+                    yield name, f
+                finally:
+                    f.close()
+    else:
+        archive = tarfile.open(path, 'r:*')
+        try:
+            for member in archive:
+                if (
+                    not member.isfile() or
+                    not fnmatch.fnmatch(member.name.lower(), pattern)
+                ):
+                    continue
+                f = archive.extractfile(member)
+                try:
+                    yield member.name, f
+                finally:
+                    f.close()
+        finally:
+            archive.close()
+
+
+def parse_archive(mission_parser, path, pattern=MISSION_FILE_PATTERN,
+                  sections=None, exclude=None, encoding=MISSION_ENCODING,
+                  executor=None, max_pending=MAX_PENDING_MEMBERS,
+                  func=None):
+    """
+    Parse missions stored in a zip or tar archive without extracting them.
+
+    Members are streamed through the parser one-by-one. If ``executor`` is
+    given, contents of members are read into memory and parsed by executor,
+    at most ``max_pending`` at once. Results are yielded in order of members
+    in any case.
+
+    Parsed missions contain constants which cannot be pickled, so they cannot
+    be returned from worker processes as is. Pass a module-level ``func``
+    which converts results into a picklable form if executor runs tasks in
+    processes.
+
+    :param mission_parser: an instance of
+                           :class:`~il2fb.parsers.mission.MissionParser`
+    :param str path: a path to an archive
+    :param str pattern: a case-insensitive shell-style pattern of names of
+                        members to parse
+    :param sections: shell-style patterns of names of sections to parse
+    :param exclude: shell-style patterns of names of sections to skip
+    :param str encoding: encoding of missions
+    :param executor: an instance of :class:`concurrent.futures.Executor`
+    :param int max_pending: max number of members which are parsed by
+                            executor at once
+    :param func: a callable which is run by executor instead of
+                 :func:`parse_data`. Accepts same arguments.
+
+    :returns: an iterator over ``(member_name, mission)`` pairs, where
+              ``mission`` is a result of ``func`` if executor is used
+    """
+    func = func or parse_data
+    members = iter_archive_members(path, pattern)
+
+    if executor is None:
+        for name, f in members:
+            yield name, mission_parser.parse(
+                f, sections, exclude, encoding=encoding,
+            )
+        return
+
+    pending = collections.deque()
+
+    for name, f in members:
+        future = executor.submit(
+            func, mission_parser, f.read(), sections, exclude, encoding,
+        )
+        pending.append((name, future))
+
+        if len(pending) >= max_pending:
+            name, future = pending.popleft()
+            yield name, future.result()
+
+    while pending:
+        name, future = pending.popleft()
+        yield name, future.result()
+
+
+def parse_data(mission_parser, data, sections=None, exclude=None,
+               encoding=MISSION_ENCODING):
+    """
+    Parse contents of a mission file. Is run by executor in
+    :func:`parse_archive` by default.
+
+    :param mission_parser: an instance of
+                           :class:`~il2fb.parsers.mission.MissionParser`
+    :param bytes data: contents of a mission file
+
+    :returns: parsed mission
+    :rtype: :class:`dict`
+    """
+    return mission_parser.parse(
+        io.BytesIO(data), sections, exclude, encoding=encoding,
+    )
@@ -0,0 +1,164 @@
+# coding: utf-8
+"""
+Command line interface which parses missions and prints results as JSON
+lines.
+
+Usage::
+
+    python -m il2fb.parsers.mission.cli [-h] [-s SECTION [SECTION ...]]
+                                        [-e SECTION [SECTION ...]]
+                                        [-p PATTERN] [-w WORKERS]
+                                        PATH [PATH ...]
+
+"""
+
+import argparse
+import datetime
+import json
+import sys
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.archives import MISSION_FILE_PATTERN
+from il2fb.parsers.mission.archives import is_archive
+from il2fb.parsers.mission.archives import parse_data
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+from il2fb.parsers.mission.exceptions import MissionParsingError
+
+
+def to_primitive(obj):
+    """
+    Convert objects which are not supported by :mod:`json`.
+
+    :param obj: a value from a parsed mission
+
+    :returns: a primitive representation of a value
+    """
+    if hasattr(obj, 'to_primitive'):
+        return obj.to_primitive()
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dump_mission(mission):
+    """
+    :param dict mission: a parsed mission
+
+    :returns: a mission serialized into JSON
+    :rtype: :class:`str`
+    """
+    return json.dumps(mission, default=to_primitive, sort_keys=True)
+
+
+def parse_data_to_json(mission_parser, data, sections=None, exclude=None,
+                       encoding=MISSION_ENCODING):
+    """
+    Parse contents of a mission file and serialize result into JSON. Is run
+    by worker processes.
+    """
+    return dump_mission(parse_data(
+        mission_parser, data, sections, exclude, encoding,
+    ))
+
+
+def iter_results(mission_parser, paths, pattern, sections, exclude,
+                 executor):
+    """
+    Parse missions from files and archives.
+
+    :returns: an iterator over ``(path, member_name, mission)`` tuples, where
+              ``member_name`` is ``None`` for plain mission files and
+              ``mission`` is serialized into JSON
+    """
+    for path in paths:
+        if is_archive(path):
+            for name, mission in mission_parser.parse_archive(
+                path, pattern, sections, exclude, executor=executor,
+                func=parse_data_to_json,
+            ):
+                if executor is None:
+                    mission = dump_mission(mission)
+                yield path, name, mission
+        else:
+            mission = mission_parser.parse(path, sections, exclude)
+            yield path, None, dump_mission(mission)
+
+
+def build_arguments_parser():
+    parser = argparse.ArgumentParser(
+        prog='il2fb-mission-parser',
+        description=(
+            "Parse IL-2 FB missions from files or from zip and tar archives "
+            "and print results as JSON lines."
+        ),
+    )
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        metavar='PATH',
+        help="path to a mission file or to an archive with mission files",
+    )
+    parser.add_argument(
+        '-s', '--sections',
+        nargs='+',
+        metavar='SECTION',
+        help="shell-style patterns of names of sections to parse",
+    )
+    parser.add_argument(
+        '-e', '--exclude',
+        nargs='+',
+        metavar='SECTION',
+        help="shell-style patterns of names of sections to skip",
+    )
+    parser.add_argument(
+        '-p', '--pattern',
+        default=MISSION_FILE_PATTERN,
+        help=(
+            "shell-style pattern of names of archive members to parse "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=0,
+        help=(
+            "number of worker processes which parse archive members "
+            "(default: parse in current process)"
+        ),
+    )
+    return parser
+
+
+def main(args=None, stdout=None, stderr=None):
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    args = build_arguments_parser().parse_args(args)
+    mission_parser = MissionParser()
+    executor = None
+
+    if args.workers > 0:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+
+    try:
+        for path, member_name, mission in iter_results(
+            mission_parser, args.paths, args.pattern, args.sections,
+            args.exclude, executor,
+        ):
+            stdout.write(
+                '{{"member": {0}, "mission": {1}, "path": {2}}}\n'
+                .format(json.dumps(member_name), mission, json.dumps(path))
+            )
+    except (MissionParsingError, IOError) as e:
+        stderr.write("{0}\n".format(e))
+        return 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,3 +27,6 @@ COMMENT_MARKERS = (';', '#', '//', '--', )
 #: Multiplication coefficient which is used to convert speed of moving ground
 #: units into km/h.
 CHIEF_SPEED_COEFFICIENT = 3.6
+
+#: Encoding of mission files which is used when a mission is given as bytes.
+MISSION_ENCODING = 'cp1251'
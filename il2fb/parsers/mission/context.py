@@ -0,0 +1,662 @@
+# coding: utf-8
+
+import fnmatch
+import os
+import re
+import six
+import sys
+
+from il2fb.parsers.mission.exceptions import MissionParsingError
+
+from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.sections.born_place import BornPlaceAircraftsSectionParser
+from il2fb.parsers.mission.sections.born_place import BornPlaceAirForcesSectionParser
+from il2fb.parsers.mission.sections.born_place import BornPlaceSectionParser
+from il2fb.parsers.mission.sections.chiefs import ChiefRoadSectionParser
+from il2fb.parsers.mission.sections.chiefs import ChiefsSectionParser
+from il2fb.parsers.mission.sections.mds import MDSScoutsSectionParser
+from il2fb.parsers.mission.sections.wing import FlightRouteSectionParser
+from il2fb.parsers.mission.sections.wing import FlightSectionParser
+
+from il2fb.parsers.mission.sources import is_buffer
+
+from il2fb.parsers.mission.utils import get_section_name
+from il2fb.parsers.mission.utils import is_section_name
+from il2fb.parsers.mission.utils import move_if_present
+from il2fb.parsers.mission.utils import patterns_overlap
+from il2fb.parsers.mission.utils import set_if_present
+from il2fb.parsers.mission.utils import strip_comments
+
+
+class SectionsFilter(object):
+    """
+    Tells whether a section must be parsed.
+
+    Data of some sections is attached to data of their parent sections, e.g.
+    routes from ``N_Way`` sections are attached to flights listed in
+    ``Wing``. Such parent sections are parsed whenever their child sections
+    may be selected (see :meth:`accepts_parent`), unless parents are excluded
+    explicitly.
+
+    :param sections: shell-style patterns (e.g. ``*_Way``) of names of
+                     sections to parse. All sections are accepted if ``None``.
+    :param exclude: shell-style patterns of names of sections to skip
+    """
+
+    #: Maps names of parent sections to shell-style patterns of names of
+    #: their child sections. Children of ``Wing`` are sections of flights
+    #: (e.g. ``r0100``) and their routes.
+    child_sections = {
+        'Wing': ['*[0-9][0-9]', '*_Way', ],
+        'Chiefs': ['*_Chief_Road', ],
+        'BornPlace': ['BornPlace[0-9]*', 'BornPlaceCountries[0-9]*', ],
+    }
+
+    def __init__(self, sections=None, exclude=None):
+        if isinstance(sections, six.string_types):
+            sections = [sections, ]
+        self._include = self._compile(sections)
+        self._exclude = self._compile(exclude)
+        self._parents = frozenset(
+            parent
+            for parent, children in self.child_sections.items()
+            if (
+                sections is not None and
+                not self._exclude_matches(parent) and
+                any(
+                    patterns_overlap(pattern, child)
+                    for pattern in sections
+                    for child in children
+                )
+            )
+        )
+
+    @staticmethod
+    def _compile(patterns):
+        if patterns is None:
+            return None
+        if isinstance(patterns, six.string_types):
+            patterns = [patterns, ]
+        return re.compile('|'.join(
+            "(?:{0})".format(fnmatch.translate(pattern))
+            for pattern in patterns
+        ) or '(?!)')
+
+    def accepts(self, section_name):
+        """
+        :param str section_name: a name of section
+
+        :returns: `True` if a section with a given name must be parsed
+        :rtype: :class:`bool`
+        """
+        if self._include is not None and not self._include.match(section_name):
+            return False
+        return not self._exclude_matches(section_name)
+
+    def accepts_parent(self, section_name):
+        """
+        :param str section_name: a name of section
+
+        :returns: `True` if a section is not selected itself, but it is a
+                  parent of sections which may be selected
+        :rtype: :class:`bool`
+        """
+        return section_name in self._parents
+
+    def accepts_flight(self, section_name):
+        """
+        Sections of flights listed in ``Wing`` are selected together with
+        ``Wing`` or with their routes, or they can be selected by their own
+        names.
+
+        :param str section_name: a name of flight section (e.g. ``r0100``)
+
+        :returns: `True` if a flight section must be parsed
+        :rtype: :class:`bool`
+        """
+        if self._exclude_matches(section_name):
+            return False
+        return (
+            self._include is None or
+            bool(self._include.match(section_name)) or
+            bool(self._include.match(
+                section_name + FlightRouteSectionParser.input_suffix
+            )) or
+            self.accepts(FlightSectionParser.input_name)
+        )
+
+    def _exclude_matches(self, section_name):
+        return (
+            self._exclude is not None and
+            self._exclude.match(section_name) is not None
+        )
+
+
+class ParsingContext(object):
+    """
+    Keeps state of a single run of
+    :class:`~il2fb.parsers.mission.MissionParser`.
+
+    Each section is processed by a fresh copy of a section parser (see
+    :meth:`~il2fb.parsers.mission.sections.base.SectionParser.clone`), so
+    nothing is written into parsers stored by the mission parser. This allows
+    a single mission parser to be used by many threads at once.
+
+    Sections can be filtered by names (see :class:`SectionsFilter`). Sections
+    which describe flights listed in ``Wing`` section are parsed only if
+    ``Wing`` itself is parsed. Lines of skipped sections are only checked for
+    being a section header.
+
+    Parent sections which are parsed only because their child sections may be
+    selected (e.g. ``Chiefs`` for ``0_Chief_Road``) are listed in
+    :attr:`implicit_sections`. Only those of their objects which have data of
+    selected child sections are put into a mission.
+
+    If ``retain`` is ``False``, data of finished sections is not kept, so the
+    context cannot combine it into a whole mission. This is useful if data is
+    consumed section-by-section (see :meth:`iter_sections`).
+
+    If ``visitor`` is given, it is passed to section parsers, which send
+    collected objects to it instead of keeping them (see
+    :class:`~il2fb.parsers.mission.visitors.MissionVisitor`).
+
+    If ``raw`` is ``True``, section parsers which support it collect raw
+    structures, which convert their fields on first access (see
+    :mod:`il2fb.parsers.mission.raw`).
+
+    Repeated strings (e.g. codes of objects) are interned by a table which is
+    created for each context. Pass a dictionary as ``strings`` to share a
+    table between contexts.
+
+    Parsers which accept iterables of lines (see
+    :meth:`~il2fb.parsers.mission.sections.base.CollectingParser.parse_lines`)
+    receive all lines of a section up to the next header at once, as an
+    iterator over the source of lines.
+    """
+
+    def __init__(self, mission_parser, sections=None, exclude=None,
+                 retain=True, visitor=None, raw=False, strings=None):
+        self.registry = mission_parser.registry
+        self.flight_info_parser = mission_parser.flight_info_parser
+        self.sections_filter = SectionsFilter(sections, exclude)
+        self.retain = retain
+        self.visitor = visitor
+        self.raw = raw
+        self.strings = {} if strings is None else strings
+        self.current_parser = None
+        self.section_name = None
+        self.takes_lines = False
+        self.line_number = None
+        self.line = None
+        self.next_section_name = None
+        self.has_flights = False
+        self.implicit_sections = set()
+        self.is_complete = False
+        self.data = {}
+
+    def process_lines(self, lines, start=0, encoding=None):
+        """
+        Process a sequence of lines of a mission.
+
+        :param lines: an iterable of strings or bytes
+        :param int start: number of the first line in the sequence
+        :param str encoding: encoding of lines given as bytes
+
+        :returns: ``None``
+        """
+        for event in self.iter_sections(lines, start, encoding):
+            pass
+
+    def iter_sections(self, lines, start=0, encoding=None):
+        """
+        Process a sequence of lines of a mission and yield data of sections
+        as soon as they are finished. The last section in the sequence is not
+        finished, as it may continue in lines given later.
+
+        If ``encoding`` is given, lines are expected to be bytes. Lines of
+        skipped sections are not decoded at all.
+
+        A whole mission can be given as a buffer (see
+        :func:`~il2fb.parsers.mission.sources.is_buffer`), e.g. as a
+        memory-mapped file. Such buffers are not split into lines: lines of
+        skipped sections are jumped over by searching for the next header.
+
+        :param lines: an iterable of strings or bytes or a buffer
+        :param int start: number of the first line in the sequence
+        :param str encoding: encoding of lines given as bytes
+
+        :returns: an iterator over ``(section_name, data)`` pairs
+        """
+        if encoding is not None and is_buffer(lines):
+            numbered_lines = self._iter_buffer_lines(lines, start)
+        else:
+            numbered_lines = enumerate(lines, start)
+        return self._iter_numbered_lines_sections(numbered_lines, encoding)
+
+    def _iter_numbered_lines_sections(self, numbered_lines, encoding):
+        marker = '[' if encoding is None else b'['
+
+        while not self.is_complete:
+            if self.takes_lines:
+                section_name = self._parse_section_lines(
+                    numbered_lines, encoding,
+                )
+                if section_name is None:
+                    # Lines are over, but the section may continue in lines
+                    # given later.
+                    return
+                event = self.start_section(section_name)
+                if event is not None:
+                    yield event
+                continue
+
+            for i, line in numbered_lines:
+                if self.current_parser is None and marker not in line:
+                    continue
+                if encoding is not None:
+                    line = line.decode(encoding)
+                event = self.process_line(i, line)
+                if event is not None:
+                    yield event
+                if self.is_complete or self.takes_lines:
+                    break
+            else:
+                return
+
+    def _parse_section_lines(self, numbered_lines, encoding):
+        """
+        Pass lines of current section to its parser at once.
+
+        :returns: a name of the next section or ``None`` if lines are over
+        """
+        self.line_number = None
+        self.next_section_name = None
+        lines = self._iter_section_lines(numbered_lines, encoding)
+
+        try:
+            self.current_parser.parse_lines(lines)
+        except Exception:
+            if self.line_number is None:
+                self._raise_section_error("parsing")
+            self._raise_line_error(self.line_number, self.line)
+
+        # Skip lines which were not taken by parser
+        for line in lines:
+            pass
+
+        return self.next_section_name
+
+    def _iter_section_lines(self, numbered_lines, encoding):
+        for i, line in numbered_lines:
+            if encoding is not None:
+                line = line.decode(encoding)
+            line = strip_comments(line)
+            if is_section_name(line):
+                self.next_section_name = get_section_name(line)
+                return
+            # Remember the line taken by parser to report errors
+            self.line_number = i
+            self.line = line
+            yield line
+
+    def _iter_buffer_lines(self, buffer, start):
+        find, rfind = buffer.find, buffer.rfind
+        size = len(buffer)
+        position = 0
+        i = start
+
+        while position < size:
+            if self.current_parser is None:
+                header_position = find(b'[', position)
+                if header_position < 0:
+                    break
+                line_position = rfind(b'\n', position, header_position) + 1
+                if line_position > position:
+                    i += buffer[position:line_position].count(b'\n')
+                    position = line_position
+
+            end = find(b'\n', position)
+            if end < 0:
+                end = size
+
+            yield i, buffer[position:end]
+            position = end + 1
+            i += 1
+
+    def iter_indexed_sections(self, source, index, encoding):
+        """
+        Process only those sections of a mission which are going to be parsed
+        and yield their data as soon as they are finished. Other sections are
+        not read at all.
+
+        :param source: a buffer (see
+                       :func:`~il2fb.parsers.mission.sources.is_buffer`) or a
+                       seekable binary file object
+        :param index: an instance of
+                      :class:`~il2fb.parsers.mission.index.SectionIndex` built
+                      for the same mission
+        :param str encoding: encoding of a mission
+
+        :returns: an iterator over ``(section_name, data)`` pairs
+        """
+        if is_buffer(source):
+            size = len(source)
+            read = lambda offset, length: source[offset:offset + length]
+        else:
+            source.seek(0, os.SEEK_END)
+            size = source.tell()
+
+            def read(offset, length):
+                source.seek(offset)
+                return source.read(length)
+
+        if size != index.size:
+            raise ValueError(
+                "index does not match mission: expected {0} bytes, got {1}"
+                .format(index.size, size))
+
+        for entry in index.entries:
+            event = self.start_section(entry.name)
+            if event is not None:
+                yield event
+            if self.is_complete:
+                break
+            if self.current_parser is None:
+                continue
+
+            data = read(entry.offset, entry.length)
+            body = data[data.find(b'\n') + 1:] if b'\n' in data else b''
+
+            for event in self.iter_sections(
+                body, entry.line_number + 1, encoding,
+            ):
+                yield event
+
+    def process_line(self, line_number, line):
+        """
+        Process a single line of a mission.
+
+        :param int line_number: number of the line
+        :param str line: a line to process
+
+        :returns: ``(section_name, data)`` of a section finished by this line
+                  or ``None``
+        """
+        if self.current_parser is None and '[' not in line:
+            return None
+
+        line = strip_comments(line)
+
+        if is_section_name(line):
+            return self.start_section(get_section_name(line))
+
+        if self.current_parser:
+            self._try_to_parse_line(line_number, line)
+
+        return None
+
+    def start_section(self, section_name):
+        """
+        Finalize current section and select a parser for the next one.
+
+        :param str section_name: a name of the next section
+
+        :returns: ``(section_name, data)`` of the finished section or ``None``
+        """
+        event = self.finish_section()
+        self._use_parser(self._get_parser(section_name), section_name)
+        return event
+
+    def finish_section(self):
+        """
+        Finalize current section and store its data.
+
+        :returns: ``(section_name, data)`` of the finished section or ``None``
+        """
+        if not self.current_parser:
+            return None
+
+        try:
+            data = self.current_parser.stop()
+        except Exception:
+            self._raise_section_error("finalization")
+        else:
+            if 'flights' in data:
+                self.has_flights = True
+            if self.retain:
+                self.data.update(data)
+            return self.section_name, data
+        finally:
+            self.current_parser = None
+            self.takes_lines = False
+
+    def finish(self):
+        """
+        Finalize current section and combine data of all sections.
+
+        :returns: parsed mission
+        :rtype: :class:`dict`
+        """
+        self.finish_section()
+        return self.clean()
+
+    def _get_parser(self, section_name):
+        parser = self.registry.get(section_name)
+
+        if parser is not None:
+            if not self.sections_filter.accepts(section_name):
+                if not self.sections_filter.accepts_parent(section_name):
+                    return None
+                self.implicit_sections.add(section_name)
+        elif (
+            self.has_flights and
+            self.sections_filter.accepts_flight(section_name)
+        ):
+            parser = self.flight_info_parser
+
+        if parser is not None:
+            parser = parser.clone()
+            parser.visitor = self.visitor
+            parser.raw = self.raw
+            parser.shared_strings = self.strings
+            if parser.start(section_name):
+                return parser
+
+        return None
+
+    def _use_parser(self, parser, section_name):
+        self.current_parser = parser
+        self.section_name = section_name
+        self.takes_lines = hasattr(parser, 'parse_lines')
+
+    def _try_to_parse_line(self, line_number, line):
+        parser = self.current_parser
+        try:
+            if parser.tokenized:
+                parser.parse_tokens(line.split())
+            else:
+                parser.parse_line(line)
+        except Exception:
+            self._raise_line_error(line_number, line)
+
+    def _raise_section_error(self, stage):
+        error_type, original_msg, traceback = sys.exc_info()
+        msg = (
+            "{0} during {1} of \"{2}\": {3}"
+            .format(error_type.__name__, stage,
+                    self.current_parser.__class__.__name__, original_msg))
+        self._raise_error(msg, traceback)
+
+    def _raise_line_error(self, line_number, line):
+        error_type, original_msg, traceback = sys.exc_info()
+        msg = (
+            "{0} in line #{1} (\"{2}\"): {3}"
+            .format(error_type.__name__, line_number, line, original_msg))
+        self._raise_error(msg, traceback)
+
+    @staticmethod
+    def _raise_error(message, traceback):
+        error = MissionParsingError(message)
+        six.reraise(MissionParsingError, error, traceback)
+
+    def clean(self):
+        result = {}
+
+        move_if_present(result, self.data, 'location_loader')
+        move_if_present(result, self.data, 'player')
+        move_if_present(result, self.data, 'targets')
+
+        set_if_present(result, 'conditions', self._get_conditions())
+        set_if_present(result, 'objects', self._get_objects())
+
+        return result
+
+    def _get_conditions(self):
+        result = {}
+
+        set_if_present(result, 'time_info', self._get_time_info())
+        set_if_present(result, 'meteorology', self._get_meteorology())
+        set_if_present(result, 'scouting', self._get_scouting())
+
+        move_if_present(result, self.data, 'respawn_time')
+
+        if 'conditions' in self.data:
+            conditions = self.data['conditions']
+
+            move_if_present(result, conditions, 'radar')
+            move_if_present(result, conditions, 'communication')
+            move_if_present(result, conditions, 'home_bases')
+            move_if_present(result, conditions, 'crater_visibility_muptipliers')
+
+        return result
+
+    def _get_time_info(self):
+        result = {}
+
+        move_if_present(result, self.data, 'date')
+        if 'time' in self.data:
+            result.update({
+                'time': self.data['time']['value'],
+                'is_fixed': self.data['time']['is_fixed'],
+            })
+
+        return result
+
+    def _get_meteorology(self):
+        result = {}
+
+        move_if_present(result, self.data, 'weather', 'weather_conditions')
+        move_if_present(result, self.data, 'cloud_base')
+
+        if 'weather' in self.data:
+            result.update(self.data.pop('weather'))
+
+        return result
+
+    def _get_scouting(self):
+        try:
+            result = self.data['conditions'].pop('scouting')
+        except KeyError:
+            result = {}
+
+        scouts = [
+            self.data[key]
+            for key in sorted(self.data.keys())
+            if key.startswith(MDSScoutsSectionParser.output_prefix)
+        ]
+        if scouts:
+            result['scouts'] = scouts
+
+        return result
+
+    def _get_objects(self):
+        result = {}
+
+        set_if_present(result, 'moving_units', self._get_moving_units())
+        set_if_present(result, 'flights', self._get_flights())
+        set_if_present(result, 'home_bases', self._get_home_bases())
+
+        move_if_present(result, self.data, 'stationary')
+        move_if_present(result, self.data, 'buildings')
+        move_if_present(result, self.data, 'cameras')
+        move_if_present(result, self.data, 'markers')
+        move_if_present(result, self.data, 'rockets')
+
+        return result
+
+    def _get_moving_units(self):
+        units = self.data.pop('moving_units', [])
+        is_implicit = ChiefsSectionParser.input_name in self.implicit_sections
+        result = []
+
+        for unit in units:
+            key = "{0}{1}".format(ChiefRoadSectionParser.output_prefix, unit.id)
+            if is_implicit and key not in self.data:
+                continue
+            unit.route = self.data.pop(key, [])
+            result.append(unit)
+
+        return result
+
+    def _get_flights(self):
+        keys = self.data.pop('flights', [])
+        flights = [self.data.pop(key) for key in keys if key in self.data]
+        for flight in flights:
+            key = "{0}{1}".format(FlightRouteSectionParser.output_prefix, flight.id)
+            flight.route = self.data.pop(key, [])
+        return flights
+
+    def _get_home_bases(self):
+        home_bases = self.data.pop('home_bases', [])
+        is_implicit = BornPlaceSectionParser.input_name in self.implicit_sections
+        result = []
+
+        for i, home_base in enumerate(home_bases):
+            aircrafts_key = "{0}{1}".format(BornPlaceAircraftsSectionParser.output_prefix, i)
+            air_forces_key = "{0}{1}".format(BornPlaceAirForcesSectionParser.output_prefix, i)
+            if (
+                is_implicit and
+                aircrafts_key not in self.data and
+                air_forces_key not in self.data
+            ):
+                continue
+
+            home_base.spawning.aircraft_limitations.allowed_aircrafts = self.data.pop(aircrafts_key, [])
+            home_base.spawning.allowed_air_forces = self.data.pop(air_forces_key, [])
+            result.append(home_base)
+
+        return result
+
+
+class ProbingContext(ParsingContext):
+    """
+    Parses only sections from the head of a mission, e.g. ``MAIN``, ``SEASON``
+    and ``WEATHER``.
+
+    Parsing is completed as soon as all of the requested sections are parsed
+    or a section which is not requested and whose parser collects objects is
+    met (e.g. ``Wing`` or ``NStationary``). Unknown sections are skipped.
+    """
+
+    def __init__(self, mission_parser, sections):
+        if isinstance(sections, six.string_types):
+            sections = [sections, ]
+        super(ProbingContext, self).__init__(mission_parser, sections=sections)
+        self.requested_sections = frozenset(sections)
+        self.pending_sections = set(sections)
+
+    def start_section(self, section_name):
+        event = self.finish_section()
+
+        if (
+            not self.pending_sections or (
+                section_name not in self.requested_sections and
+                isinstance(self.registry.get(section_name), CollectingParser)
+            )
+        ):
+            self.is_complete = True
+            return event
+
+        self.pending_sections.discard(section_name)
+        self._use_parser(self._get_parser(section_name), section_name)
+        return event
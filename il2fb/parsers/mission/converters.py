@@ -9,6 +9,25 @@ from il2fb.commons.organization import AirForces, Belligerents
 from il2fb.parsers.mission.constants import NULL, CHIEF_SPEED_COEFFICIENT
 
 
+#: Values of tokens which are met in missions mapped to results of
+#: conversion. Converters fall back to a full conversion if a token is not
+#: in a table, so unknown values fail exactly as before.
+_BOOLS = {'0': False, '1': True, }
+_BELLIGERENTS = {
+    str(constant.value): constant for constant in Belligerents.iterconstants()
+}
+_SKILLS = {
+    str(constant.value): constant for constant in Skills.iterconstants()
+}
+_UNIT_TYPES = {
+    constant.value: constant for constant in UnitTypes.iterconstants()
+}
+_AIR_FORCES = {
+    constant.value: constant for constant in AirForces.iterconstants()
+}
+_AIR_FORCES.update({NULL: AirForces.vvs_rkka, '': None, })
+
+
 def to_bool(value):
     """
     Converts a string representation of a number into boolean.
@@ -29,26 +48,41 @@ def to_bool(value):
        >>> to_bool('-1')
        True
     """
-    return int(value) != 0
+    try:
+        return _BOOLS[value]
+    except KeyError:
+        return int(value) != 0
 
 
 def to_belligerent(value):
-    return Belligerents.get_by_value(int(value))
+    try:
+        return _BELLIGERENTS[value]
+    except KeyError:
+        return Belligerents.get_by_value(int(value))
 
 
 def to_skill(value):
-    return Skills.get_by_value(int(value))
+    try:
+        return _SKILLS[value]
+    except KeyError:
+        return Skills.get_by_value(int(value))
 
 
 def to_unit_type(value):
-    return UnitTypes.get_by_value(value.lower())
+    try:
+        return _UNIT_TYPES[value]
+    except KeyError:
+        # Remember spellings met in missions, e.g. 'Armor'
+        result = _UNIT_TYPES[value] = UnitTypes.get_by_value(value.lower())
+        return result
 
 
 def to_air_force(value):
-    if value == NULL:
-        return AirForces.vvs_rkka
-    elif value:
-        return AirForces.get_by_value(value)
+    try:
+        return _AIR_FORCES[value]
+    except KeyError:
+        if value:
+            return AirForces.get_by_value(value)
 
 
 def to_time(value):
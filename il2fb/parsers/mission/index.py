@@ -0,0 +1,156 @@
+# coding: utf-8
+"""
+Index of sections of a mission file which allows to read only needed
+sections.
+"""
+
+import collections
+
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+from il2fb.parsers.mission.sources import is_buffer
+from il2fb.parsers.mission.sources import open_binary
+from il2fb.parsers.mission.utils import get_section_name
+from il2fb.parsers.mission.utils import is_section_name
+from il2fb.parsers.mission.utils import strip_comments
+
+
+#: Location of a single section in a mission file. ``offset`` is a position
+#: of the first byte of section's header, ``length`` is a number of bytes in
+#: section including its header, ``line_number`` is a number of header's
+#: line and ``line_count`` is a number of lines in section including header.
+SectionIndexEntry = collections.namedtuple(
+    'SectionIndexEntry',
+    ['name', 'offset', 'length', 'line_number', 'line_count', ],
+)
+
+
+class SectionIndex(object):
+    """
+    Locations of sections in a mission file.
+
+    Index can be converted into primitive types (see :meth:`to_primitive`),
+    e.g. to be stored as JSON next to a mission file, and restored later
+    (see :meth:`from_primitive`).
+
+    **Example**:
+
+    .. code-block:: python
+
+       index = SectionIndex.build("path/to/mission.mis")
+       parser.parse("path/to/mission.mis", sections=['r0100_Way'], index=index)
+
+    Here only ``Wing``, ``r0100`` and ``r0100_Way`` sections are read: parent
+    sections of selected sections are parsed as well (see
+    :class:`~il2fb.parsers.mission.context.SectionsFilter`).
+
+    :param int size: size of indexed mission in bytes
+    :param entries: a list of :class:`SectionIndexEntry`
+    """
+
+    def __init__(self, size, entries):
+        self.size = size
+        self.entries = entries
+
+    @classmethod
+    def build(cls, mission, encoding=MISSION_ENCODING):
+        """
+        Scan a mission for section headers.
+
+        :param mission: a path to a mission file, contents of a mission given
+                        as bytes or a seekable binary file object
+        :param str encoding: encoding of a mission
+
+        :returns: index of sections
+        :rtype: :class:`SectionIndex`
+        """
+        with open_binary(mission, use_mmap=True) as source:
+            if not is_buffer(source):
+                source.seek(0)
+                source = source.read()
+            return cls._scan(source, encoding)
+
+    @classmethod
+    def _scan(cls, buffer, encoding):
+        find, rfind = buffer.find, buffer.rfind
+        size = len(buffer)
+        headers = []
+        position = 0
+        counted_position = 0
+        line_number = 0
+
+        while True:
+            bracket_position = find(b'[', position)
+            if bracket_position < 0:
+                break
+
+            line_start = rfind(b'\n', 0, bracket_position) + 1
+            line_end = find(b'\n', bracket_position)
+            if line_end < 0:
+                line_end = size
+
+            line_number += buffer[counted_position:line_start].count(b'\n')
+            counted_position = line_start
+            position = line_end + 1
+
+            line = strip_comments(buffer[line_start:line_end].decode(encoding))
+            if is_section_name(line):
+                headers.append((get_section_name(line), line_start, line_number))
+
+        total_lines = line_number + buffer[counted_position:size].count(b'\n')
+        if size and buffer[size - 1:size] != b'\n':
+            total_lines += 1
+
+        entries = []
+
+        for i, (name, offset, line_number) in enumerate(headers):
+            if i + 1 < len(headers):
+                next_offset, next_line_number = headers[i + 1][1:]
+            else:
+                next_offset, next_line_number = size, total_lines
+
+            entries.append(SectionIndexEntry(
+                name=name,
+                offset=offset,
+                length=next_offset - offset,
+                line_number=line_number,
+                line_count=next_line_number - line_number,
+            ))
+
+        return cls(size, entries)
+
+    def to_primitive(self):
+        """
+        :returns: index as a structure of primitive types which can be
+                  serialized into JSON
+        :rtype: :class:`dict`
+        """
+        return {
+            'size': self.size,
+            'sections': [list(entry) for entry in self.entries],
+        }
+
+    @classmethod
+    def from_primitive(cls, data):
+        """
+        :param dict data: a result of :meth:`to_primitive`
+
+        :returns: restored index
+        :rtype: :class:`SectionIndex`
+        """
+        return cls(
+            size=data['size'],
+            entries=[SectionIndexEntry(*entry) for entry in data['sections']],
+        )
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, SectionIndex) and
+            self.size == other.size and
+            self.entries == other.entries
+        )
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return "<SectionIndex of {0} sections>".format(len(self.entries))
@@ -0,0 +1,204 @@
+# coding: utf-8
+"""
+Lazy results of parsing which run section parsers only when their data is
+accessed.
+"""
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2.7 pragma: no cover
+    from collections import Mapping
+
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+from il2fb.parsers.mission.context import SectionsFilter
+from il2fb.parsers.mission.index import SectionIndex
+
+
+#: Marks values which are absent in a parsed mission.
+MISSING = object()
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only mapping which computes its values on first access and caches
+    them.
+
+    Values can be accessed as items (``mapping['key']``) or as attributes
+    (``mapping.key``).
+
+    :param loaders: a list of ``(key, loader)`` pairs, where ``loader`` is a
+                    callable without arguments which returns a value for the
+                    key or :data:`MISSING` if there is no value
+    """
+
+    def __init__(self, loaders):
+        self._loaders = dict(loaders)
+        self._keys = [key for key, loader in loaders]
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            value = self._values[key]
+        except KeyError:
+            value = self._values[key] = self._loaders[key]()
+
+        if value is MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __iter__(self):
+        for key in self._keys:
+            if key in self:
+                yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __repr__(self):
+        return "<{0} {1}>".format(self.__class__.__name__, self._keys)
+
+    def is_loaded(self, key):
+        """
+        :param str key: a key of value
+
+        :returns: `True` if value for a given key is already computed
+        :rtype: :class:`bool`
+        """
+        return key in self._values
+
+    def to_dict(self):
+        """
+        Compute all values.
+
+        :returns: a plain dictionary with the same contents
+        :rtype: :class:`dict`
+        """
+        return {
+            key: (value.to_dict() if isinstance(value, LazyMapping) else value)
+            for key, value in self.items()
+        }
+
+
+class LazyMission(LazyMapping):
+    """
+    A mission which is parsed section-by-section on demand.
+
+    Has same keys as a result of
+    :meth:`~il2fb.parsers.mission.MissionParser.parse`. Sections which are
+    needed for a key are parsed on the first access to this key. Items of
+    ``objects`` (e.g. ``objects.flights``) are parsed separately from each
+    other. ``objects`` is present if a mission has any section which
+    describes objects. Sections are found by
+    :class:`~il2fb.parsers.mission.index.SectionIndex`, so unrelated sections
+    are not read at all.
+
+    Data of sections which are processed by custom section parsers is not
+    accessible via lazy mission.
+
+    **Example**:
+
+    .. code-block:: python
+
+       mission = parser.parse_lazy("path/to/mission.mis")
+       mission['conditions']['time_info']  # only MAIN, SEASON, etc. are parsed
+       mission.objects.flights             # only Wing and flights are parsed
+
+    :param mission_parser: an instance of
+                           :class:`~il2fb.parsers.mission.MissionParser`
+    :param mission: a path to a mission file, contents of a mission given as
+                    bytes or a seekable binary file object
+    :param index: an instance of
+                  :class:`~il2fb.parsers.mission.index.SectionIndex`. It is
+                  built if ``None``.
+    :param str encoding: encoding of a mission
+    :param bool use_mmap: tells whether to map a file given by path into
+                          memory
+    """
+    #: Patterns of names of sections which are needed for top-level keys.
+    keys_sections = [
+        ('location_loader', ['MAIN', ]),
+        ('player', ['MAIN', ]),
+        ('targets', ['Target', ]),
+        ('conditions', [
+            'MAIN', 'SEASON', 'WEATHER', 'RespawnTime', 'MDS', 'MDS_Scouts_*',
+        ]),
+    ]
+
+    #: Patterns of names of sections which are needed for items of
+    #: ``objects``.
+    objects_keys_sections = [
+        ('moving_units', ['Chiefs', '*_Chief_Road', ]),
+        ('flights', ['Wing', '*_Way', ]),
+        ('home_bases', ['BornPlace*', ]),
+        ('stationary', ['NStationary', ]),
+        ('buildings', ['Buildings', ]),
+        ('cameras', ['StaticCamera', ]),
+        ('markers', ['FrontMarker', ]),
+        ('rockets', ['Rocket', ]),
+    ]
+
+    def __init__(self, mission_parser, mission, index=None,
+                 encoding=MISSION_ENCODING, use_mmap=False):
+        self._parser = mission_parser
+        self._mission = mission
+        self._index = index or SectionIndex.build(mission, encoding)
+        self._encoding = encoding
+        self._use_mmap = use_mmap
+
+        loaders = [
+            (key, self._make_loader(patterns, [key, ]))
+            for key, patterns in self.keys_sections
+        ]
+        loaders.append(('objects', self._load_objects))
+
+        super(LazyMission, self).__init__(loaders)
+
+    def _make_loader(self, patterns, path):
+        return lambda: self._load(patterns, path)
+
+    def _has_sections(self, patterns):
+        sections_filter = SectionsFilter(patterns)
+        return any(
+            sections_filter.accepts(entry.name)
+            for entry in self._index.entries
+        )
+
+    def _load(self, patterns, path):
+        if not self._has_sections(patterns):
+            return MISSING
+
+        result = self._parser.parse(
+            self._mission,
+            sections=patterns,
+            encoding=self._encoding,
+            use_mmap=self._use_mmap,
+            index=self._index,
+        )
+
+        for key in path:
+            if key not in result:
+                return MISSING
+            result = result[key]
+
+        return result
+
+    def _load_objects(self):
+        if not any(
+            self._has_sections(patterns)
+            for key, patterns in self.objects_keys_sections
+        ):
+            return MISSING
+
+        return LazyMapping([
+            (key, self._make_loader(patterns, ['objects', key, ]))
+            for key, patterns in self.objects_keys_sections
+        ])
@@ -0,0 +1,171 @@
+# coding: utf-8
+"""
+Structures which keep raw tokens of lines and convert their fields only on
+first access.
+
+Raw structures are subclasses of usual structures (e.g.
+:class:`~il2fb.parsers.mission.sections.buildings.Building`), their fields
+have the same values and they are equal to usual structures with the same
+values. Values of fields are cached after conversion.
+
+As conversion of fields is deferred, errors in values of fields are raised
+on access to these fields rather than during parsing.
+"""
+
+
+class RawField(object):
+    """
+    Descriptor of a field which is converted from raw tokens on first access.
+
+    :param slot: a descriptor of slot which stores converted value
+    :param getter: a callable which receives raw tokens and returns a value of
+                   the field
+    """
+    __slots__ = ['slot', 'getter', ]
+
+    def __init__(self, slot, getter):
+        self.slot = slot
+        self.getter = getter
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.getter(instance._tokens)
+            self.slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+class RawFieldsGroupMember(RawField):
+    """
+    Descriptor of a field which is converted from raw tokens together with
+    other fields of its group: the getter is called once per structure and
+    values of all fields of the group are cached.
+
+    :param slot: a descriptor of slot which stores converted value
+    :param getter: a callable which receives raw tokens and returns a
+                   dictionary with values of all fields of the group
+    :param name: a name of the field
+    :param group: maps names of fields of the group to descriptors of their
+                  slots
+    """
+    __slots__ = ['name', 'group', ]
+
+    def __init__(self, slot, getter, name, group):
+        super(RawFieldsGroupMember, self).__init__(slot, getter)
+        self.name = name
+        self.group = group
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+
+        values = self.getter(instance._tokens)
+        for name, slot in self.group.items():
+            try:
+                slot.__get__(instance, owner)
+            except AttributeError:
+                slot.__set__(instance, values[name])
+        return self.slot.__get__(instance, owner)
+
+
+class RawStructure(object):
+    """
+    Base mixin of raw structures created by :func:`make_raw_class`.
+
+    :param tokens: raw tokens of a line
+    :param values: values of fields which do not have getters
+    """
+    __slots__ = []
+
+    #: A class of usual structures.
+    structure_class = None
+
+    #: Names of fields of structures.
+    fields = []
+
+    def __init__(self, tokens, **values):
+        self._tokens = tokens
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    @property
+    def raw_tokens(self):
+        """
+        :returns: raw tokens of a line
+        :rtype: :class:`tuple`
+        """
+        return self._tokens
+
+    def __eq__(self, other):
+        if not isinstance(other, self.structure_class):
+            return NotImplemented
+
+        if other.__class__ not in (self.__class__, self.structure_class):
+            return False
+
+        return all([
+            getattr(self, x) == getattr(other, x)
+            for x in self.fields
+        ])
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(tuple(
+            getattr(self, x) for x in self.fields
+        ))
+
+    def to_primitive(self, context=None):
+        return {
+            key: self._to_primitive(getattr(self, key), context)
+            for key in self.fields
+        }
+
+
+def make_raw_class(structure_class, getters, group_getters=None):
+    """
+    Create a raw version of a structure class.
+
+    :param structure_class: a subclass of
+                            :class:`il2fb.commons.structures.BaseStructure`
+    :param dict getters: maps names of fields to callables which receive raw
+                         tokens and return values of fields. Values of other
+                         fields must be passed to constructor of raw class.
+    :param list group_getters: pairs of lists of names of fields and callables
+                               which receive raw tokens and return
+                               dictionaries with values of these fields (see
+                               :class:`RawFieldsGroupMember`)
+
+    :returns: a subclass of ``structure_class`` and :class:`RawStructure`
+    """
+    attributes = {
+        '__slots__': ['_tokens', ],
+        '__module__': structure_class.__module__,
+        'structure_class': structure_class,
+        'fields': list(structure_class.__slots__),
+    }
+
+    for name, getter in getters.items():
+        attributes[name] = RawField(getattr(structure_class, name), getter)
+
+    for names, getter in group_getters or []:
+        group = {name: getattr(structure_class, name) for name in names}
+        for name, slot in group.items():
+            attributes[name] = RawFieldsGroupMember(slot, getter, name, group)
+
+    return type(
+        "Raw{0}".format(structure_class.__name__),
+        (RawStructure, structure_class, ),
+        attributes,
+    )
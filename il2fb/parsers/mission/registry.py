@@ -0,0 +1,117 @@
+# coding: utf-8
+
+
+class SectionParsersRegistry(object):
+    """
+    Selects a parser for a section of mission file by the name of section.
+
+    Parsers which define
+    :attr:`~il2fb.parsers.mission.sections.base.SectionParser.input_name` are
+    found by a single dictionary lookup. Parsers which define
+    :attr:`~il2fb.parsers.mission.sections.base.SectionParser.input_pattern`
+    are preselected by their compiled regular expressions and confirmed by
+    :meth:`~il2fb.parsers.mission.sections.base.SectionParser.check_section_name`.
+    Other parsers are probed one-by-one before them, so a parser without
+    name and pattern can override any parser which was registered earlier.
+
+    Results of lookups, including misses, are cached, so each distinct name
+    of section is resolved only once.
+
+    **Example**:
+
+    .. code-block:: python
+
+       registry = SectionParsersRegistry([MainSectionParser(), ])
+       registry.register(MyCustomSectionParser())
+       parser = registry.get('MAIN')
+
+    """
+    #: Max number of cached lookup results.
+    cache_size = 10000
+
+    def __init__(self, parsers=None):
+        self._by_name = {}
+        self._by_pattern = []
+        self._others = []
+        self._parsers = []
+        self._cache = {}
+
+        for parser in (parsers or []):
+            self.register(parser)
+
+    def register(self, parser):
+        """
+        Add a section parser to the registry.
+
+        Parsers registered later take precedence over parsers registered
+        earlier. Parsers without name and pattern are checked first, then
+        exact names of sections and then patterns.
+
+        :param parser: an instance of
+                       :class:`~il2fb.parsers.mission.sections.base.SectionParser`
+
+        :returns: ``None``
+        """
+        if parser.input_name is not None:
+            self._by_name[parser.input_name] = parser
+        elif parser.input_pattern is not None:
+            self._by_pattern.insert(0, (parser.input_pattern, parser))
+        else:
+            self._others.insert(0, parser)
+
+        self._parsers.append(parser)
+        self._cache.clear()
+
+    @property
+    def parsers(self):
+        """
+        Registered parsers in order of registration.
+
+        :rtype: :class:`tuple`
+        """
+        return tuple(self._parsers)
+
+    def get(self, section_name):
+        """
+        Get a parser which can process a section with a given name.
+
+        :param str section_name: a name of section which is going to be parsed
+
+        :returns: a parser which can process the section or ``None`` if there
+                  is no such parser
+        """
+        if not self._others:
+            parser = self._by_name.get(section_name)
+            if parser is not None:
+                return parser
+
+        try:
+            return self._cache[section_name]
+        except KeyError:
+            pass
+
+        parser = self._lookup(section_name)
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+
+        self._cache[section_name] = parser
+        return parser
+
+    def _lookup(self, section_name):
+        for parser in self._others:
+            if parser.check_section_name(section_name):
+                return parser
+
+        parser = self._by_name.get(section_name)
+        if parser is not None:
+            return parser
+
+        for pattern, parser in self._by_pattern:
+            if (
+                pattern.match(section_name) and
+                parser.check_section_name(section_name)
+            ):
+                return parser
+
+        return None
@@ -0,0 +1,429 @@
+# coding: utf-8
+"""
+Declarative description of sections whose lines describe single objects.
+
+A schema lists fields of a line in order of their appearance. Each schema is
+compiled into a specialised Python function which converts tokens of a line
+into an object without intermediate dictionaries and ``**kwargs``.
+
+**Example**:
+
+.. code-block:: python
+
+   schema = Schema(FrontMarker, [
+       Field('id'),
+       Field('pos', Point2D, width=2),
+       Field('belligerent', to_belligerent),
+   ])
+   schema.parse(['FrontMarker1', '7636.65', '94683.02', '1'])
+
+A single token can give values of several fields (e.g. type and code of a
+unit are encoded by one token in ``Chiefs`` section). Values which are not
+present in lines at all can be given as constants. Sections whose lines
+have several layouts (e.g. ``NStationary``, where extra fields depend on
+type of an object) are described by :class:`Variants` of schemas.
+
+Compiled functions accept an optional second argument: a callable with
+semantics of ``dict.setdefault`` which interns values of fields marked by
+``intern`` (see
+:attr:`~il2fb.parsers.mission.sections.base.SectionParser.strings`).
+
+If factory is a structure class, lines can be also converted into raw
+structures (see :mod:`il2fb.parsers.mission.raw`) by :attr:`Schema.parse_raw`.
+Interned fields and constants of raw structures are set during parsing.
+Other factories, e.g. functions which build nested structures, do not
+support raw structures and their lines are always converted eagerly.
+"""
+
+from il2fb.parsers.mission.raw import make_raw_class
+
+
+def _no_intern(key, default):
+    return default
+
+
+class Field(object):
+    """
+    A field of a line described by :class:`Schema`.
+
+    :param name: name of an argument of a factory which receives a value of
+                 the field. Tokens of fields without name are skipped. A
+                 tuple of names means that converter returns a sequence of
+                 values of several arguments.
+    :param converter: a callable which receives ``width`` tokens of the field
+                      and returns its value. Tokens are passed as is if
+                      ``None``.
+    :param int width: a number of tokens taken by the field
+    :param bool optional: tells whether the field can be absent. Only trailing
+                          fields can be optional.
+    :param default: a value of an absent optional field. A tuple of values
+                    if field has several names.
+    :param intern: tells whether to intern a value of the field. Only
+                   single-token fields can be interned. Values of fields with
+                   several names are interned if their names are listed.
+    """
+
+    def __init__(self, name, converter=None, width=1, optional=False,
+                 default=None, intern=False):
+        self.name = name
+        self.converter = converter
+        self.width = width
+        self.optional = optional
+        self.default = default
+        self.intern = intern
+
+    def __repr__(self):
+        return "<Field '{0}'>".format(self.name)
+
+    @property
+    def names(self):
+        """
+        :returns: names of arguments which receive values of the field
+        :rtype: :class:`tuple`
+        """
+        if self.name is None:
+            return ()
+        if isinstance(self.name, tuple):
+            return self.name
+        return (self.name, )
+
+    @property
+    def interned_names(self):
+        """
+        :returns: names of arguments whose values are interned
+        :rtype: :class:`tuple`
+        """
+        if not self.intern:
+            return ()
+        if self.intern is True:
+            return self.names
+        return tuple(self.intern)
+
+    def make_getter(self, position):
+        """
+        :param int position: a position of the first token of the field
+
+        :returns: a callable which receives all tokens of a line and returns
+                  a value of the field (a sequence of values for fields with
+                  several names)
+        """
+        converter, width = self.converter, self.width
+        stop = position + width
+
+        if width == 1:
+            if converter is None:
+                getter = lambda tokens: tokens[position]
+            else:
+                getter = lambda tokens: converter(tokens[position])
+        elif converter is None:
+            getter = lambda tokens: list(tokens[position:stop])
+        else:
+            getter = lambda tokens: converter(*tokens[position:stop])
+
+        if not self.optional:
+            return getter
+
+        default = self.default
+        return lambda tokens: (
+            getter(tokens) if len(tokens) > position else default
+        )
+
+
+class Schema(object):
+    """
+    Describes lines of a section as a sequence of fields.
+
+    :param factory: a callable which receives values of fields as keyword
+                    arguments, e.g. a class of parsed objects
+    :param fields: a list of :class:`Field`
+    :param dict constants: values of arguments of factory which are not
+                           present in lines
+    :param bool extra_tokens: tells whether lines can have extra tokens after
+                              the last field. Such tokens are ignored.
+    :param bool allow_raw: tells whether lines can be converted into raw
+                           structures if factory is a structure class
+    """
+
+    def __init__(self, factory, fields, constants=None, extra_tokens=False,
+                 allow_raw=True):
+        self.factory = factory
+        self.fields = fields
+        self.constants = constants or {}
+        self.extra_tokens = extra_tokens
+        self.allow_raw = allow_raw
+        self.source = self._generate_source()
+        self.parse = self._compile(self.source)
+        self._parse_raw = None
+
+    def __repr__(self):
+        return "<Schema of '{0}'>".format(
+            getattr(self.factory, '__name__', self.factory))
+
+    @property
+    def supports_raw(self):
+        """
+        Tells whether lines can be converted into raw structures, i.e.
+        whether they are allowed and factory is a structure class.
+        """
+        return self.allow_raw and isinstance(self.factory, type)
+
+    @property
+    def parse_raw(self):
+        """
+        A function which converts tokens of a line into a raw structure (see
+        :func:`~il2fb.parsers.mission.raw.make_raw_class`). Only number of
+        tokens is checked, fields are converted on first access. The same as
+        :attr:`parse` if raw structures are not supported.
+        """
+        if self._parse_raw is None:
+            if self.supports_raw:
+                source = self._generate_source(raw=True)
+                self._parse_raw = self._compile(source, raw=True)
+            else:
+                self._parse_raw = self.parse
+        return self._parse_raw
+
+    def getters(self):
+        """
+        :returns: a dictionary which maps names of fields to callables which
+                  receive all tokens of a line and return values of fields.
+                  Fields with several names are not included (see
+                  :meth:`group_getters`).
+        :rtype: :class:`dict`
+        """
+        result = {}
+        position = 0
+
+        for field in self.fields:
+            if field.name is not None and not isinstance(field.name, tuple):
+                result[field.name] = field.make_getter(position)
+            position += field.width
+
+        return result
+
+    def group_getters(self):
+        """
+        :returns: a list of pairs of names of fields which get values from
+                  the same tokens and callables which receive all tokens of a
+                  line and return dictionaries with values of these fields
+        :rtype: :class:`list`
+        """
+        result = []
+        position = 0
+
+        for field in self.fields:
+            if isinstance(field.name, tuple):
+                result.append((
+                    field.names,
+                    self._make_group_getter(field, position),
+                ))
+            position += field.width
+
+        return result
+
+    @staticmethod
+    def _make_group_getter(field, position):
+        names, getter = field.names, field.make_getter(position)
+        return lambda tokens: dict(zip(names, getter(tokens)))
+
+    @property
+    def arities(self):
+        """
+        :returns: allowed numbers of tokens in a line, from the least one.
+                  If lines can have extra tokens, any number of tokens which
+                  is greater than the last one is allowed as well.
+        :rtype: :class:`list`
+        """
+        result = []
+        count = 0
+
+        for field in self.fields:
+            if field.optional and count not in result:
+                result.append(count)
+            count += field.width
+
+        result.append(count)
+        return result
+
+    def _generate_source(self, raw=False):
+        arities = self.arities
+        lines = [
+            "def parse(tokens, intern=no_intern):",
+            "    n = len(tokens)",
+        ]
+
+        if self.extra_tokens:
+            lines.append("    if n < {0}:".format(arities[0]))
+            expected = "at least {0}".format(arities[0])
+        elif len(arities) == 1:
+            lines.append("    if n != {0}:".format(arities[0]))
+            expected = str(arities[0])
+        else:
+            lines.append("    if n not in {0!r}:".format(tuple(arities)))
+            expected = " or ".join(str(x) for x in arities)
+
+        lines.extend([
+            "        raise ValueError(",
+            "            \"expected {0} tokens, got {{0}}\".format(n))".format(
+                expected),
+        ])
+
+        arguments = []
+        position = 0
+        seen_optional = False
+
+        for i, field in enumerate(self.fields):
+            if field.optional:
+                seen_optional = True
+            elif seen_optional:
+                raise ValueError(
+                    "required field {0!r} follows an optional one"
+                    .format(field.name))
+
+            if field.intern and field.width != 1:
+                raise ValueError(
+                    "field {0!r} takes several tokens and cannot be interned"
+                    .format(field.name))
+
+            # Raw structures get values of interned fields during parsing,
+            # other fields are converted on first access.
+            if field.names and (field.intern or not raw):
+                arguments.extend(self._generate_field_source(
+                    i, field, position, lines,
+                ))
+
+            position += field.width
+
+        for name in self.constants:
+            arguments.append("        {0}=constants[{0!r}],".format(name))
+
+        if raw:
+            lines.append("    return raw_factory(")
+            lines.append("        tuple(tokens),")
+        else:
+            lines.append("    return factory(")
+        lines.extend(arguments)
+        lines.append("    )")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _generate_field_source(i, field, position, lines):
+        """
+        Generate code which converts a field, add lines of this code to
+        ``lines`` and return lines with arguments of factory.
+        """
+        tokens = ", ".join(
+            "tokens[{0}]".format(j)
+            for j in range(position, position + field.width)
+        )
+        if field.converter is not None:
+            value = "converter_{0}({1})".format(i, tokens)
+        elif field.width == 1:
+            value = tokens
+        else:
+            value = "[{0}]".format(tokens)
+
+        if isinstance(field.name, tuple):
+            if field.optional:
+                value = "({0} if n > {1} else default_{2})".format(
+                    value, position, i)
+            names = ["value_{0}_{1}".format(i, j)
+                     for j in range(len(field.names))]
+            lines.append("    {0}, = {1}".format(", ".join(names), value))
+
+            interned_names = field.interned_names
+            arguments = []
+            for name, local_name in zip(field.names, names):
+                if name in interned_names:
+                    local_name = "intern({0}, {0})".format(local_name)
+                arguments.append("        {0}={1},".format(name, local_name))
+            return arguments
+
+        if field.intern:
+            if field.optional:
+                value = "({0} if n > {1} else None)".format(value, position)
+            lines.append("    value_{0} = {1}".format(i, value))
+            value = "intern(value_{0}, value_{0})".format(i)
+
+        if field.optional:
+            value = "({0} if n > {1} else default_{2})".format(
+                value, position, i)
+
+        return ["        {0}={1},".format(field.name, value)]
+
+    def _compile(self, source, raw=False):
+        namespace = {
+            'factory': self.factory,
+            'constants': self.constants,
+            'no_intern': _no_intern,
+        }
+
+        if raw:
+            namespace['raw_factory'] = make_raw_class(
+                self.factory,
+                {
+                    name: getter
+                    for name, getter in self.getters().items()
+                    if not self._is_interned(name)
+                },
+                [
+                    (names, getter)
+                    for names, getter in self.group_getters()
+                    if not any(self._is_interned(name) for name in names)
+                ],
+            )
+
+        for i, field in enumerate(self.fields):
+            namespace["converter_{0}".format(i)] = field.converter
+            namespace["default_{0}".format(i)] = field.default
+
+        code = compile(source, "<{0!r}>".format(self), 'exec')
+        exec(code, namespace)
+        return namespace['parse']
+
+    def _is_interned(self, name):
+        for field in self.fields:
+            if name in field.names:
+                return bool(field.intern)
+        return False
+
+
+class Variants(object):
+    """
+    Describes lines of a section which have several layouts by several
+    schemas. A schema is selected for each line separately.
+
+    :param selector: a callable which receives tokens of a line and returns a
+                     key of a schema in ``schemas``
+    :param dict schemas: maps keys to instances of :class:`Schema`
+    :param default: a schema which is used if there is no schema for a key
+    """
+
+    def __init__(self, selector, schemas, default=None):
+        self.selector = selector
+        self.schemas = schemas
+        self.default = default
+
+    def __repr__(self):
+        return "<Variants of {0} schemas>".format(len(self.schemas))
+
+    def select(self, tokens):
+        """
+        :returns: an instance of :class:`Schema` which describes given tokens
+        """
+        schema = self.schemas.get(self.selector(tokens), self.default)
+        if schema is None:
+            raise ValueError("unexpected layout of line")
+        return schema
+
+    def parse(self, tokens, intern=_no_intern):
+        """
+        Convert tokens of a line by a selected schema.
+        """
+        return self.select(tokens).parse(tokens, intern)
+
+    def parse_raw(self, tokens, intern=_no_intern):
+        """
+        Convert tokens of a line into a raw structure by a selected schema.
+        """
+        return self.select(tokens).parse_raw(tokens, intern)
@@ -1,11 +1,49 @@
 # coding: utf-8
 
+import copy
 import six
 
 from abc import ABCMeta, abstractmethod
 
 
-class SectionParser(six.with_metaclass(ABCMeta)):
+def _is_implemented(cls, method_name):
+    method = six.get_unbound_function(getattr(cls, method_name))
+    return not getattr(method, 'is_fallback', False)
+
+
+class SectionParserMeta(ABCMeta):
+    """
+    Metaclass of section parsers which checks that
+    :meth:`~SectionParser.parse_line` or :meth:`~SectionParser.parse_tokens`
+    is implemented. Parsers which implement neither of them cannot be
+    instantiated, just like parsers with other abstract methods.
+
+    A parser which redefines :meth:`~SectionParser.parse_line` only, e.g. a
+    subclass of a built-in :attr:`~SectionParser.tokenized` parser, receives
+    whole lines: it is not tokenized, unless it tells otherwise, and lines
+    given to its ``parse_lines()`` are passed to
+    :meth:`~SectionParser.parse_line` one by one.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super(SectionParserMeta, cls).__init__(name, bases, namespace)
+
+        if not (
+            _is_implemented(cls, 'parse_line') or
+            _is_implemented(cls, 'parse_tokens')
+        ):
+            cls.__abstractmethods__ = cls.__abstractmethods__.union(
+                ['parse_line', 'parse_tokens', ]
+            )
+
+        if 'parse_line' in namespace and 'parse_tokens' not in namespace:
+            if 'tokenized' not in namespace:
+                cls.tokenized = False
+            if 'parse_lines' not in namespace and hasattr(cls, 'parse_lines'):
+                cls.parse_lines = CollectingParser.parse_lines
+
+
+class SectionParser(six.with_metaclass(SectionParserMeta)):
     """
     Abstract base parser of a single section in a mission file.
 
@@ -14,7 +52,8 @@ class SectionParser(six.with_metaclass(ABCMeta)):
     #. Pass a section name (e.g. 'MAIN') to :meth:`start` method. If parser can
        process a section with such name, it will return `True` and then you can
        proceed.
-    #. Pass section lines one-by-one to :meth:`parse_line`.
+    #. Pass section lines one-by-one to :meth:`parse_line` (or lines split
+       into tokens to :meth:`parse_tokens`).
     #. When you are done, get your parsed data by calling :meth:`stop`. This
        will tell the parser that no more data will be given and the parsing can
        be finished.
@@ -40,6 +79,43 @@ class SectionParser(six.with_metaclass(ABCMeta)):
     #: An internal buffer which can be redefined.
     data = None
 
+    #: An exact name of sections which can be parsed. Allows
+    #: :class:`~il2fb.parsers.mission.registry.SectionParsersRegistry` to
+    #: find the parser by a single lookup.
+    input_name = None
+
+    #: A compiled regular expression which matches names of sections that can
+    #: be parsed. Used by
+    #: :class:`~il2fb.parsers.mission.registry.SectionParsersRegistry` to
+    #: preselect the parser before calling :meth:`check_section_name`.
+    input_pattern = None
+
+    #: An object which receives parsed objects instead of parser's buffer
+    #: (see :class:`~il2fb.parsers.mission.visitors.MissionVisitor`).
+    visitor = None
+
+    #: Tells whether the parser implements :meth:`parse_tokens`. Lines of
+    #: sections which are processed by such parsers are split into tokens by
+    #: :class:`~il2fb.parsers.mission.MissionParser` just once and are passed
+    #: to :meth:`parse_tokens` directly.
+    tokenized = False
+
+    #: Tells whether collected objects must be raw structures which convert
+    #: their fields on first access (see :mod:`il2fb.parsers.mission.raw`).
+    #: Parsers which do not support raw structures ignore it.
+    raw = False
+
+    #: A dictionary which interns strings repeated in sections, e.g. codes of
+    #: objects, so that equal strings share memory. Values are put into it
+    #: by ``strings.setdefault(value, value)``. Is set by :meth:`start`.
+    strings = None
+
+    #: A dictionary which is used as :attr:`strings` by :meth:`start`, e.g.
+    #: to share strings between all sections of a mission. If not set, each
+    #: call of :meth:`start` creates a new table, so a reused parser does not
+    #: keep strings of sections parsed earlier.
+    shared_strings = None
+
     def start(self, section_name):
         """
         Try to start a parser. If a section with given name can be parsed, the
@@ -55,9 +131,37 @@ class SectionParser(six.with_metaclass(ABCMeta)):
         result = self.check_section_name(section_name)
         if result:
             self.running = True
+            if self.shared_strings is None:
+                self.strings = {}
+            else:
+                self.strings = self.shared_strings
             self.init_parser(section_name)
         return result
 
+    def intern(self, value):
+        """
+        Intern a string by :attr:`strings`.
+
+        :param str value: a string to intern
+
+        :returns: a string equal to the given one which is shared by all
+                  equal values
+        :rtype: :class:`str`
+        """
+        return self.strings.setdefault(value, value)
+
+    def clone(self):
+        """
+        Create a copy of the parser which does not share state of parsing with
+        the original one.
+
+        :class:`~il2fb.parsers.mission.MissionParser` parses each section by a
+        separate copy of a registered parser.
+
+        :returns: a new parser
+        """
+        return copy.copy(self)
+
     @abstractmethod
     def check_section_name(self, section_name):
         """
@@ -81,16 +185,38 @@ class SectionParser(six.with_metaclass(ABCMeta)):
         :returns: ``None``
         """
 
-    @abstractmethod
     def parse_line(self, line):
         """
-        Abstract method which is called manually to parse a line from mission
-        section.
+        Parse a line from mission section.
+
+        Either this method or :meth:`parse_tokens` must be implemented. If
+        only :meth:`parse_tokens` is implemented, a line is split into tokens
+        and passed to it.
 
         :param str line: a single line to parse
 
         :returns: ``None``
         """
+        self.parse_tokens(line.split())
+
+    parse_line.is_fallback = True
+
+    def parse_tokens(self, tokens):
+        """
+        Parse a line from mission section which is already split into tokens
+        by whitespace.
+
+        Either this method or :meth:`parse_line` must be implemented. If only
+        :meth:`parse_line` is implemented, tokens are joined back into a line
+        and passed to it.
+
+        :param list tokens: words of a single line to parse
+
+        :returns: ``None``
+        """
+        self.parse_line(' '.join(tokens))
+
+    parse_tokens.is_fallback = True
 
     def stop(self):
         """
@@ -115,7 +241,7 @@ class SectionParser(six.with_metaclass(ABCMeta)):
         return self.data
 
 
-class ValuesParser(six.with_metaclass(ABCMeta, SectionParser)):
+class ValuesParser(six.with_metaclass(SectionParserMeta, SectionParser)):
     """
     This is a base class for parsers which assume that a section, which is
     going to be parsed, consists of key-value pairs with unique keys, one pair
@@ -146,10 +272,10 @@ class ValuesParser(six.with_metaclass(ABCMeta, SectionParser)):
         Splits line into key-value pair and puts it into internal dictionary.
         """
         key, value = line.strip().split(' ', 1)
-        self.data.update({key: value})
+        self.data[key] = value
 
 
-class CollectingParser(six.with_metaclass(ABCMeta, SectionParser)):
+class CollectingParser(six.with_metaclass(SectionParserMeta, SectionParser)):
     """
     This is a base class for parsers which assume that a section, which is
     going to be parsed, consists of homogeneous lines which describe different
@@ -161,23 +287,114 @@ class CollectingParser(six.with_metaclass(ABCMeta, SectionParser)):
        object1_attr1 object1_attr2 object1_attr3 object1_attr4
        object2_attr1 object2_attr2 object2_attr3 object2_attr4
        object3_attr1 object3_attr2 object3_attr3 object3_attr4
+
+    Parsed objects must be passed to :meth:`collect`, which puts them to
+    internal list or to :attr:`visitor_method` of :attr:`visitor`, if the
+    latter is set.
     """
+    #: A name of a method of :attr:`visitor` which receives parsed objects.
+    visitor_method = None
 
     def init_parser(self, section_name):
         """
         Implements abstract method. See :meth:`SectionParser.init_parser` for
         semantics.
 
-        Initializes a list for storing collection of objects.
+        Initializes a list for storing collection of objects and selects a
+        target for :meth:`collect`.
         """
         self.data = []
 
+        if self.visitor is not None and self.visitor_method is not None:
+            self.collect = getattr(self.visitor, self.visitor_method)
+        else:
+            self.collect = self.data.append
+
+    def collect(self, obj):
+        """
+        Store a parsed object. Is redefined by :meth:`init_parser`.
+
+        :param obj: a parsed object
+
+        :returns: ``None``
+        """
+        self.data.append(obj)
+
     def parse_line(self, line):
         """
         Implements abstract method. See :meth:`SectionParser.parse_line` for
         semantics.
 
         Just puts entire line to internal buffer. You probably will want to
-        redefine this method to do some extra job on each line.
+        redefine this method or :meth:`~SectionParser.parse_tokens` to do some
+        extra job on each line.
+        """
+        if _is_implemented(self.__class__, 'parse_tokens'):
+            self.parse_tokens(line.split())
+        else:
+            self.collect(line.strip())
+
+    def parse_lines(self, lines):
+        """
+        Parse lines of mission section.
+
+        Mission parser passes all lines of a section up to the next header
+        at once as an iterator, which reads them from the source of lines
+        (a section may still be split into several calls if its lines are
+        given by chunks). Lines which are not taken are skipped. If parsing
+        fails, the error is reported for the last line taken. By default each
+        line is passed to :meth:`~SectionParser.parse_tokens` or to
+        :meth:`parse_line`. Parsers of large sections redefine this method to
+        process lines in a single loop.
+
+        :param lines: an iterable of lines to parse
+
+        :returns: ``None``
+        """
+        if self.tokenized:
+            parse_tokens = self.parse_tokens
+            for line in lines:
+                parse_tokens(line.split())
+        else:
+            parse_line = self.parse_line
+            for line in lines:
+                parse_line(line)
+
+
+class SchemaParser(six.with_metaclass(SectionParserMeta, CollectingParser)):
+    """
+    This is a base class for parsers of sections which describe one object per
+    line. Lines are converted into objects by :attr:`schema`.
+
+    **Section definition example**::
+
+       [section name]
+       object1_id object1_code object1_pos_x object1_pos_y
+       object2_id object2_code object2_pos_x object2_pos_y
+    """
+    tokenized = True
+
+    #: An instance of :class:`~il2fb.parsers.mission.schema.Schema` which
+    #: describes lines of sections.
+    schema = None
+
+    def parse_tokens(self, tokens):
+        """
+        Implements abstract method. See :meth:`SectionParser.parse_tokens` for
+        semantics.
+
+        Converts tokens into an object and collects it.
         """
-        self.data.append(line.strip())
+        parse = self.schema.parse_raw if self.raw else self.schema.parse
+        self.collect(parse(tokens, self.strings.setdefault))
+
+    def parse_lines(self, lines):
+        """
+        See :meth:`CollectingParser.parse_lines` for semantics.
+        """
+        parse = self.schema.parse_raw if self.raw else self.schema.parse
+        collect = self.collect
+        intern = self.strings.setdefault
+
+        for line in lines:
+            collect(parse(line.split(), intern))
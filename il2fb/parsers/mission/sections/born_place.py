@@ -1,73 +1,196 @@
 # coding: utf-8
 
+import re
+
 from il2fb.commons.spatial import Point2D
 
 from il2fb.parsers.mission.constants import WEAPONS_CONTINUATION_MARK
 from il2fb.parsers.mission.converters import to_bool
 from il2fb.parsers.mission.converters import to_belligerent
 from il2fb.parsers.mission.converters import to_air_force
+from il2fb.parsers.mission.schema import Field, Schema
 from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.sections.base import SchemaParser
+from il2fb.parsers.mission.structures import DictStructure
+
+
+class HomeBaseFriction(DictStructure):
+    __slots__ = ['enabled', 'value', ]
+
+    def __init__(self, enabled, value):
+        self.enabled = enabled
+        self.value = value
+
+
+class HomeBaseStationarySpawn(DictStructure):
+    __slots__ = ['enabled', 'return_to_start_position', ]
+
+    def __init__(self, enabled, return_to_start_position):
+        self.enabled = enabled
+        self.return_to_start_position = return_to_start_position
+
+
+class HomeBaseAirSpawnConditions(DictStructure):
+    __slots__ = ['always', 'if_deck_is_full', ]
+
+    def __init__(self, always, if_deck_is_full):
+        self.always = always
+        self.if_deck_is_full = if_deck_is_full
+
+
+class HomeBaseAirSpawn(DictStructure):
+    __slots__ = ['height', 'speed', 'heading', 'conditions', ]
+
+    def __init__(self, height, speed, heading, conditions):
+        self.height = height
+        self.speed = speed
+        self.heading = heading
+        self.conditions = conditions
+
+
+class HomeBaseAircraftLimitations(DictStructure):
+    __slots__ = [
+        'enabled', 'consider_lost', 'consider_stationary',
+        'allowed_aircrafts',
+    ]
+
+    def __init__(self, enabled, consider_lost, consider_stationary,
+                 allowed_aircrafts=None):
+        self.enabled = enabled
+        self.consider_lost = consider_lost
+        self.consider_stationary = consider_stationary
+        self.allowed_aircrafts = allowed_aircrafts
+
+
+class HomeBaseSpawning(DictStructure):
+    __slots__ = [
+        'enabled', 'with_parachutes', 'max_pilots', 'in_stationary', 'in_air',
+        'aircraft_limitations', 'allowed_air_forces',
+    ]
 
+    def __init__(self, enabled, with_parachutes, max_pilots, in_stationary,
+                 in_air, aircraft_limitations, allowed_air_forces=None):
+        self.enabled = enabled
+        self.with_parachutes = with_parachutes
+        self.max_pilots = max_pilots
+        self.in_stationary = in_stationary
+        self.in_air = in_air
+        self.aircraft_limitations = aircraft_limitations
+        self.allowed_air_forces = allowed_air_forces
 
-class BornPlaceSectionParser(CollectingParser):
+
+class HomeBaseRadar(DictStructure):
+    __slots__ = ['range', 'min_height', 'max_height', ]
+
+    def __init__(self, range, min_height, max_height):
+        self.range = range
+        self.min_height = min_height
+        self.max_height = max_height
+
+
+class HomeBase(DictStructure):
+    """
+    A home base defined in ``BornPlace`` section.
+
+    Lists of allowed aircrafts and air forces are attached to home bases by
+    mission parser as they are defined in separate sections.
+    """
+    __slots__ = [
+        'range', 'belligerent', 'show_default_icon', 'friction', 'spawning',
+        'radar', 'pos',
+    ]
+
+    def __init__(self, range, belligerent, show_default_icon, friction,
+                 spawning, radar, pos):
+        self.range = range
+        self.belligerent = belligerent
+        self.show_default_icon = show_default_icon
+        self.friction = friction
+        self.spawning = spawning
+        self.radar = radar
+        self.pos = pos
+
+    def __repr__(self):
+        return "<HomeBase '{0};{1}'>".format(self.pos.x, self.pos.y)
+
+
+def make_home_base(
+    belligerent, range, pos, has_parachutes, air_spawn_height,
+    air_spawn_speed, air_spawn_heading, max_pilots, radar_min_height,
+    radar_max_height, radar_range, air_spawn_always, enable_aircraft_limits,
+    aircraft_limits_consider_lost, disable_spawning, friction_enabled,
+    friction_value, aircraft_limits_consider_stationary, show_default_icon,
+    air_spawn_if_deck_is_full, spawn_in_stationary, return_to_start_position,
+):
+    """
+    Build a home base with nested structures from flat values of fields of
+    a line of ``BornPlace`` section.
+    """
+    # Positional arguments are used as this is a hot path
+    return HomeBase(
+        range,
+        belligerent,
+        show_default_icon,
+        HomeBaseFriction(friction_enabled, friction_value),
+        HomeBaseSpawning(
+            not disable_spawning,
+            has_parachutes,
+            max_pilots,
+            HomeBaseStationarySpawn(
+                spawn_in_stationary, return_to_start_position,
+            ),
+            HomeBaseAirSpawn(
+                air_spawn_height,
+                air_spawn_speed,
+                air_spawn_heading,
+                HomeBaseAirSpawnConditions(
+                    air_spawn_always, air_spawn_if_deck_is_full,
+                ),
+            ),
+            HomeBaseAircraftLimitations(
+                enable_aircraft_limits,
+                aircraft_limits_consider_lost,
+                aircraft_limits_consider_stationary,
+            ),
+        ),
+        HomeBaseRadar(radar_range, radar_min_height, radar_max_height),
+        pos,
+    )
+
+
+class BornPlaceSectionParser(SchemaParser):
     """
     Parses ``BornPlace`` section.
     View :ref:`detailed description <bornplace-section>`.
     """
+    input_name = "BornPlace"
+    schema = Schema(make_home_base, [
+        Field('belligerent', to_belligerent),
+        Field('range', int),
+        Field('pos', Point2D, width=2),
+        Field('has_parachutes', to_bool),
+        Field('air_spawn_height', int),
+        Field('air_spawn_speed', int),
+        Field('air_spawn_heading', int),
+        Field('max_pilots', int),
+        Field('radar_min_height', int),
+        Field('radar_max_height', int),
+        Field('radar_range', int),
+        Field('air_spawn_always', to_bool),
+        Field('enable_aircraft_limits', to_bool),
+        Field('aircraft_limits_consider_lost', to_bool),
+        Field('disable_spawning', to_bool),
+        Field('friction_enabled', to_bool),
+        Field('friction_value', float),
+        Field('aircraft_limits_consider_stationary', to_bool),
+        Field('show_default_icon', to_bool),
+        Field('air_spawn_if_deck_is_full', to_bool),
+        Field('spawn_in_stationary', to_bool),
+        Field('return_to_start_position', to_bool),
+    ])
 
     def check_section_name(self, section_name):
-        return section_name == "BornPlace"
-
-    def parse_line(self, line):
-        (
-            belligerent, the_range, pos_x, pos_y, has_parachutes,
-            air_spawn_height, air_spawn_speed, air_spawn_heading, max_pilots,
-            radar_min_height, radar_max_height, radar_range, air_spawn_always,
-            enable_aircraft_limits, aircraft_limits_consider_lost,
-            disable_spawning, friction_enabled, friction_value,
-            aircraft_limits_consider_stationary, show_default_icon,
-            air_spawn_if_deck_is_full, spawn_in_stationary,
-            return_to_start_position
-        ) = line.split()
-
-        self.data.append({
-            'range': int(the_range),
-            'belligerent': to_belligerent(belligerent),
-            'show_default_icon': to_bool(show_default_icon),
-            'friction': {
-                'enabled': to_bool(friction_enabled),
-                'value': float(friction_value),
-            },
-            'spawning': {
-                'enabled': not to_bool(disable_spawning),
-                'with_parachutes': to_bool(has_parachutes),
-                'max_pilots': int(max_pilots),
-                'in_stationary': {
-                    'enabled': to_bool(spawn_in_stationary),
-                    'return_to_start_position': to_bool(return_to_start_position),
-                },
-                'in_air': {
-                    'height': int(air_spawn_height),
-                    'speed': int(air_spawn_speed),
-                    'heading': int(air_spawn_heading),
-                    'conditions': {
-                        'always': to_bool(air_spawn_always),
-                        'if_deck_is_full': to_bool(air_spawn_if_deck_is_full),
-                    },
-                },
-                'aircraft_limitations': {
-                    'enabled': to_bool(enable_aircraft_limits),
-                    'consider_lost': to_bool(aircraft_limits_consider_lost),
-                    'consider_stationary': to_bool(aircraft_limits_consider_stationary),
-                },
-            },
-            'radar': {
-                'range': int(radar_range),
-                'min_height': int(radar_min_height),
-                'max_height': int(radar_max_height),
-            },
-            'pos': Point2D(pos_x, pos_y),
-        })
+        return section_name == self.input_name
 
     def clean(self):
         return {'home_bases': self.data, }
@@ -79,6 +202,7 @@ class BornPlaceAirForcesSectionParser(CollectingParser):
     View :ref:`detailed description <bornplace-air-forces-section>`.
     """
     input_prefix = 'BornPlaceCountries'
+    input_pattern = re.compile(r"{0}.".format(input_prefix))
     output_prefix = 'home_base_air_forces_'
 
     def check_section_name(self, section_name):
@@ -116,7 +240,9 @@ class BornPlaceAircraftsSectionParser(CollectingParser):
     View :ref:`detailed description <bornplace-aircrafts-section>`.
     """
     input_prefix = 'BornPlace'
+    input_pattern = re.compile(r"{0}.".format(input_prefix))
     output_prefix = 'home_base_aircrafts_'
+    tokenized = True
 
     def check_section_name(self, section_name):
         if not section_name.startswith(self.input_prefix):
@@ -139,16 +265,17 @@ class BornPlaceAircraftsSectionParser(CollectingParser):
         start = len(self.input_prefix)
         return int(section_name[start:])
 
-    def parse_line(self, line):
-        parts = line.split()
+    def parse_tokens(self, tokens):
+        intern = self.strings.setdefault
+        tokens = [intern(token, token) for token in tokens]
 
-        if parts[0] == WEAPONS_CONTINUATION_MARK:
-            self.aircraft['weapon_limitations'].extend(parts[1:])
+        if tokens[0] == WEAPONS_CONTINUATION_MARK:
+            self.aircraft['weapon_limitations'].extend(tokens[1:])
         else:
             if self.aircraft:
                 # Finalize previous aircraft
                 self.data.append(self.aircraft)
-            self.aircraft = self._parse_new_item(parts)
+            self.aircraft = self._parse_new_item(tokens)
 
     @classmethod
     def _parse_new_item(cls, parts):
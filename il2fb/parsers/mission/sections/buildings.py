@@ -5,7 +5,8 @@ from il2fb.commons.structures import BaseStructure
 
 from il2fb.parsers.mission.converters import to_angle
 from il2fb.parsers.mission.converters import to_belligerent
-from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.schema import Field, Schema
+from il2fb.parsers.mission.sections.base import SchemaParser
 
 
 class Building(BaseStructure):
@@ -22,27 +23,27 @@ class Building(BaseStructure):
         return "<Building '{0}'>".format(self.id)
 
 
-class BuildingsSectionParser(CollectingParser):
+def to_building_code(value):
+    return value.split('$')[1]
+
+
+class BuildingsSectionParser(SchemaParser):
     """
     Parses ``Buildings`` section.
     View :ref:`detailed description <buildings-section>`.
     """
+    input_name = "Buildings"
+    visitor_method = 'on_building'
+    schema = Schema(Building, [
+        Field('id'),
+        Field('code', to_building_code, intern=True),
+        Field('belligerent', to_belligerent),
+        Field('pos', Point2D, width=2),
+        Field('rotation_angle', to_angle),
+    ])
 
     def check_section_name(self, section_name):
-        return section_name == "Buildings"
-
-    def parse_line(self, line):
-        params = line.split()
-        oid, building_object, belligerent = params[:3]
-        pos_x, pos_y, rotation_angle = params[3:]
-        code = building_object.split('$')[1]
-        self.data.append(Building(
-            id=oid,
-            belligerent=to_belligerent(belligerent),
-            code=code,
-            pos=Point2D(pos_x, pos_y),
-            rotation_angle=to_angle(rotation_angle),
-        ))
+        return section_name == self.input_name
 
     def clean(self):
         return {'buildings': self.data, }
@@ -1,5 +1,8 @@
 # coding: utf-8
 
+import functools
+import re
+
 from il2fb.commons.spatial import Point2D
 from il2fb.commons.structures import BaseStructure
 
@@ -7,47 +10,70 @@ from il2fb.parsers.mission.converters import to_belligerent
 from il2fb.parsers.mission.converters import to_skill
 from il2fb.parsers.mission.converters import to_speed
 from il2fb.parsers.mission.converters import to_unit_type
-from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.schema import Field, Schema
+from il2fb.parsers.mission.sections.base import SchemaParser
+from il2fb.parsers.mission.structures import DictStructure
+
+
+class MovingUnit(DictStructure):
+    """
+    A moving unit defined in ``Chiefs`` section. Only ships have
+    ``hibernation``, ``skill`` and ``recharge_time``. ``route`` is attached by
+    mission parser from ``N_Chief_Road`` section.
+    """
+    __slots__ = [
+        'id', 'code', 'type', 'belligerent', 'hibernation', 'skill',
+        'recharge_time', 'route',
+    ]
+
+    def __init__(self, id, code, type, belligerent, hibernation=None,
+                 skill=None, recharge_time=None, route=None):
+        self.id = id
+        self.code = code
+        self.type = type
+        self.belligerent = belligerent
+        self.hibernation = hibernation
+        self.skill = skill
+        self.recharge_time = recharge_time
+        self.route = route
+
+    def __repr__(self):
+        return "<MovingUnit '{0}'>".format(self.id)
+
+
+def to_unit_type_and_code(value):
+    """
+    Split a token like ``Armor.1-BT7`` into type and code of a unit. Unknown
+    types are kept as they are.
+    """
+    type_code, unit_code = value.split('.')
+    try:
+        unit_type = to_unit_type(type_code)
+    except:
+        # Use original string as unit type
+        unit_type = type_code
+    return unit_type, unit_code
 
 
-class ChiefsSectionParser(CollectingParser):
+class ChiefsSectionParser(SchemaParser):
     """
     Parses ``Chiefs`` section.
     View :ref:`detailed description <chiefs-section>`.
     """
+    input_name = "Chiefs"
+    visitor_method = 'on_moving_unit'
+    # Moving units are few and small, so they are not worth raw structures
+    schema = Schema(MovingUnit, allow_raw=False, fields=[
+        Field('id'),
+        Field(('type', 'code'), to_unit_type_and_code, intern=('code', )),
+        Field('belligerent', to_belligerent),
+        Field('hibernation', int, optional=True),
+        Field('skill', to_skill, optional=True),
+        Field('recharge_time', float, optional=True),
+    ])
 
     def check_section_name(self, section_name):
-        return section_name == "Chiefs"
-
-    def parse_line(self, line):
-        params = line.split()
-        (uid, type__code, belligerent), params = params[0:3], params[3:]
-
-        type_code, unit_code = type__code.split('.')
-        unit_type = self._get_unit_type(type_code)
-
-        unit = {
-            'id': uid,
-            'code': unit_code,
-            'type': unit_type,
-            'belligerent': to_belligerent(belligerent),
-        }
-        if params:
-            hibernation, skill, recharge_time = params
-            unit.update({
-                'hibernation': int(hibernation),
-                'skill': to_skill(skill),
-                'recharge_time': float(recharge_time),
-            })
-        self.data.append(unit)
-
-    @staticmethod
-    def _get_unit_type(type_code):
-        try:
-            return to_unit_type(type_code)
-        except:
-            # Use original string as unit type
-            return type_code
+        return section_name == self.input_name
 
     def clean(self):
         return {'moving_units': self.data, }
@@ -68,7 +94,14 @@ class GroundRoutePoint(BaseStructure):
         return "<GroundRoutePoint '{0};{1}'>".format(self.pos.x, self.pos.y)
 
 
-class ChiefRoadSectionParser(CollectingParser):
+def to_checkpoint_delay(value):
+    """
+    Only checkpoints of routes have delay and further fields.
+    """
+    return True, int(value)
+
+
+class ChiefRoadSectionParser(SchemaParser):
     """
     Parses ``N_Chief_Road`` section.
     View :ref:`detailed description <chief-road-section>`.
@@ -76,7 +109,19 @@ class ChiefRoadSectionParser(CollectingParser):
     id_suffix = "_Chief"
     section_suffix = "_Road"
     input_suffix = id_suffix + section_suffix
+    input_pattern = re.compile(r".+{0}$".format(input_suffix))
     output_prefix = 'route_'
+    visitor_method = 'on_route_point'
+    schema = Schema(GroundRoutePoint, [
+        Field('pos', Point2D, width=2),
+        Field(None),
+        Field(
+            ('is_checkpoint', 'delay'), to_checkpoint_delay, optional=True,
+            default=(False, None),
+        ),
+        Field('section_length', int, optional=True),
+        Field('speed', to_speed, optional=True),
+    ])
 
     def check_section_name(self, section_name):
         if not section_name.endswith(self.input_suffix):
@@ -90,28 +135,12 @@ class ChiefRoadSectionParser(CollectingParser):
         unit_id = self._extract_unit_id(section_name)
         self.output_key = "{0}{1}".format(self.output_prefix, unit_id)
 
+        if self.visitor is not None:
+            self.collect = functools.partial(self.collect, unit_id)
+
     def _extract_unit_id(self, section_name):
         stop = section_name.index(self.section_suffix)
         return section_name[:stop]
 
-    def parse_line(self, line):
-        params = line.split()
-        pos, params = params[0:2], params[3:]
-
-        args = {
-            'pos': Point2D(*pos),
-        }
-
-        is_checkpoint = bool(params)
-        args['is_checkpoint'] = is_checkpoint
-
-        if is_checkpoint:
-            args['delay'] = int(params[0])
-            args['section_length'] = int(params[1])
-            args['speed'] = to_speed(params[2])
-
-        point = GroundRoutePoint(**args)
-        self.data.append(point)
-
     def clean(self):
         return {self.output_key: self.data}
@@ -4,7 +4,8 @@ from il2fb.commons.spatial import Point2D
 from il2fb.commons.structures import BaseStructure
 
 from il2fb.parsers.mission.converters import to_belligerent
-from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.schema import Field, Schema
+from il2fb.parsers.mission.sections.base import SchemaParser
 
 
 class FrontMarker(BaseStructure):
@@ -19,22 +20,21 @@ class FrontMarker(BaseStructure):
         return "<FrontMarker '{0}'>".format(self.id)
 
 
-class FrontMarkerSectionParser(CollectingParser):
+class FrontMarkerSectionParser(SchemaParser):
     """
     Parses ``FrontMarker`` section.
     View :ref:`detailed description <front-marker-section>`.
     """
+    input_name = "FrontMarker"
+    visitor_method = 'on_front_marker'
+    schema = Schema(FrontMarker, [
+        Field('id'),
+        Field('pos', Point2D, width=2),
+        Field('belligerent', to_belligerent),
+    ])
 
     def check_section_name(self, section_name):
-        return section_name == "FrontMarker"
-
-    def parse_line(self, line):
-        oid, pos_x, pos_y, belligerent = line.split()
-        self.data.append(FrontMarker(
-            id=oid,
-            belligerent=to_belligerent(belligerent),
-            pos=Point2D(pos_x, pos_y),
-        ))
+        return section_name == self.input_name
 
     def clean(self):
         return {'markers': self.data, }
@@ -12,13 +12,14 @@ class MainSectionParser(ValuesParser):
     Parses ``MAIN`` section.
     View :ref:`detailed description <main-section>`.
     """
+    input_name = "MAIN"
 
     def check_section_name(self, section_name):
         """
         Implements abstract method. See
         :meth:`SectionParser.check_section_name` for semantics.
         """
-        return section_name == "MAIN"
+        return section_name == self.input_name
 
     def clean(self):
         """
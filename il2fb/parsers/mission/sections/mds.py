@@ -1,5 +1,6 @@
 # coding: utf-8
 
+import re
 
 from il2fb.commons.organization import Belligerents
 
@@ -13,9 +14,10 @@ class MDSSectionParser(ValuesParser):
     Parses ``MDS`` section.
     View :ref:`detailed description <mds-section>`.
     """
+    input_name = "MDS"
 
     def check_section_name(self, section_name):
-        return section_name == "MDS"
+        return section_name == self.input_name
 
     def parse_line(self, line):
         super(MDSSectionParser, self).parse_line(line.replace('MDS_', ''))
@@ -74,6 +76,7 @@ class MDSScoutsSectionParser(CollectingParser):
     View :ref:`detailed description <mds-scouts-section>`.
     """
     input_prefix = "MDS_Scouts_"
+    input_pattern = re.compile(r"{0}.".format(input_prefix))
     output_prefix = "scouts_"
 
     def check_section_name(self, section_name):
@@ -12,7 +12,9 @@ from il2fb.parsers.mission.converters import to_belligerent
 from il2fb.parsers.mission.converters import to_bool
 from il2fb.parsers.mission.converters import to_skill
 from il2fb.parsers.mission.converters import to_unit_type
-from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.schema import Field, Schema, Variants
+from il2fb.parsers.mission.sections.base import SchemaParser
+from il2fb.parsers.mission.utils import lru_cache
 
 
 class StationaryObject(BaseStructure):
@@ -98,122 +100,120 @@ def structure_class_by_unit_type(value):
     return __UNIT_TYPES_MAP.get(value, StationaryObject)
 
 
-class NStationarySectionParser(CollectingParser):
+#: Max number of types of objects kept in cache by their names.
+OBJECT_TYPES_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=OBJECT_TYPES_CACHE_SIZE)
+def to_object_type(object_name):
+    """
+    Get type of a stationary object by its name, e.g.
+    ``vehicles.artillery.Artillery$SdKfz251``. Unknown types are kept as
+    they are.
+    """
+    if object_name.startswith('ships'):
+        type_name = "ships"
+    else:
+        start = object_name.index('.') + 1
+        stop = object_name.rindex('.')
+        type_name = object_name[start:stop]
+
+    try:
+        return to_unit_type(type_name)
+    except:
+        # Use original string as object's type
+        return type_name
+
+
+def to_object_type_and_code(object_name):
+    start = object_name.index('$') + 1
+    return to_object_type(object_name), object_name[start:]
+
+
+def to_aircraft_spawning(value):
+    """
+    :returns: ``allows_spawning`` and ``is_restorable`` flags of aircrafts
+    """
+    return to_bool(value), value == IS_STATIONARY_AIRCRAFT_RESTORABLE
+
+
+def to_skin(value):
+    return None if value == NULL else value
+
+
+# Short layout of lines of aircrafts has no air force and spawning flags
+_AIRCRAFT_SHORT_LAYOUT = 'aircraft_short'
+_AIRCRAFT_SHORT_LAYOUT_LENGTH = 9
+
+
+def _select_schema(tokens):
+    object_type = to_object_type(tokens[1])
+    if (
+        object_type is UnitTypes.aircraft and
+        len(tokens) == _AIRCRAFT_SHORT_LAYOUT_LENGTH
+    ):
+        return _AIRCRAFT_SHORT_LAYOUT
+    return object_type
+
+
+_COMMON_FIELDS = [
+    Field('id'),
+    Field(('type', 'code'), to_object_type_and_code, intern=('code', )),
+    Field('belligerent', to_belligerent),
+    Field('pos', Point2D, width=2),
+    Field('rotation_angle', to_angle),
+]
+
+
+class NStationarySectionParser(SchemaParser):
     """
     Parses ``NStationary`` section.
     View :ref:`detailed description <nstationary-section>`.
     """
+    input_name = "NStationary"
+    visitor_method = 'on_stationary_object'
+    schema = Variants(
+        _select_schema,
+        {
+            UnitTypes.artillery: Schema(StationaryArtillery, _COMMON_FIELDS + [
+                Field('awakening_time', float),
+                Field('range', int, optional=True, default=0),
+                Field('skill', to_skill, optional=True),
+                Field('use_spotter', to_bool, optional=True, default=False),
+            ]),
+            UnitTypes.aircraft: Schema(StationaryAircraft, _COMMON_FIELDS + [
+                Field(None),
+                Field('air_force', to_air_force),
+                Field(('allows_spawning', 'is_restorable'), to_aircraft_spawning),
+                Field(None),
+                Field('skin', to_skin, intern=True),
+                Field('show_markings', to_bool),
+            ]),
+            _AIRCRAFT_SHORT_LAYOUT: Schema(
+                StationaryAircraft,
+                _COMMON_FIELDS + [
+                    Field(None),
+                    Field('skin', to_skin, intern=True),
+                    Field('show_markings', to_bool),
+                ],
+                constants={
+                    'air_force': None,
+                    'allows_spawning': False,
+                    'is_restorable': False,
+                },
+            ),
+            UnitTypes.ship: Schema(StationaryShip, _COMMON_FIELDS + [
+                Field(None),
+                Field('awakening_time', float),
+                Field('skill', to_skill),
+                Field('recharge_time', float),
+            ]),
+        },
+        default=Schema(StationaryObject, _COMMON_FIELDS, extra_tokens=True),
+    )
 
     def check_section_name(self, section_name):
-        return section_name == "NStationary"
-
-    def __parse_artillery(params):
-        """
-        Parse additional options for ``artillery`` type.
-        """
-        try:
-            awakening_time, the_range, skill, use_spotter = params
-            skill = to_skill(skill)
-            use_spotter = to_bool(use_spotter)
-        except ValueError:
-            try:
-                awakening_time, the_range = params
-            except ValueError:
-                awakening_time, the_range = params[0], 0
-            skill, use_spotter = None, False
-
-        return {
-            'awakening_time': float(awakening_time),
-            'range': int(the_range),
-            'skill': skill,
-            'use_spotter': use_spotter,
-        }
-
-    def __parse_aircraft(params):
-        """
-        Parse additional options for ``planes`` type.
-        """
-        try:
-            air_force, allows_spawning__restorable = params[1:3]
-            skin, show_markings = params[4:]
-        except ValueError:
-            air_force, allows_spawning__restorable = None, 0
-            skin, show_markings = params[1:]
-
-        is_restorable = allows_spawning__restorable == IS_STATIONARY_AIRCRAFT_RESTORABLE
-        skin = None if skin == NULL else skin
-
-        return {
-            'air_force': to_air_force(air_force),
-            'allows_spawning': to_bool(allows_spawning__restorable),
-            'is_restorable': is_restorable,
-            'skin': skin,
-            'show_markings': to_bool(show_markings),
-        }
-
-    def __parse_ship(params):
-        """
-        Parse additional options for ``ships`` type.
-        """
-        awakening_time, skill, recharge_time = params[1:]
-        return {
-            'awakening_time': float(awakening_time),
-            'recharge_time': float(recharge_time),
-            'skill': to_skill(skill),
-        }
-
-    __subparsers = {
-        UnitTypes.aircraft: __parse_aircraft,
-        UnitTypes.artillery: __parse_artillery,
-        UnitTypes.ship: __parse_ship,
-    }
-
-    def parse_line(self, line):
-        params = line.split()
-
-        oid, object_name, belligerent = params[0], params[1], params[2]
-        pos = params[3:5]
-        rotation_angle = params[5]
-        params = params[6:]
-
-        unit_type = self._get_type(object_name)
-        info = {
-            'id': oid,
-            'belligerent': to_belligerent(belligerent),
-            'code': self._get_code(object_name),
-            'pos': Point2D(*pos),
-            'rotation_angle': to_angle(rotation_angle),
-            'type': unit_type,
-        }
-
-        subparser = self.__subparsers.get(unit_type)
-        if subparser:
-            info.update(subparser(params))
-
-        structure_class = structure_class_by_unit_type(unit_type)
-        self.data.append(structure_class(**info))
-
-    def _get_type(self, object_name):
-        type_name = self._get_type_name(object_name)
-        try:
-            return to_unit_type(type_name)
-        except:
-            # Use original string as object's type
-            return type_name
-
-    @staticmethod
-    def _get_type_name(object_name):
-        if object_name.startswith('ships'):
-            return "ships"
-        else:
-            start = object_name.index('.') + 1
-            stop = object_name.rindex('.')
-            return object_name[start:stop]
-
-    @staticmethod
-    def _get_code(code):
-        start = code.index('$') + 1
-        return code[start:]
+        return section_name == self.input_name
 
     def clean(self):
         return {'stationary': self.data}
@@ -8,9 +8,10 @@ class RespawnTimeSectionParser(ValuesParser):
     Parses ``RespawnTime`` section.
     View :ref:`detailed description <respawn-time-section>`.
     """
+    input_name = "RespawnTime"
 
     def check_section_name(self, section_name):
-        return section_name == "RespawnTime"
+        return section_name == self.input_name
 
     def clean(self):
         return {
@@ -5,7 +5,8 @@ from il2fb.commons.structures import BaseStructure
 
 from il2fb.parsers.mission.converters import to_angle
 from il2fb.parsers.mission.converters import to_belligerent
-from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.schema import Field, Schema
+from il2fb.parsers.mission.sections.base import SchemaParser
 
 
 class Rocket(BaseStructure):
@@ -32,35 +33,28 @@ class Rocket(BaseStructure):
         return "<Rocket '{0}'>".format(self.id)
 
 
-class RocketSectionParser(CollectingParser):
+class RocketSectionParser(SchemaParser):
     """
     Parses ``Rocket`` section.
     View :ref:`detailed description <rocket-section>`.
 
     """
+    input_name = "Rocket"
+    visitor_method = 'on_rocket'
+    schema = Schema(Rocket, [
+        Field('id'),
+        Field('code', intern=True),
+        Field('belligerent', to_belligerent),
+        Field('pos', Point2D, width=2),
+        Field('rotation_angle', to_angle),
+        Field('delay', float),
+        Field('count', int),
+        Field('period', float),
+        Field('destination', Point2D, width=2, optional=True),
+    ])
 
     def check_section_name(self, section_name):
-        return section_name == "Rocket"
-
-    def parse_line(self, line):
-        params = line.split()
-
-        oid, code, belligerent = params[0:3]
-        pos = params[3:5]
-        rotation_angle, delay, count, period = params[5:9]
-        destination = params[9:]
-
-        self.data.append(Rocket(
-            id=oid,
-            code=code,
-            belligerent=to_belligerent(belligerent),
-            pos=Point2D(*pos),
-            rotation_angle=to_angle(rotation_angle),
-            delay=float(delay),
-            count=int(count),
-            period=float(period),
-            destination=Point2D(*destination) if destination else None
-        ))
+        return section_name == self.input_name
 
     def clean(self):
         return {'rockets': self.data}
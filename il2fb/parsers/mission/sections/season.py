@@ -10,13 +10,14 @@ class SeasonSectionParser(ValuesParser):
     Parses ``SEASON`` section.
     View :ref:`detailed description <season-section>`.
     """
+    input_name = "SEASON"
 
     def check_section_name(self, section_name):
         """
         Implements abstract method. See
         :meth:`SectionParser.check_section_name` for semantics.
         """
-        return section_name == "SEASON"
+        return section_name == self.input_name
 
     def clean(self):
         """
@@ -5,7 +5,8 @@ from il2fb.commons.spatial import Point3D
 from il2fb.commons.structures import BaseStructure
 
 from il2fb.parsers.mission.converters import to_belligerent
-from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.schema import Field, Schema
+from il2fb.parsers.mission.sections.base import SchemaParser
 
 
 class StaticCamera(BaseStructure):
@@ -22,21 +23,20 @@ class StaticCamera(BaseStructure):
         )
 
 
-class StaticCameraSectionParser(CollectingParser):
+class StaticCameraSectionParser(SchemaParser):
     """
     Parses ``StaticCamera`` section.
     View :ref:`detailed description <static-camera-section>`.
     """
+    input_name = "StaticCamera"
+    visitor_method = 'on_static_camera'
+    schema = Schema(StaticCamera, [
+        Field('pos', Point3D, width=3),
+        Field('belligerent', to_belligerent),
+    ])
 
     def check_section_name(self, section_name):
-        return section_name == "StaticCamera"
-
-    def parse_line(self, line):
-        pos_x, pos_y, pos_z, belligerent = line.split()
-        self.data.append(StaticCamera(
-            belligerent=to_belligerent(belligerent),
-            pos=Point3D(pos_x, pos_y, pos_z),
-        ))
+        return section_name == self.input_name
 
     def clean(self):
         return {'cameras': self.data, }
@@ -5,106 +5,198 @@ from il2fb.commons.targets import TargetTypes, TargetPriorities
 
 from il2fb.parsers.mission.converters import to_bool
 from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.structures import DictStructure
 
 
 def to_destruction_level(value):
     return int(value) / 10
 
 
+class TargetObject(DictStructure):
+    __slots__ = ['id', 'pos', 'waypoint', ]
+
+    def __init__(self, id, pos, waypoint=None):
+        self.id = id
+        self.pos = pos
+        self.waypoint = waypoint
+
+    def __repr__(self):
+        return "<TargetObject '{0}'>".format(self.id)
+
+
+class Target(DictStructure):
+    __slots__ = ['type', 'priority', 'in_sleep_mode', 'delay', ]
+
+    def __init__(self, type, priority, in_sleep_mode, delay):
+        self.type = type
+        self.priority = priority
+        self.in_sleep_mode = in_sleep_mode
+        self.delay = delay
+
+    def __repr__(self):
+        return "<{0} '{1}'>".format(self.__class__.__name__, self.type.name)
+
+
+class DestroyTarget(Target):
+    """
+    A target with type 'destroy', 'cover' or 'escort'.
+    """
+    __slots__ = Target.__slots__ + ['destruction_level', 'pos', 'object', ]
+
+    def __init__(self, type, priority, in_sleep_mode, delay,
+                 destruction_level, pos, object):
+        super(DestroyTarget, self).__init__(
+            type, priority, in_sleep_mode, delay,
+        )
+        self.destruction_level = destruction_level
+        self.pos = pos
+        self.object = object
+
+
+class BridgeTarget(Target):
+    """
+    A target with type 'destroy bridge' or 'cover bridge'.
+    """
+    __slots__ = Target.__slots__ + ['pos', 'object', ]
+
+    def __init__(self, type, priority, in_sleep_mode, delay, pos, object):
+        super(BridgeTarget, self).__init__(
+            type, priority, in_sleep_mode, delay,
+        )
+        self.pos = pos
+        self.object = object
+
+
+class AreaTarget(Target):
+    """
+    A target with type 'destroy area' or 'cover area'.
+    """
+    __slots__ = Target.__slots__ + ['destruction_level', 'pos', 'radius', ]
+
+    def __init__(self, type, priority, in_sleep_mode, delay,
+                 destruction_level, pos, radius):
+        super(AreaTarget, self).__init__(
+            type, priority, in_sleep_mode, delay,
+        )
+        self.destruction_level = destruction_level
+        self.pos = pos
+        self.radius = radius
+
+
+class ReconTarget(Target):
+    """
+    A target with 'recon' type.
+    """
+    __slots__ = Target.__slots__ + [
+        'requires_landing', 'pos', 'radius', 'object',
+    ]
+
+    def __init__(self, type, priority, in_sleep_mode, delay,
+                 requires_landing, pos, radius, object=None):
+        super(ReconTarget, self).__init__(
+            type, priority, in_sleep_mode, delay,
+        )
+        self.requires_landing = requires_landing
+        self.pos = pos
+        self.radius = radius
+        self.object = object
+
+
 class TargetSectionParser(CollectingParser):
     """
     Parses ``Target`` section.
     View :ref:`detailed description <target-section>`.
     """
+    input_name = "Target"
+    visitor_method = 'on_target'
+    tokenized = True
 
     def check_section_name(self, section_name):
-        return section_name == "Target"
-
-    def parse_line(self, line):
-        params = line.split()
+        return section_name == self.input_name
 
-        type_code, priority, in_sleep_mode, delay = params[:4]
-        params = params[4:]
+    def parse_tokens(self, tokens):
+        type_code, priority, in_sleep_mode, delay = tokens[:4]
 
         target_type = TargetTypes.get_by_value(int(type_code))
-        target = {
-            'type': target_type,
-            'priority': TargetPriorities.get_by_value(int(priority)),
-            'in_sleep_mode': to_bool(in_sleep_mode),
-            'delay': int(delay),
-        }
+        args = (
+            target_type,
+            TargetPriorities.get_by_value(int(priority)),
+            to_bool(in_sleep_mode),
+            int(delay),
+        )
 
         subparser = self._subparsers.get(target_type)
-        if subparser is not None:
-            target.update(subparser(params))
+        if subparser is None:
+            target = Target(*args)
+        else:
+            target = subparser(args, tokens[4:])
 
-        self.data.append(target)
+        self.collect(target)
 
-    def parse_destroy_or_cover_or_escort(params):
+    def parse_destroy_or_cover_or_escort(args, params):
         """
         Parse extra parameters for targets with type 'destroy' or 'cover' or
         'escort'.
         """
-        destruction_level = to_destruction_level(params[0])
-        pos, waypoint, object_code = params[1:3], params[4], params[5]
-        object_pos = params[6:8]
-        return {
-            'destruction_level': destruction_level,
-            'pos': Point2D(*pos),
-            'object': {
-                'waypoint': int(waypoint),
-                'id': object_code,
-                'pos': Point2D(*object_pos),
-            },
-        }
-
-    def parse_destroy_or_cover_bridge(params):
+        return DestroyTarget(
+            destruction_level=to_destruction_level(params[0]),
+            pos=Point2D(params[1], params[2]),
+            object=TargetObject(
+                id=params[5],
+                pos=Point2D(params[6], params[7]),
+                waypoint=int(params[4]),
+            ),
+            *args
+        )
+
+    def parse_destroy_or_cover_bridge(args, params):
         """
         Parse extra parameters for targets with type 'destroy bridge' or
         'cover bridge'.
         """
-        pos, object_code, object_pos = params[1:3], params[5], params[6:8]
-        return {
-            'pos': Point2D(*pos),
-            'object': {
-                'id': object_code,
-                'pos': Point2D(*object_pos),
-            },
-        }
-
-    def parse_destroy_or_cover_area(params):
+        return BridgeTarget(
+            pos=Point2D(params[1], params[2]),
+            object=TargetObject(
+                id=params[5],
+                pos=Point2D(params[6], params[7]),
+            ),
+            *args
+        )
+
+    def parse_destroy_or_cover_area(args, params):
         """
         Parse extra parameters for targets with type 'destroy area' or
         'cover area'.
         """
-        destruction_level = to_destruction_level(params[0])
-        pos_x, pos_y, radius = params[1:]
-        return {
-            'destruction_level': destruction_level,
-            'pos': Point2D(pos_x, pos_y),
-            'radius': int(radius),
-        }
-
-    def parse_recon(params):
+        destruction_level, pos_x, pos_y, radius = params
+        return AreaTarget(
+            destruction_level=to_destruction_level(destruction_level),
+            pos=Point2D(pos_x, pos_y),
+            radius=int(radius),
+            *args
+        )
+
+    def parse_recon(args, params):
         """
         Parse extra parameters for targets with 'recon' type.
         """
-        requires_landing = params[0] != '500'
-        pos, radius, params = params[1:3], params[3], params[4:]
-        data = {
-            'radius': int(radius),
-            'requires_landing': requires_landing,
-            'pos': Point2D(*pos),
-        }
-        if params:
-            waypoint, object_code = params[:2]
-            object_pos = params[2:]
-            data['object'] = {
-                'waypoint': int(waypoint),
-                'id': object_code,
-                'pos': Point2D(*object_pos),
-            }
-        return data
+        if len(params) > 4:
+            waypoint, object_code = params[4:6]
+            target_object = TargetObject(
+                id=object_code,
+                pos=Point2D(*params[6:]),
+                waypoint=int(waypoint),
+            )
+        else:
+            target_object = None
+
+        return ReconTarget(
+            requires_landing=params[0] != '500',
+            pos=Point2D(params[1], params[2]),
+            radius=int(params[3]),
+            object=target_object,
+            *args
+        )
 
     _subparsers = {
         TargetTypes.destroy: parse_destroy_or_cover_or_escort,
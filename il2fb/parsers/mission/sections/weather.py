@@ -10,13 +10,14 @@ class WeatherSectionParser(ValuesParser):
     Parses ``WEATHER`` section.
     View :ref:`detailed description <weather-section>`.
     """
+    input_name = "WEATHER"
 
     def check_section_name(self, section_name):
         """
         Implements abstract method. See
         :meth:`SectionParser.check_section_name` for semantics.
         """
-        return section_name == "WEATHER"
+        return section_name == self.input_name
 
     def clean(self):
         """
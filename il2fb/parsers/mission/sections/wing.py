@@ -13,6 +13,9 @@ the data.
 
 """
 
+import functools
+import re
+
 from il2fb.commons.flight import Formations, RoutePointTypes
 from il2fb.commons.organization import AirForces
 from il2fb.commons.spatial import Point3D
@@ -23,9 +26,11 @@ from il2fb.parsers.mission.constants import ROUTE_POINT_EXTRA_PARAMETERS_MARK
 from il2fb.parsers.mission.constants import ROUTE_POINT_RADIO_SILENCE_ON
 from il2fb.parsers.mission.constants import ROUTE_POINT_RADIO_SILENCE_OFF
 from il2fb.parsers.mission.converters import to_skill
-from il2fb.parsers.mission.utils import set_if_present
+from il2fb.parsers.mission.raw import make_raw_class
+from il2fb.parsers.mission.utils import lru_cache
 from il2fb.parsers.mission.sections.base import CollectingParser
 from il2fb.parsers.mission.sections.base import ValuesParser
+from il2fb.parsers.mission.structures import DictStructure
 
 
 class FlightSectionParser(CollectingParser):
@@ -33,14 +38,132 @@ class FlightSectionParser(CollectingParser):
     Parses ``Wing`` section.
     View :ref:`detailed description <wing-section>`.
     """
+    input_name = "Wing"
 
     def check_section_name(self, section_name):
-        return section_name == "Wing"
+        return section_name == self.input_name
 
     def clean(self):
         return {'flights': self.data}
 
 
+#: Max number of decomposed names of flight sections kept in cache.
+FLIGHT_SECTION_NAMES_CACHE_SIZE = 1024
+
+_DIGITS = frozenset('0123456789')
+
+_AIR_FORCES_BY_FLIGHT_PREFIX = {
+    air_force.default_flight_prefix: air_force
+    for air_force in AirForces.iterconstants()
+    if air_force.default_flight_prefix is not None
+}
+
+_regiment_code_names = None
+
+
+def _get_regiment_code_names():
+    global _regiment_code_names
+
+    if _regiment_code_names is None:
+        _regiment_code_names = frozenset(
+            regiment.code_name
+            for air_force in AirForces.iterconstants()
+            for regiment in Regiments.filter_by_air_force(air_force)
+        )
+
+    return _regiment_code_names
+
+
+@lru_cache(maxsize=FLIGHT_SECTION_NAMES_CACHE_SIZE)
+def decompose_flight_section_name(section_name):
+    """
+    Split a name of flight section (e.g. ``3GvIAP01``) into parts.
+
+    :param str section_name: a name of section to decompose
+
+    :returns: a tuple of air force, regiment (or ``None``), squadron index and
+              flight index or ``None`` if section name does not belong to a
+              flight
+    :rtype: :class:`tuple`
+    """
+    prefix = section_name[:-2]
+    squadron, flight = section_name[-2:-1], section_name[-1:]
+
+    if squadron not in _DIGITS or flight not in _DIGITS:
+        return None
+
+    air_force = _AIR_FORCES_BY_FLIGHT_PREFIX.get(prefix)
+
+    if air_force is not None:
+        regiment = None
+    elif prefix in _get_regiment_code_names():
+        regiment = Regiments.get_by_code_name(prefix)
+        air_force = regiment.air_force
+    else:
+        return None
+
+    return air_force, regiment, int(squadron), int(flight)
+
+
+class FlightAircraft(DictStructure):
+    """
+    An aircraft of a flight. Skins and ID of spawn object are ``None`` if they
+    are not set.
+    """
+    __slots__ = [
+        'index', 'has_markings', 'skill', 'aircraft_skin', 'nose_art',
+        'pilot_skin', 'spawn_object',
+    ]
+
+    def __init__(self, index, has_markings, skill, aircraft_skin=None,
+                 nose_art=None, pilot_skin=None, spawn_object=None):
+        self.index = index
+        self.has_markings = has_markings
+        self.skill = skill
+        self.aircraft_skin = aircraft_skin
+        self.nose_art = nose_art
+        self.pilot_skin = pilot_skin
+        self.spawn_object = spawn_object
+
+    def __repr__(self):
+        return "<FlightAircraft '{0}'>".format(self.index)
+
+
+class Flight(DictStructure):
+    """
+    A flight defined in ``Wing`` section. ``route`` is attached by mission
+    parser from ``N_Way`` section.
+    """
+    __slots__ = [
+        'id', 'air_force', 'regiment', 'squadron_index', 'flight_index',
+        'ai_only', 'code', 'fuel', 'with_parachutes', 'count', 'weapons',
+        'aircrafts', 'route',
+    ]
+
+    #: Flights of default regiments of air forces have no regiment.
+    nullable_keys = ('regiment', )
+
+    def __init__(self, id, air_force, regiment, squadron_index, flight_index,
+                 ai_only, code, fuel, with_parachutes, count, weapons,
+                 aircrafts, route=None):
+        self.id = id
+        self.air_force = air_force
+        self.regiment = regiment
+        self.squadron_index = squadron_index
+        self.flight_index = flight_index
+        self.ai_only = ai_only
+        self.code = code
+        self.fuel = fuel
+        self.with_parachutes = with_parachutes
+        self.count = count
+        self.weapons = weapons
+        self.aircrafts = aircrafts
+        self.route = route
+
+    def __repr__(self):
+        return "<Flight '{0}'>".format(self.id)
+
+
 class FlightInfoSectionParser(ValuesParser):
     """
     Parses settings for a moving flight group.
@@ -48,70 +171,39 @@ class FlightInfoSectionParser(ValuesParser):
     """
 
     def check_section_name(self, section_name):
-        try:
-            self._decompose_section_name(section_name)
-        except Exception:
-            return False
-        else:
-            return True
+        return decompose_flight_section_name(section_name) is not None
 
     def init_parser(self, section_name):
         super(FlightInfoSectionParser, self).init_parser(section_name)
         self.output_key = section_name
-        self.flight_info = self._decompose_section_name(section_name)
-
-    def _decompose_section_name(self, section_name):
-        prefix = section_name[:-2]
-        squadron, flight = section_name[-2:]
-
-        try:
-            regiment = None
-            air_force = AirForces.get_by_flight_prefix(prefix)
-        except ValueError:
-            regiment = Regiments.get_by_code_name(prefix)
-            air_force = regiment.air_force
-
-        return {
-            'id': section_name,
-            'air_force': air_force,
-            'regiment': regiment,
-            'squadron_index': int(squadron),
-            'flight_index': int(flight),
-        }
+        self.flight_info = decompose_flight_section_name(section_name)
 
     def clean(self):
         count = int(self.data['Planes'])
-        code = self.data['Class'].split('.', 1)[1]
-        aircrafts = self._get_aircrafts(count)
-
-        self.flight_info.update({
-            'ai_only': 'OnlyAI' in self.data,
-            'code': code,
-            'fuel': int(self.data['Fuel']),
-            'with_parachutes': 'Parachute' not in self.data,
-            'count': count,
-            'weapons': self.data['weapons'],
-            'aircrafts': aircrafts,
-        })
-
-        return {self.output_key: self.flight_info}
+        code = self.intern(self.data['Class'].split('.', 1)[1])
+        air_force, regiment, squadron_index, flight_index = self.flight_info
+
+        flight = Flight(
+            self.output_key, air_force, regiment, squadron_index, flight_index,
+            'OnlyAI' in self.data, code, int(self.data['Fuel']),
+            'Parachute' not in self.data, count,
+            self.intern(self.data['weapons']), self._get_aircrafts(count),
+        )
+        return {self.output_key: flight}
 
     def _get_aircrafts(self, aircrafts_count):
-        results = []
-
-        for i in range(aircrafts_count):
-            info = {
-                'index': i,
-                'has_markings': self._has_markings(i),
-                'skill': self._get_skill(i),
-            }
-            set_if_present(info, 'aircraft_skin', self._get_skin('skin', i))
-            set_if_present(info, 'nose_art', self._get_skin('nose_art', i))
-            set_if_present(info, 'pilot_skin', self._get_skin('pilot', i))
-            set_if_present(info, 'spawn_object', self._get_spawn_object_id(i))
-            results.append(info)
-
-        return results
+        return [
+            FlightAircraft(
+                i,
+                self._has_markings(i),
+                self._get_skill(i),
+                self._get_skin('skin', i) or None,
+                self._get_skin('nose_art', i) or None,
+                self._get_skin('pilot', i) or None,
+                self._get_spawn_object_id(i) or None,
+            )
+            for i in range(aircrafts_count)
+        ]
 
     def _get_skill(self, aircraft_id):
         if 'Skill' in self.data:
@@ -123,7 +215,8 @@ class FlightInfoSectionParser(ValuesParser):
         return 'numberOn{:}'.format(aircraft_id) not in self.data
 
     def _get_skin(self, prefix, aircraft_id):
-        return self.data.get('{:}{:}'.format(prefix, aircraft_id))
+        skin = self.data.get('{:}{:}'.format(prefix, aircraft_id))
+        return skin and self.intern(skin)
 
     def _get_spawn_object_id(self, aircraft_id):
         return self.data.get('spawn{:}'.format(aircraft_id))
@@ -190,13 +283,45 @@ class FlightRouteAttackPoint(FlightRoutePoint):
         self.target_route_point = target_route_point
 
 
+#: Getters of fields of route points which are converted on first access in
+#: raw mode. Other fields are needed to choose a class of a point, so they are
+#: converted during parsing.
+RAW_FLIGHT_ROUTE_POINT_GETTERS = {
+    'pos': lambda tokens: Point3D(*tokens[1:4]),
+    'speed': lambda tokens: float(tokens[4]),
+}
+
+RawFlightRoutePoint = make_raw_class(
+    FlightRoutePoint, RAW_FLIGHT_ROUTE_POINT_GETTERS,
+)
+RawFlightRouteTakeoffPoint = make_raw_class(
+    FlightRouteTakeoffPoint, RAW_FLIGHT_ROUTE_POINT_GETTERS,
+)
+RawFlightRoutePatrolPoint = make_raw_class(
+    FlightRoutePatrolPoint, RAW_FLIGHT_ROUTE_POINT_GETTERS,
+)
+RawFlightRouteAttackPoint = make_raw_class(
+    FlightRouteAttackPoint, RAW_FLIGHT_ROUTE_POINT_GETTERS,
+)
+
+RAW_FLIGHT_ROUTE_POINT_CLASSES = {
+    FlightRoutePoint: RawFlightRoutePoint,
+    FlightRouteTakeoffPoint: RawFlightRouteTakeoffPoint,
+    FlightRoutePatrolPoint: RawFlightRoutePatrolPoint,
+    FlightRouteAttackPoint: RawFlightRouteAttackPoint,
+}
+
+
 class FlightRouteSectionParser(CollectingParser):
     """
     Parses ``*_Way`` section.
     View :ref:`detailed description <flight-route-section>`.
     """
     input_suffix = "_Way"
+    input_pattern = re.compile(r".+{0}$".format(input_suffix))
     output_prefix = 'flight_route_'
+    visitor_method = 'on_flight_route_point'
+    tokenized = True
 
     def check_section_name(self, section_name):
         return section_name.endswith(self.input_suffix)
@@ -208,62 +333,77 @@ class FlightRouteSectionParser(CollectingParser):
         super(FlightRouteSectionParser, self).init_parser(section_name)
         flight_code = self._extract_flight_code(section_name)
         self.output_key = "{0}{1}".format(self.output_prefix, flight_code)
+
+        if self.visitor is not None:
+            self.collect = functools.partial(self.collect, flight_code)
+        self._reset_current_point()
+
+    def _reset_current_point(self):
+        # Values of common fields of route point in order of slots
         self.point = None
+        # Values of fields which are specific for point_class
+        self.point_extra = ()
         self.point_class = None
-
-    def parse_line(self, line):
-        params = line.split()
-        type_code, params = params[0], params[1:]
-        if type_code == ROUTE_POINT_EXTRA_PARAMETERS_MARK:
-            self._parse_options(params)
-        else:
-            self._finalize_current_point()
-            pos, speed, params = params[0:3], params[3], params[4:]
-            self.point = {
-                'type': RoutePointTypes.get_by_value(type_code),
-                'pos': Point3D(*pos),
-                'speed': float(speed),
-            }
-            self._parse_extra(params)
+        self.point_tokens = None
+
+    def parse_tokens(self, tokens):
+        self._parse_tokens_batch((tokens, ))
+
+    def parse_lines(self, lines):
+        self._parse_tokens_batch(line.split() for line in lines)
+
+    def _parse_tokens_batch(self, tokens_batch):
+        parse_options = self._parse_options
+        parse_extra = self._parse_extra
+        finalize_current_point = self._finalize_current_point
+        get_point_type = RoutePointTypes.get_by_value
+        raw = self.raw
+
+        for tokens in tokens_batch:
+            type_code = tokens[0]
+            if type_code == ROUTE_POINT_EXTRA_PARAMETERS_MARK:
+                parse_options(tokens[1:])
+                continue
+
+            finalize_current_point()
+            point_type = get_point_type(type_code)
+            if raw:
+                self.point_tokens = tuple(tokens)
+                pos = speed = None
+            else:
+                pos = Point3D(tokens[1], tokens[2], tokens[3])
+                speed = float(tokens[4])
+            self.point = parse_extra(point_type, pos, speed, tokens[5:])
 
     def _parse_options(self, params):
         try:
             cycles, timeout, angle, side_size, altitude_difference = params
-            self.point.update({
-                'patrol_cycles': int(cycles),
-                'patrol_timeout': int(timeout),
-                'pattern_angle': int(angle),
-                'pattern_side_size': int(side_size),
-                'pattern_altitude_difference': int(altitude_difference),
-            })
+            self.point_extra = (
+                int(cycles), int(timeout), int(angle), int(side_size),
+                int(altitude_difference),
+            )
             self.point_class = FlightRoutePatrolPoint
         except ValueError:
             delay, spacing = params[1:3]
-            self.point.update({
-                'delay': int(delay),
-                'spacing': int(spacing),
-            })
+            self.point_extra = (int(delay), int(spacing))
             self.point_class = FlightRouteTakeoffPoint
 
-    def _parse_extra(self, params):
+    def _parse_extra(self, point_type, pos, speed, params):
         if self._is_new_game_version(params):
             radio_silence, formation, params = self._parse_new_version_extra(params)
             if params:
-                self._parse_target(params)
+                point_type = self._parse_target(point_type, params)
         else:
             radio_silence = False
             formation = None
 
         if (
-            (self.point['type'] is RoutePointTypes.ground_attack) and
+            (point_type is RoutePointTypes.ground_attack) and
             (self.point_class is None)
         ):
             self.point_class = FlightRouteAttackPoint
 
-        self.point.update({
-            'radio_silence': radio_silence,
-            'formation': formation,
-        })
+        return (point_type, pos, speed, formation, radio_silence)
 
     @staticmethod
     def _is_new_game_version(params):
@@ -286,26 +426,29 @@ class FlightRouteSectionParser(CollectingParser):
 
         return radio_silence, formation, params
 
-    def _parse_target(self, params):
+    def _parse_target(self, point_type, params):
         target_id, target_route_point = params[:2]
-
-        self.point.update({
-            'target_id': target_id,
-            'target_route_point': int(target_route_point),
-        })
-
-        if self.point['type'] is RoutePointTypes.normal:
-            self.point['type'] = RoutePointTypes.air_attack
-
+        self.point_extra = (target_id, int(target_route_point))
         self.point_class = FlightRouteAttackPoint
 
+        if point_type is RoutePointTypes.normal:
+            return RoutePointTypes.air_attack
+        return point_type
+
     def clean(self):
         self._finalize_current_point()
         return {self.output_key: self.data}
 
     def _finalize_current_point(self):
         if self.point:
-            point_class = getattr(self, 'point_class') or FlightRoutePoint
-            self.data.append(point_class(**self.point))
-            self.point = None
-            self.point_class = None
+            point_class = self.point_class or FlightRoutePoint
+            args = self.point + self.point_extra
+            if self.raw:
+                values = dict(zip(point_class.__slots__, args))
+                for name in RAW_FLIGHT_ROUTE_POINT_GETTERS:
+                    del values[name]
+                point_class = RAW_FLIGHT_ROUTE_POINT_CLASSES[point_class]
+                self.collect(point_class(self.point_tokens, **values))
+            else:
+                self.collect(point_class(*args))
+            self._reset_current_point()
@@ -0,0 +1,234 @@
+# coding: utf-8
+"""
+Turn different kinds of input into sequences of lines of a mission.
+"""
+
+import bz2
+import contextlib
+import gzip
+import io
+import itertools
+import mmap
+import os
+import six
+
+try:
+    import lzma
+except ImportError:  # Python 2.7 pragma: no cover
+    lzma = None
+
+from il2fb.parsers.mission.constants import MISSION_ENCODING
+
+
+#: Types of objects which contain a whole mission as bytes.
+BYTES_TYPES = (bytearray, memoryview, ) + (() if six.PY2 else (bytes, ))
+
+#: Types of objects which contain a whole mission as bytes and which can be
+#: searched without splitting into lines.
+BUFFER_TYPES = (bytearray, mmap.mmap, ) + (() if six.PY2 else (bytes, ))
+
+
+#: Signatures of compressed files and names of modules which can open them.
+COMPRESSION_FORMATS = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'lzma'),
+)
+
+#: Extensions of compressed files and names of modules which can open them.
+#: Used if a file has no known signature, e.g. legacy ``.lzma`` files.
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'lzma',
+    '.lzma': 'lzma',
+}
+
+
+def detect_compression(path):
+    """
+    Detect compression of a file by its first bytes or by its extension if
+    the first bytes are not a known signature.
+
+    :param str path: a path to a file
+
+    :returns: a name of a module which can decompress the file (``gzip``,
+              ``bz2`` or ``lzma``) or ``None`` if the file is not compressed
+    """
+    with io.open(path, 'rb') as f:
+        head = f.read(6)
+
+    for signature, module_name in COMPRESSION_FORMATS:
+        if head.startswith(signature):
+            return module_name
+
+    extension = os.path.splitext(path)[1].lower()
+    return COMPRESSION_EXTENSIONS.get(extension)
+
+
+def open_compressed(path, module_name):
+    """
+    Open a compressed file for reading. Data is decompressed while it is being
+    read, so memory usage does not depend on size of the file.
+
+    :param str path: a path to a file
+    :param str module_name: a name of a module which is returned by
+                            :func:`detect_compression`
+
+    :returns: a binary file object
+    """
+    if module_name == 'gzip':
+        return gzip.GzipFile(path, 'rb')
+    if module_name == 'bz2':
+        return bz2.BZ2File(path, 'rb')
+    if lzma is None:  # pragma: no cover
+        raise ValueError("xz-compressed files require Python 3.3+")
+    return lzma.LZMAFile(path, 'rb')
+
+
+def is_buffer(obj):
+    """
+    :param obj: an object with mission data
+
+    :returns: `True` if an object contains a whole mission as bytes which can
+              be searched for section headers
+    :rtype: :class:`bool`
+    """
+    return isinstance(obj, BUFFER_TYPES)
+
+
+def is_binary_line(line):
+    """
+    :param line: a line of a mission
+
+    :returns: `True` if a line is given as bytes which must be decoded
+    :rtype: :class:`bool`
+    """
+    return isinstance(line, bytearray) or (
+        not six.PY2 and isinstance(line, bytes)
+    )
+
+
+def peek_lines(lines):
+    """
+    Tell whether a sequence of lines contains bytes or text without losing
+    the first line.
+
+    :param lines: an iterable of lines
+
+    :returns: a tuple of an iterator over the same lines and a flag which
+              tells whether lines are binary
+    :rtype: :class:`tuple`
+    """
+    iterator = iter(lines)
+
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iterator, False
+
+    return itertools.chain((first, ), iterator), is_binary_line(first)
+
+
+@contextlib.contextmanager
+def map_file(path):
+    """
+    Map a file into memory for reading.
+
+    :param str path: a path to a file
+
+    :returns: a context manager which gives an instance of :class:`mmap.mmap`
+              or empty :class:`bytes` if the file is empty (empty files cannot
+              be mapped)
+    """
+    with io.open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield buffer
+        finally:
+            buffer.close()
+
+
+@contextlib.contextmanager
+def open_mission(mission, encoding=MISSION_ENCODING, use_mmap=False):
+    """
+    Get lines of a mission.
+
+    Files are read in binary mode. Files compressed by gzip, bzip2 or xz are
+    detected by their signatures or extensions (see
+    :func:`detect_compression`) and decompressed on the fly. Binary lines
+    are not decoded here: they
+    are decoded by :class:`~il2fb.parsers.mission.context.ParsingContext`
+    only if they belong to sections which are going to be parsed.
+
+    :param mission: a path to a mission file, contents of a mission given as
+                    :class:`bytes`, :class:`bytearray` or
+                    :class:`memoryview`, a file object opened in binary or
+                    text mode or any other iterable of lines
+    :param str encoding: encoding of binary data
+    :param bool use_mmap: tells whether to map a file given by path into
+                          memory instead of reading it. Pages of mapped files
+                          are shared by all processes which parse the same
+                          file. Compressed files are never mapped.
+
+    :returns: a context manager which gives a tuple of an iterable of lines
+              or a buffer (see :func:`is_buffer`) and encoding of lines
+              (``None`` for text lines)
+    """
+    if isinstance(mission, six.string_types):
+        compression = detect_compression(mission)
+        if compression:
+            with contextlib.closing(open_compressed(mission, compression)) as f:
+                yield f, encoding
+        elif use_mmap:
+            with map_file(mission) as buffer:
+                yield buffer, encoding
+        else:
+            with io.open(mission, 'rb') as f:
+                yield f, encoding
+    elif is_buffer(mission):
+        yield mission, encoding
+    elif isinstance(mission, BYTES_TYPES):
+        yield io.BytesIO(mission), encoding
+    else:
+        lines, is_binary = peek_lines(mission)
+        yield lines, (encoding if is_binary else None)
+
+
+@contextlib.contextmanager
+def open_binary(mission, use_mmap=False):
+    """
+    Get binary data of a mission which can be read at any position.
+
+    :param mission: a path to an uncompressed mission file, contents of a
+                    mission given as :class:`bytes`, :class:`bytearray` or
+                    :class:`memoryview` or a seekable binary file object
+    :param bool use_mmap: tells whether to map a file given by path into
+                          memory instead of opening it
+
+    :returns: a context manager which gives a buffer (see :func:`is_buffer`)
+              or a seekable binary file object
+    """
+    if isinstance(mission, six.string_types):
+        if detect_compression(mission):
+            raise ValueError("random access to compressed files is not supported")
+        if use_mmap:
+            with map_file(mission) as buffer:
+                yield buffer
+        else:
+            with io.open(mission, 'rb') as f:
+                yield f
+    elif is_buffer(mission):
+        yield mission
+    elif isinstance(mission, BYTES_TYPES):
+        yield io.BytesIO(mission)
+    elif hasattr(mission, 'seek') and hasattr(mission, 'read'):
+        yield mission
+    else:
+        raise TypeError(
+            "random access requires binary data, got {0}"
+            .format(type(mission).__name__))
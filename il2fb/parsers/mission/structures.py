@@ -0,0 +1,108 @@
+# coding: utf-8
+"""
+Base structures of parsed objects.
+"""
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2.7 pragma: no cover
+    from collections import Mapping
+
+from il2fb.commons.structures import BaseStructure
+
+
+_MISSING = object()
+
+
+class DictStructure(BaseStructure, Mapping):
+    """
+    A slotted structure which can be also accessed as a read-only mapping,
+    e.g. ``target['pos']`` is the same as ``target.pos``.
+
+    Such structures replace dictionaries which were produced by earlier
+    versions of parser. Fields which are set to ``None`` are treated as
+    absent keys, as they were not put into those dictionaries (see
+    :attr:`nullable_keys` for exceptions). Structures are equal to
+    dictionaries with the same keys and values (see :meth:`to_dict`).
+
+    Fields are changed by assigning attributes, not items. Structures are not
+    dictionaries, so use :meth:`to_primitive` to serialize them into JSON.
+    """
+    __slots__ = []
+
+    #: Names of fields which are present as keys even if they are ``None``.
+    nullable_keys = ()
+
+    def __getitem__(self, key):
+        value = self._get_value(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._get_value(key) is not _MISSING
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def _get_value(self, key):
+        if key not in self.__slots__:
+            return _MISSING
+        value = getattr(self, key)
+        if value is None and key not in self.nullable_keys:
+            return _MISSING
+        return value
+
+    def get(self, key, default=None):
+        value = self._get_value(key)
+        return default if value is _MISSING else value
+
+    def keys(self):
+        return [
+            key for key in self.__slots__
+            if self._get_value(key) is not _MISSING
+        ]
+
+    def values(self):
+        return [getattr(self, key) for key in self.keys()]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def to_dict(self):
+        """
+        :returns: a plain dictionary with the same contents. Nested
+                  structures are converted as well.
+        :rtype: :class:`dict`
+        """
+        return {
+            key: self._to_dict(value)
+            for key, value in self.items()
+        }
+
+    def to_primitive(self, context=None):
+        return {
+            key: self._to_primitive(value, context)
+            for key, value in self.items()
+        }
+
+    @classmethod
+    def _to_dict(cls, value):
+        if isinstance(value, DictStructure):
+            return value.to_dict()
+        if isinstance(value, list):
+            return [cls._to_dict(x) for x in value]
+        return value
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return super(DictStructure, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    __hash__ = BaseStructure.__hash__
@@ -1,8 +1,45 @@
 # coding: utf-8
 
+import functools
+import re
+
 from il2fb.parsers.mission.constants import COMMENT_MARKERS
 
 
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2.7 pragma: no cover
+    def lru_cache(maxsize=128):
+        """
+        Simplified replacement of :func:`functools.lru_cache`. Memoizes results
+        of a function of positional arguments and drops all of them when
+        ``maxsize`` is reached.
+        """
+        def decorator(func):
+            cache = {}
+
+            @functools.wraps(func)
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    pass
+
+                if len(cache) >= maxsize:
+                    cache.clear()
+
+                result = cache[args] = func(*args)
+                return result
+
+            return wrapper
+        return decorator
+
+
+_COMMENT_PATTERN = re.compile('|'.join(
+    re.escape(marker) for marker in COMMENT_MARKERS
+))
+
+
 def move_if_present(dst, src, dst_key, src_key=None):
     src_key = src_key or dst_key
     if src_key in src:
@@ -14,8 +51,116 @@ def set_if_present(dst, key, value):
         dst[key] = value
 
 
+def is_section_name(line):
+    return line.startswith('[') and line.endswith(']')
+
+
+def get_section_name(line):
+    return line.strip('[]')
+
+
 def strip_comments(line):
-    for marker in COMMENT_MARKERS:
-        line = line.split(marker, 1)[0]
+    # Checks below mirror COMMENT_MARKERS. Substring checks are much cheaper
+    # than a search by regular expression and almost no line has a comment.
+    if ';' in line or '#' in line or '//' in line or '--' in line:
+        line = line[:_COMMENT_PATTERN.search(line).start()]
 
     return line.strip()
+
+
+def _tokenize_pattern(pattern):
+    """
+    Split a shell-style pattern into tokens. Each token is either ``None``
+    for ``*`` or a pair of a set of characters and a flag which tells whether
+    the set is negated. ``?`` is an empty negated set.
+    """
+    tokens = []
+    i, n = 0, len(pattern)
+
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == '*':
+            if not tokens or tokens[-1] is not None:
+                tokens.append(None)
+        elif c == '?':
+            tokens.append((frozenset(), True))
+        elif c == '[' and _find_set_end(pattern, i) < n:
+            j = _find_set_end(pattern, i)
+            chars = pattern[i:j]
+            i = j + 1
+            negated = chars.startswith('!')
+            if negated:
+                chars = chars[1:]
+            members = set()
+            k = 0
+            while k < len(chars):
+                if k + 2 < len(chars) and chars[k + 1] == '-':
+                    members.update(
+                        chr(x) for x in range(ord(chars[k]), ord(chars[k + 2]) + 1)
+                    )
+                    k += 3
+                else:
+                    members.add(chars[k])
+                    k += 1
+            tokens.append((frozenset(members), negated))
+        else:
+            tokens.append((frozenset(c), False))
+
+    return tokens
+
+
+def _find_set_end(pattern, start):
+    # Mirrors fnmatch.translate(): "!" and "]" right after "[" are a part of
+    # a set.
+    j = start
+    if j < len(pattern) and pattern[j] == '!':
+        j += 1
+    if j < len(pattern) and pattern[j] == ']':
+        j += 1
+    while j < len(pattern) and pattern[j] != ']':
+        j += 1
+    return j
+
+
+def _chars_overlap(a, b):
+    (a_chars, a_negated), (b_chars, b_negated) = a, b
+    if a_negated and b_negated:
+        return True
+    if a_negated:
+        return bool(b_chars - a_chars)
+    if b_negated:
+        return bool(a_chars - b_chars)
+    return bool(a_chars & b_chars)
+
+
+def patterns_overlap(a, b):
+    """
+    Tell whether two shell-style patterns (see :mod:`fnmatch`) can match the
+    same string.
+
+    :param str a: a pattern
+    :param str b: another pattern
+
+    :rtype: :class:`bool`
+    """
+    a, b = _tokenize_pattern(a), _tokenize_pattern(b)
+    cache = {}
+
+    def overlap(i, j):
+        if (i, j) in cache:
+            return cache[i, j]
+
+        if i == len(a) or j == len(b):
+            result = all(token is None for token in a[i:] + b[j:])
+        elif a[i] is None:
+            result = overlap(i + 1, j) or overlap(i, j + 1)
+        elif b[j] is None:
+            result = overlap(i, j + 1) or overlap(i + 1, j)
+        else:
+            result = _chars_overlap(a[i], b[j]) and overlap(i + 1, j + 1)
+
+        cache[i, j] = result
+        return result
+
+    return overlap(0, 0)
@@ -0,0 +1,84 @@
+# coding: utf-8
+
+
+class MissionVisitor(object):
+    """
+    Receives objects parsed from collection sections of a mission instead of
+    keeping them in memory.
+
+    Redefine methods for objects you are interested in and pass an instance
+    of visitor to :meth:`~il2fb.parsers.mission.MissionParser.parse`. Objects
+    passed to visitor are not included into the result of parsing.
+
+    **Example**:
+
+    .. code-block:: python
+
+       class BuildingsCounter(MissionVisitor):
+           count = 0
+
+           def on_building(self, building):
+               self.count += 1
+
+       counter = BuildingsCounter()
+       MissionParser().parse("path/to/mission.mis", visitor=counter)
+
+    """
+
+    def on_moving_unit(self, unit):
+        """
+        :param unit: an instance of
+                     :class:`~il2fb.parsers.mission.sections.chiefs.MovingUnit`
+        """
+
+    def on_route_point(self, unit_id, point):
+        """
+        :param str unit_id: ID of a moving unit (e.g. ``0_Chief``)
+        :param point: an instance of
+                      :class:`~il2fb.parsers.mission.sections.chiefs.GroundRoutePoint`
+        """
+
+    def on_stationary_object(self, obj):
+        """
+        :param obj: an instance of
+                    :class:`~il2fb.parsers.mission.sections.nstationary.StationaryObject`
+                    or of its subclasses
+        """
+
+    def on_building(self, building):
+        """
+        :param building: an instance of
+                         :class:`~il2fb.parsers.mission.sections.buildings.Building`
+        """
+
+    def on_target(self, target):
+        """
+        :param target: an instance of a subclass of
+                       :class:`~il2fb.parsers.mission.sections.target.Target`
+        """
+
+    def on_static_camera(self, camera):
+        """
+        :param camera: an instance of
+                       :class:`~il2fb.parsers.mission.sections.static_camera.StaticCamera`
+        """
+
+    def on_front_marker(self, marker):
+        """
+        :param marker: an instance of
+                       :class:`~il2fb.parsers.mission.sections.front_marker.FrontMarker`
+        """
+
+    def on_rocket(self, rocket):
+        """
+        :param rocket: an instance of
+                       :class:`~il2fb.parsers.mission.sections.rocket.Rocket`
+        """
+
+    def on_flight_route_point(self, flight_id, point):
+        """
+        :param str flight_id: ID of a flight (e.g. ``r0100``)
+        :param point: an instance of
+                      :class:`~il2fb.parsers.mission.sections.wing.FlightRoutePoint`
+                      or of its subclasses
+        """
@@ -0,0 +1,66 @@
+# coding: utf-8
+"""
+Time consumption of parsing large sections line-by-line and by passing all
+lines of a section to its parser at once.
+
+Usage::
+
+    python benchmark_batches.py
+
+"""
+
+import timeit
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.context import ParsingContext
+
+from generators import (
+    CYCLES_COUNT, generate_buildings_lines, generate_nstationary_lines,
+    generate_cheif_road_lines, generate_flight_route_lines,
+)
+
+
+REPEATS = 5
+
+SECTIONS = [
+    ("Buildings", generate_buildings_lines),
+    ("NStationary", generate_nstationary_lines),
+    ("0_Chief_Road", generate_cheif_road_lines),
+    ("r0100_Way", generate_flight_route_lines),
+]
+
+
+class LineByLineParsingContext(ParsingContext):
+    """
+    Passes lines to section parsers one-by-one, as it was done before.
+    """
+
+    def _use_parser(self, parser, section_name):
+        super(LineByLineParsingContext, self)._use_parser(parser, section_name)
+        self.takes_lines = False
+
+
+def benchmark(context_class, lines):
+    mission_parser = MissionParser()
+
+    def parse():
+        context = context_class(mission_parser)
+        context.process_lines(lines)
+        return context.finish()
+
+    return min(timeit.repeat(parse, number=1, repeat=REPEATS))
+
+
+if __name__ == '__main__':
+    print("Lines per section: {0}".format(CYCLES_COUNT))
+
+    for section_name, generator in SECTIONS:
+        lines = ["[{0}]".format(section_name), ]
+        lines.extend("  {0}".format(line) for line in generator())
+
+        before = benchmark(LineByLineParsingContext, lines)
+        after = benchmark(ParsingContext, lines)
+
+        print("{0}: {1:.3f} s line-by-line, {2:.3f} s at once, {3:.2f}x".format(
+            section_name, before, after, before / after,
+        ))
@@ -0,0 +1,87 @@
+# coding: utf-8
+"""
+Memory consumption of a parsed mission with 500k objects with and without
+interning of repeated strings.
+
+Requires Python 3.4+ (uses :mod:`tracemalloc`).
+
+Usage::
+
+    python benchmark_interning.py
+
+"""
+
+import gc
+import itertools
+import tracemalloc
+
+from il2fb.parsers.mission import MissionParser
+
+
+BUILDINGS_COUNT = 250000
+STATIONARY_COUNT = 150000
+ROCKETS_COUNT = 100000
+
+BUILDING_CODES = [
+    "House$Tent_Pyramid_US", "House$Barn_Big", "House$Hangar_Big_USA",
+]
+STATIONARY_OBJECTS = [
+    "vehicles.planes.Plane$I_16TYPE24 1 {0}.00 {0}.00 360.00 0.0 null 2 1.0 I-16type24_G1_RoW3.bmp 1",
+    "vehicles.planes.Plane$FW_190A4FR 2 {0}.00 {0}.00 265.00 0.0 de 1 1.0 FW190A4_JG2.bmp 0",
+    "vehicles.artillery.Artillery$Flak18_37mm 2 {0}.00 {0}.00 360.00 0.0 0",
+    "ships.Ship$G5 1 {0}.00 {0}.00 360.00 0.0 60 3 1.4",
+]
+
+
+class NoInterning(dict):
+    """
+    A table which does not intern anything.
+    """
+
+    def setdefault(self, key, default=None):
+        return default
+
+
+def generate_mission_lines():
+    codes = itertools.cycle(BUILDING_CODES)
+    objects = itertools.cycle(STATIONARY_OBJECTS)
+
+    yield "[Buildings]"
+    for i in range(BUILDINGS_COUNT):
+        yield "  {0}_bld {1} 1 {0}.00 {0}.00 360.00".format(i, next(codes))
+
+    yield "[NStationary]"
+    for i in range(STATIONARY_COUNT):
+        yield "  {0}_Static {1}".format(i, next(objects).format(i))
+
+    yield "[Rocket]"
+    for i in range(ROCKETS_COUNT):
+        yield "  {0}_Rocket Fi103_V1_ramp 2 {0}.00 {0}.00 360.00 60.0 10 80.0".format(i)
+
+
+def measure(lines, strings):
+    parser = MissionParser()
+    gc.collect()
+    tracemalloc.start()
+    mission = parser.parse_stream(lines, strings=strings)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del mission
+    return size
+
+
+if __name__ == '__main__':
+    lines = list(generate_mission_lines())
+
+    before = measure(lines, NoInterning())
+    after = measure(lines, None)
+
+    print("Objects: {0}".format(
+        BUILDINGS_COUNT + STATIONARY_COUNT + ROCKETS_COUNT
+    ))
+    for title, value in [("Without interning", before), ("With interning", after)]:
+        print("{0}: {1:.1f} MiB".format(title, value / 2 ** 20))
+    print("Saved: {0:.1f} MiB ({1:.0%})".format(
+        (before - after) / 2 ** 20, 1 - after / before,
+    ))
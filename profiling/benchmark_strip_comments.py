@@ -0,0 +1,93 @@
+# coding: utf-8
+"""
+Time consumption of comments stripping on a mission of 1M lines.
+
+Usage::
+
+    python benchmark_strip_comments.py
+
+"""
+
+import itertools
+import timeit
+
+from six.moves import range
+
+from il2fb.parsers.mission.constants import COMMENT_MARKERS
+from il2fb.parsers.mission.utils import strip_comments
+
+from generators import (
+    generate_cheif_road_lines, generate_nstationary_lines,
+    generate_buildings_lines, generate_target_lines,
+    generate_born_place_lines, generate_static_camera_lines,
+    generate_front_marker_lines, generate_rocket_lines,
+    generate_flight_route_lines,
+)
+
+
+LINES_COUNT = 10 ** 6
+
+#: Every N-th line gets a comment.
+COMMENTS_FREQUENCY = 100
+
+REPEATS = 5
+
+
+def strip_comments_by_splitting(line):
+    """
+    Previous implementation of
+    :func:`~il2fb.parsers.mission.utils.strip_comments`.
+    """
+    for marker in COMMENT_MARKERS:
+        line = line.split(marker, 1)[0]
+
+    return line.strip()
+
+
+def generate_mission_lines():
+    generators = [
+        generate_cheif_road_lines, generate_nstationary_lines,
+        generate_buildings_lines, generate_target_lines,
+        generate_born_place_lines, generate_static_camera_lines,
+        generate_front_marker_lines, generate_rocket_lines,
+        generate_flight_route_lines,
+    ]
+    lines = itertools.cycle(itertools.chain.from_iterable(
+        generator() for generator in generators
+    ))
+    markers = itertools.cycle(COMMENT_MARKERS)
+
+    for i in range(LINES_COUNT):
+        line = "  {0}\n".format(next(lines))
+        if i % COMMENTS_FREQUENCY == 0:
+            line = "{0} {1} comment\n".format(line.rstrip(), next(markers))
+        yield line
+
+
+def benchmark(func, lines):
+    return min(timeit.repeat(
+        lambda: [func(line) for line in lines],
+        number=1,
+        repeat=REPEATS,
+    ))
+
+
+if __name__ == '__main__':
+    lines = list(generate_mission_lines())
+
+    assert (
+        [strip_comments(line) for line in lines] ==
+        [strip_comments_by_splitting(line) for line in lines]
+    )
+
+    before = benchmark(strip_comments_by_splitting, lines)
+    after = benchmark(strip_comments, lines)
+
+    print("Lines: {0}, with comments: {1}".format(
+        LINES_COUNT, LINES_COUNT // COMMENTS_FREQUENCY,
+    ))
+    for title, value in [("Before", before), ("After", after)]:
+        print("{0}: {1:.3f} s total, {2:.1f} ns per line".format(
+            title, value, value * 10 ** 9 / LINES_COUNT,
+        ))
+    print("Speedup: {0:.2f}x".format(before / after))
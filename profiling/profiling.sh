@@ -23,4 +23,28 @@ kernprof -l $MODULE > /dev/null
 python -m line_profiler "${MODULE}.lprof"
 rm -f "${MODULE}.lprof"
 
+echo ""
+echo "+------------------------------+"
+echo "| Benchmarking comments strip  |"
+echo "+------------------------------+"
+echo ""
+
+python benchmark_strip_comments.py
+
+echo ""
+echo "+------------------------------+"
+echo "| Benchmarking lines batches   |"
+echo "+------------------------------+"
+echo ""
+
+python benchmark_batches.py
+
+echo ""
+echo "+------------------------------+"
+echo "| Benchmarking interning       |"
+echo "+------------------------------+"
+echo ""
+
+python benchmark_interning.py
+
 cd - > /dev/null
@@ -55,6 +55,11 @@ setup(
         'il2fb.parsers',
     ],
     include_package_data=True,
+    entry_points={
+        'console_scripts': [
+            'il2fb-mission-parser = il2fb.parsers.mission.cli:main',
+        ],
+    },
     install_requires=REQUIREMENTS,
     dependency_links=DEPENDENCIES,
     classifiers=[
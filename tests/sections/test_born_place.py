@@ -7,7 +7,8 @@ from il2fb.commons.spatial import Point2D
 
 from il2fb.parsers.mission.sections.born_place import (
     BornPlaceSectionParser, BornPlaceAirForcesSectionParser,
-    BornPlaceAircraftsSectionParser,
+    BornPlaceAircraftsSectionParser, HomeBase, HomeBaseAirSpawnConditions,
+    HomeBaseRadar,
 )
 
 from .mixins import SectionParserTestCaseMixin
@@ -66,6 +67,47 @@ class BornPlaceSectionParserTestCase(SectionParserTestCaseMixin, unittest.TestCa
         }
         self.assertParser(BornPlaceSectionParser, 'BornPlace', lines, expected)
 
+    def test_structures(self):
+        lines = [
+            "1 3000 121601 74883 1 1000 200 0 0 0 5000 50 0 1 1 0 0 3.8 1 0 0 0 0",
+        ]
+        parser = BornPlaceSectionParser()
+        parser.start('BornPlace')
+        parser.parse_lines(lines)
+        home_base = parser.stop()['home_bases'][0]
+
+        self.assertIsInstance(home_base, HomeBase)
+        self.assertIsInstance(home_base.radar, HomeBaseRadar)
+        self.assertIsInstance(
+            home_base.spawning.in_air.conditions, HomeBaseAirSpawnConditions,
+        )
+        self.assertEqual(home_base.spawning.in_air.height, 1000)
+        self.assertEqual(home_base['spawning']['in_air']['height'], 1000)
+        self.assertIsNone(home_base.spawning.allowed_air_forces)
+        self.assertNotIn('allowed_air_forces', home_base.spawning)
+
+        primitive = home_base.to_dict()
+        self.assertIs(type(primitive['spawning']['in_air']), dict)
+        self.assertEqual(primitive, home_base)
+
+        self.assertEqual(
+            list(home_base),
+            [
+                'range', 'belligerent', 'show_default_icon', 'friction',
+                'spawning', 'radar', 'pos',
+            ],
+        )
+        self.assertEqual(len(home_base), 7)
+        self.assertEqual(len(home_base.spawning), 6)
+        self.assertEqual(dict(home_base.radar), primitive['radar'])
+
+        primitive = home_base.to_primitive()
+        self.assertNotIn('allowed_air_forces', primitive['spawning'])
+        self.assertNotIn(
+            'allowed_aircrafts', primitive['spawning']['aircraft_limitations'],
+        )
+        self.assertEqual(primitive['belligerent'], Belligerents.red.to_primitive())
+
 
 class BornPlaceAirForcesSectionParserTestCase(SectionParserTestCaseMixin, unittest.TestCase):
     """
@@ -7,7 +7,7 @@ from il2fb.commons.organization import Belligerents
 from il2fb.commons.spatial import Point2D
 
 from il2fb.parsers.mission.sections.chiefs import (
-    ChiefsSectionParser, ChiefRoadSectionParser, GroundRoutePoint,
+    ChiefsSectionParser, ChiefRoadSectionParser, GroundRoutePoint, MovingUnit,
 )
 
 from ..mixins import StructureTestCaseMixin
@@ -77,6 +77,30 @@ class ChiefsSectionParserTestCase(
         self.assertParser(ChiefsSectionParser, 'Chiefs', lines, expected)
 
 
+class MovingUnitTestCase(StructureTestCaseMixin, unittest.TestCase):
+
+    def test_valid_data(self):
+        data = dict(
+            id='0_Chief',
+            code='Tank_T34_76_41',
+            type=UnitTypes.armor,
+            belligerent=Belligerents.red,
+        )
+        self.assertStructure(MovingUnit, **data)
+
+        instance = MovingUnit(**data)
+        self.assertEqual(repr(instance), "<MovingUnit '0_Chief'>")
+        self.assertNotIn('skill', instance)
+        self.assertEqual(instance, data)
+        self.assertEqual(list(instance), ['id', 'code', 'type', 'belligerent', ])
+        self.assertEqual(len(instance), 4)
+        self.assertEqual(dict(instance), data)
+
+        instance.skill = Skills.average
+        self.assertEqual(len(instance), 5)
+        self.assertEqual(instance.values()[-1], Skills.average)
+
+
 class GroundRoutePointTestCase(StructureTestCaseMixin, unittest.TestCase):
 
     def test_valid_data(self):
@@ -33,6 +33,110 @@ class SectionParserTestCase(unittest.TestCase):
     def test_stop_with_failure(self):
         self.assertRaises(RuntimeError, self.parser.stop)
 
+    def test_strings_are_reset_on_start(self):
+        self.parser.start("foo")
+        self.parser.intern("bar")
+        self.parser.stop()
+
+        self.parser.start("foo")
+        self.assertEqual(self.parser.strings, {})
+
+    def test_shared_strings(self):
+        strings = {}
+        self.parser.shared_strings = strings
+
+        self.parser.start("foo")
+        self.parser.intern("bar")
+        self.parser.stop()
+
+        self.parser.start("foo")
+        self.assertIs(self.parser.strings, strings)
+        self.assertEqual(strings, {'bar': 'bar', })
+
+    def test_parse_tokens_is_passed_to_parse_line(self):
+
+        class Parser(self.Parser):
+
+            def parse_line(self, line):
+                self.data = line
+
+        parser = Parser()
+        parser.start("foo")
+        parser.parse_tokens(["foo", "bar", ])
+        self.assertEqual(parser.stop(), "foo bar")
+
+    def test_parse_line_is_passed_to_parse_tokens(self):
+
+        class Parser(SectionParser):
+            tokenized = True
+
+            def check_section_name(self, section_name):
+                return True
+
+            def init_parser(self, section_name):
+                pass
+
+            def parse_tokens(self, tokens):
+                self.data = tokens
+
+        parser = Parser()
+        parser.start("foo")
+        parser.parse_line("  foo   bar ")
+        self.assertEqual(parser.stop(), ["foo", "bar", ])
+
+    def test_parse_without_implementation(self):
+
+        class Parser(SectionParser):
+
+            def check_section_name(self, section_name):
+                return True
+
+            def init_parser(self, section_name):
+                pass
+
+        self.assertRaises(TypeError, Parser)
+
+        class TokenizedParser(Parser):
+            tokenized = True
+
+        self.assertRaises(TypeError, TokenizedParser)
+
+
+    def test_parse_line_of_subclass_of_tokenized_parser(self):
+
+        class TokenizedParser(CollectingParser):
+            tokenized = True
+
+            def check_section_name(self, section_name):
+                return True
+
+            def parse_tokens(self, tokens):
+                self.collect(tokens)
+
+            def parse_lines(self, lines):
+                for line in lines:
+                    self.parse_tokens(line.split())
+
+        class Parser(TokenizedParser):
+
+            def parse_line(self, line):
+                self.collect(line.upper())
+
+        class ExplicitlyTokenizedParser(TokenizedParser):
+            tokenized = True
+
+            def parse_line(self, line):
+                self.collect(line.upper())
+
+        self.assertTrue(TokenizedParser.tokenized)
+        self.assertFalse(Parser.tokenized)
+        self.assertTrue(ExplicitlyTokenizedParser.tokenized)
+
+        parser = Parser()
+        parser.start("foo")
+        parser.parse_lines(["foo bar", "baz", ])
+        self.assertEqual(parser.stop(), ["FOO BAR", "BAZ", ])
+
 
 class ValuesParserTestCase(SectionParserTestCaseMixin, unittest.TestCase):
 
@@ -72,3 +176,21 @@ class CollectingParserTestCase(SectionParserTestCaseMixin, unittest.TestCase):
             "two second",
         ]
         self.assertParser(self.Parser, None, lines, expected)
+
+    def test_tokenized_parser(self):
+
+        class Parser(self.Parser):
+            tokenized = True
+
+            def parse_tokens(self, tokens):
+                self.collect(tokens)
+
+        lines = [
+            "one  first",
+            "two second",
+        ]
+        expected = [
+            ["one", "first", ],
+            ["two", "second", ],
+        ]
+        self.assertParser(Parser, None, lines, expected)
@@ -5,7 +5,10 @@ import unittest
 from il2fb.commons.spatial import Point2D
 from il2fb.commons.targets import TargetTypes, TargetPriorities
 
-from il2fb.parsers.mission.sections.target import TargetSectionParser
+from il2fb.parsers.mission.sections.target import (
+    TargetSectionParser, TargetObject, DestroyTarget, BridgeTarget, AreaTarget,
+    ReconTarget,
+)
 
 from .mixins import SectionParserTestCaseMixin
 
@@ -229,3 +232,29 @@ class TargetSectionParserTestCase(SectionParserTestCaseMixin, unittest.TestCase)
             ],
         }
         self.assertParser(TargetSectionParser, 'Target', lines, expected)
+
+    def test_target_structures(self):
+        """
+        Test classes of targets and target objects.
+        """
+        lines = [
+            "0 0 0 0 500 90939 91871 0 1 10_Chief 91100 91500",
+            "1 1 1 60 750 133960 87552 1350",
+            "2 2 1 30 500 135786 84596 0 0  Bridge84 135764 84636",
+            "3 1 1 50 500 133978 87574 1150",
+        ]
+        parser = TargetSectionParser()
+        parser.start('Target')
+        for line in lines:
+            parser.parse_line(line)
+        targets = parser.stop()['targets']
+
+        self.assertEqual(
+            [type(target) for target in targets],
+            [DestroyTarget, AreaTarget, BridgeTarget, ReconTarget, ],
+        )
+        self.assertIsInstance(targets[0].object, TargetObject)
+        self.assertEqual(targets[0].object.waypoint, 1)
+        self.assertIsNone(targets[2].object.waypoint)
+        self.assertIsNone(targets[3].object)
+        self.assertFalse(hasattr(targets[0], '__dict__'))
@@ -11,7 +11,8 @@ from il2fb.regiments import Regiments
 from il2fb.parsers.mission.sections.wing import (
     FlightSectionParser, FlightInfoSectionParser, FlightRouteSectionParser,
     FlightRoutePoint, FlightRouteTakeoffPoint, FlightRouteAttackPoint,
-    FlightRoutePatrolPoint,
+    FlightRoutePatrolPoint, Flight, FlightAircraft,
+    decompose_flight_section_name,
 )
 
 from ..mixins import StructureTestCaseMixin
@@ -130,6 +131,81 @@ class FlightInfoSectionParserTestCase(SectionParserTestCaseMixin, unittest.TestC
     def test_invalid_section_name(self):
         p = FlightInfoSectionParser()
         self.assertFalse(p.check_section_name("Something unknown"))
+        self.assertFalse(p.check_section_name("BornPlace10"))
+        self.assertFalse(p.check_section_name("r01XX"))
+        self.assertFalse(p.check_section_name("0"))
+        self.assertFalse(p.check_section_name(""))
+
+
+class DecomposeFlightSectionNameTestCase(unittest.TestCase):
+
+    def test_air_force_prefix(self):
+        self.assertEqual(
+            decompose_flight_section_name('g0112'),
+            (AirForces.luftwaffe, None, 1, 2),
+        )
+
+    def test_regiment_code_name(self):
+        self.assertEqual(
+            decompose_flight_section_name('3GvIAP01'),
+            (AirForces.vvs_rkka, Regiments.get_by_code_name('3GvIAP'), 0, 1),
+        )
+
+    def test_unknown_prefix(self):
+        self.assertIsNone(decompose_flight_section_name('0_Chief_Road'))
+        self.assertIsNone(decompose_flight_section_name('XXXXXX00'))
+
+
+class FlightAircraftTestCase(StructureTestCaseMixin, unittest.TestCase):
+
+    def test_valid_data(self):
+        data = dict(
+            index=0,
+            has_markings=True,
+            skill=Skills.veteran,
+            aircraft_skin="Funky.bmp",
+            spawn_object='0_Static',
+        )
+        self.assertStructure(FlightAircraft, **data)
+
+        instance = FlightAircraft(**data)
+        self.assertEqual(repr(instance), "<FlightAircraft '0'>")
+        self.assertIsNone(instance.pilot_skin)
+        self.assertNotIn('pilot_skin', instance)
+        self.assertEqual(instance, data)
+
+
+class FlightTestCase(StructureTestCaseMixin, unittest.TestCase):
+
+    def test_valid_data(self):
+        data = dict(
+            id='r0100',
+            air_force=AirForces.vvs_rkka,
+            regiment=None,
+            squadron_index=0,
+            flight_index=0,
+            ai_only=False,
+            code='A_20C',
+            fuel=100,
+            with_parachutes=True,
+            count=1,
+            weapons='default',
+            aircrafts=[
+                FlightAircraft(index=0, has_markings=True, skill=Skills.ace),
+            ],
+        )
+        self.assertStructure(Flight, **data)
+
+        instance = Flight(**data)
+        self.assertEqual(repr(instance), "<Flight 'r0100'>")
+        self.assertIsInstance(instance.aircrafts[0], FlightAircraft)
+        self.assertEqual(list(instance), list(Flight.__slots__[:-1]))
+        self.assertEqual(len(instance), 12)
+        self.assertEqual(dict(instance), data)
+
+        aircraft = instance.aircrafts[0]
+        self.assertEqual(list(aircraft), ['index', 'has_markings', 'skill', ])
+        self.assertEqual(len(aircraft), 3)
 
 
 class FlightRoutePointTestCase(StructureTestCaseMixin, unittest.TestCase):
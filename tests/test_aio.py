@@ -0,0 +1,199 @@
+# coding: utf-8
+
+import asyncio
+import datetime
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.aio import AsyncMissionParser, LinesBatches
+
+
+LINES = [
+    "[MAIN]",
+    "  MAP Moscow/sload.ini",
+    "  TIME 11.75",
+    "  CloudType 1",
+    "  CloudHeight 1500.0",
+    "  army 1",
+    "  playerNum 0",
+    "[SEASON]",
+    "  Year 1942",
+    "  Month 8",
+    "  Day 25",
+    "[Chiefs]",
+    "  0_Chief Armor.1-BT7 2",
+    "[0_Chief_Road]",
+    "  21380.02 41700.34 120.00 10 3 3.055555582046509",
+    "  21500.00 41700.00 120.00",
+]
+
+
+class AsyncLines(object):
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        try:
+            return next(self._lines)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class ImmediateLines(AsyncLines):
+    """
+    Never gives control back to event loop by itself.
+    """
+
+    async def __anext__(self):
+        try:
+            return next(self._lines)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncTestCaseMixin(object):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_until_complete(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+
+class LinesBatchesTestCase(AsyncTestCaseMixin, unittest.TestCase):
+
+    def test_batches(self):
+
+        async def collect():
+            batches = LinesBatches(AsyncLines([b"a", "b", b"c"]), 'cp1251', 2)
+            return [batch async for batch in batches]
+
+        self.assertEqual(
+            self.run_until_complete(collect()),
+            [(['a', 'b', ], 0), (['c', ], 2)],
+        )
+
+    def test_empty(self):
+
+        async def collect():
+            batches = LinesBatches(AsyncLines([]), 'cp1251', 2)
+            return [batch async for batch in batches]
+
+        self.assertEqual(self.run_until_complete(collect()), [])
+
+
+class AsyncMissionParserTestCase(AsyncTestCaseMixin, unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        super(AsyncMissionParserTestCase, self).setUp()
+        self.parser = AsyncMissionParser()
+        self.expected = MissionParser().parse(LINES)
+
+    def test_parse_async(self):
+        result = self.run_until_complete(
+            self.parser.parse_async(AsyncLines(LINES), batch_size=3)
+        )
+        self.assertEqual(result, self.expected)
+
+    def test_parse_async_stream_reader(self):
+
+        async def parse():
+            reader = asyncio.StreamReader()
+            reader.feed_data("\r\n".join(LINES).encode('cp1251'))
+            reader.feed_eof()
+            return await self.parser.parse_async(reader)
+
+        self.assertEqual(self.run_until_complete(parse()), self.expected)
+
+    def test_parse_async_gives_control_to_loop(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def parse():
+            ticker = asyncio.ensure_future(tick())
+            lines = [
+                "[SEASON]",
+                "  Year 1942",
+                "  Month 8",
+                "  Day 25",
+            ]
+            try:
+                return await self.parser.parse_async(ImmediateLines(lines), batch_size=1)
+            finally:
+                ticker.cancel()
+
+        result = self.run_until_complete(parse())
+
+        self.assertEqual(
+            result,
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+        self.assertGreaterEqual(len(ticks), 3)
+
+    def test_parse_in_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = self.run_until_complete(self.parser.parse_in_executor(
+                AsyncLines(LINES), batch_size=2, executor=executor,
+                loop=self.loop,
+            ))
+        self.assertEqual(result, self.expected)
+
+    def test_parse_in_executor_sync_source(self):
+        result = self.run_until_complete(self.parser.parse_in_executor(
+            LINES, loop=self.loop,
+        ))
+        self.assertEqual(result, self.expected)
+
+    def test_parse_in_executor_without_loop(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = self.run_until_complete(self.parser.parse_in_executor(
+                AsyncLines(LINES), batch_size=2, executor=executor,
+            ))
+        self.assertEqual(result, self.expected)
+
+    def test_parse_in_executor_waits_for_pending_batch_on_error(self):
+        futures = []
+
+        class SlowExecutor(ThreadPoolExecutor):
+
+            def submit(self, fn, *args, **kwargs):
+                def run():
+                    time.sleep(0.1)
+                    return fn(*args, **kwargs)
+
+                future = super(SlowExecutor, self).submit(run)
+                futures.append(future)
+                return future
+
+        class FailingLines(AsyncLines):
+
+            async def __anext__(self):
+                line = await super(FailingLines, self).__anext__()
+                if line == "[SEASON]":
+                    raise ValueError("connection is lost")
+                return line
+
+        with SlowExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                self.run_until_complete(self.parser.parse_in_executor(
+                    FailingLines(LINES), batch_size=2, executor=executor,
+                ))
+            self.assertTrue(futures)
+            self.assertTrue(all(future.done() for future in futures))
@@ -0,0 +1,136 @@
+# coding: utf-8
+
+import io
+import json
+import os
+import shutil
+import six
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # Python 2.7
+    ThreadPoolExecutor = None
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.archives import is_archive, iter_archive_members
+from il2fb.parsers.mission.cli import main
+
+from .test_index import MISSION
+
+
+OTHER_MISSION = b"[SEASON]\n  Year 1942\n  Month 8\n  Day 25\n"
+
+
+class ArchivesTestCase(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.parser = MissionParser()
+        self.directory = tempfile.mkdtemp()
+        self.members = [
+            ('missions/first.mis', MISSION),
+            ('missions/readme.txt', b"foo"),
+            ('missions/SECOND.MIS', OTHER_MISSION),
+        ]
+        self.expected = [
+            ('missions/first.mis', self.parser.parse(MISSION.splitlines())),
+            ('missions/SECOND.MIS', self.parser.parse(OTHER_MISSION.splitlines())),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_zip(self):
+        path = os.path.join(self.directory, 'missions.zip')
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name, data in self.members:
+                archive.writestr(name, data)
+        return path
+
+    def make_tar(self):
+        path = os.path.join(self.directory, 'missions.tar.gz')
+        archive = tarfile.open(path, 'w:gz')
+        try:
+            for name, data in self.members:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        finally:
+            archive.close()
+        return path
+
+    def test_is_archive(self):
+        self.assertTrue(is_archive(self.make_zip()))
+        self.assertTrue(is_archive(self.make_tar()))
+
+        path = os.path.join(self.directory, 'mission.mis')
+        with open(path, 'wb') as f:
+            f.write(MISSION)
+        self.assertFalse(is_archive(path))
+
+    def test_iter_archive_members(self):
+        for path in [self.make_zip(), self.make_tar()]:
+            self.assertEqual(
+                [(name, f.read()) for name, f in iter_archive_members(path)],
+                [self.members[0], self.members[2]],
+            )
+            self.assertEqual(
+                [name for name, f in iter_archive_members(path, '*.txt')],
+                ['missions/readme.txt', ],
+            )
+
+    def test_parse_archive(self):
+        for path in [self.make_zip(), self.make_tar()]:
+            self.assertEqual(list(self.parser.parse_archive(path)), self.expected)
+
+    @unittest.skipIf(ThreadPoolExecutor is None, "futures are not available")
+    def test_parse_archive_with_executor(self):
+        path = self.make_zip()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = list(self.parser.parse_archive(
+                path, executor=executor, max_pending=1,
+            ))
+        self.assertEqual(result, self.expected)
+
+    @unittest.skipIf(ThreadPoolExecutor is None, "futures are not available")
+    def test_cli(self):
+        zip_path = self.make_zip()
+        mission_path = os.path.join(self.directory, 'mission.mis')
+        with open(mission_path, 'wb') as f:
+            f.write(OTHER_MISSION)
+
+        for args in [[], ['--workers', '2', ]]:
+            stdout = six.StringIO()
+            code = main(
+                args + ['-s', 'SEASON', '--', zip_path, mission_path],
+                stdout=stdout,
+            )
+            self.assertEqual(code, 0)
+
+            lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+            self.assertEqual(
+                [(line['path'], line['member']) for line in lines],
+                [
+                    (zip_path, 'missions/first.mis'),
+                    (zip_path, 'missions/SECOND.MIS'),
+                    (mission_path, None),
+                ],
+            )
+            self.assertEqual(
+                lines[2]['mission'],
+                {'conditions': {'time_info': {'date': '1942-08-25'}}},
+            )
+
+    def test_cli_error(self):
+        path = os.path.join(self.directory, 'mission.mis')
+        with open(path, 'wb') as f:
+            f.write(b"[MAIN]\n  foo\n")
+
+        stdout, stderr = six.StringIO(), six.StringIO()
+        self.assertEqual(main([path, ], stdout=stdout, stderr=stderr), 1)
+        self.assertIn("in line #1", stderr.getvalue())
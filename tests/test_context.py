@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import unittest
+
+from il2fb.parsers.mission.context import SectionsFilter
+
+
+class SectionsFilterTestCase(unittest.TestCase):
+
+    def test_accept_all(self):
+        f = SectionsFilter()
+        self.assertTrue(f.accepts('MAIN'))
+        self.assertTrue(f.accepts('0_Chief_Road'))
+
+    def test_include(self):
+        f = SectionsFilter(sections=['MAIN', '*_Way'])
+        self.assertTrue(f.accepts('MAIN'))
+        self.assertTrue(f.accepts('r0100_Way'))
+        self.assertFalse(f.accepts('MAIN_'))
+        self.assertFalse(f.accepts('Buildings'))
+
+    def test_include_single_pattern(self):
+        f = SectionsFilter(sections='BornPlace*')
+        self.assertTrue(f.accepts('BornPlace'))
+        self.assertTrue(f.accepts('BornPlaceCountries1'))
+        self.assertFalse(f.accepts('MAIN'))
+
+    def test_include_nothing(self):
+        f = SectionsFilter(sections=[])
+        self.assertFalse(f.accepts('MAIN'))
+
+    def test_exclude(self):
+        f = SectionsFilter(sections=['*'], exclude=['NStationary', 'Build*'])
+        self.assertTrue(f.accepts('MAIN'))
+        self.assertFalse(f.accepts('NStationary'))
+        self.assertFalse(f.accepts('Buildings'))
+
+    def test_accepts_parent(self):
+        f = SectionsFilter(sections=['*_Way'])
+        self.assertTrue(f.accepts_parent('Wing'))
+        self.assertFalse(f.accepts_parent('Chiefs'))
+        self.assertFalse(f.accepts('Wing'))
+
+        f = SectionsFilter(sections='0_Chief_Road')
+        self.assertTrue(f.accepts_parent('Chiefs'))
+        self.assertFalse(f.accepts_parent('Wing'))
+
+        f = SectionsFilter(sections=['BornPlaceCountries1'])
+        self.assertTrue(f.accepts_parent('BornPlace'))
+
+    def test_accepts_parent_without_children(self):
+        f = SectionsFilter(sections=['MAIN', 'SEASON', 'BornPlace'])
+        self.assertFalse(f.accepts_parent('Wing'))
+        self.assertFalse(f.accepts_parent('Chiefs'))
+        self.assertFalse(f.accepts_parent('BornPlace'))
+
+        f = SectionsFilter(exclude=['Buildings'])
+        self.assertFalse(f.accepts_parent('Wing'))
+
+    def test_accepts_parent_excluded(self):
+        f = SectionsFilter(sections=['*_Way'], exclude=['Wing'])
+        self.assertFalse(f.accepts_parent('Wing'))
+
+    def test_accepts_flight(self):
+        f = SectionsFilter(sections=['r0100_Way'])
+        self.assertTrue(f.accepts_flight('r0100'))
+        self.assertFalse(f.accepts_flight('r0101'))
+
+        f = SectionsFilter(sections=['r0101'])
+        self.assertTrue(f.accepts_flight('r0101'))
+        self.assertFalse(f.accepts_flight('r0100'))
+
+        f = SectionsFilter(sections=['Wing'], exclude=['r0100'])
+        self.assertFalse(f.accepts_flight('r0100'))
+        self.assertTrue(f.accepts_flight('r0101'))
+
+        f = SectionsFilter()
+        self.assertTrue(f.accepts_flight('r0100'))
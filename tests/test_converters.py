@@ -6,6 +6,7 @@ import unittest
 from il2fb.commons import Skills, UnitTypes
 from il2fb.commons.organization import AirForces, Belligerents
 
+from il2fb.parsers.mission import converters
 from il2fb.parsers.mission.constants import NULL
 from il2fb.parsers.mission.converters import (
     to_bool, to_belligerent, to_skill, to_unit_type, to_air_force,
@@ -19,22 +20,38 @@ class ConvertersTestCase(unittest.TestCase):
         self.assertFalse(to_bool('0'))
         self.assertTrue(to_bool('1'))
         self.assertTrue(to_bool('-1'))
+        self.assertRaises(ValueError, to_bool, 'foo')
 
     def test_to_belligerent(self):
         self.assertEqual(to_belligerent('0'), Belligerents.none)
         self.assertEqual(to_belligerent('1'), Belligerents.red)
         self.assertEqual(to_belligerent('2'), Belligerents.blue)
+        self.assertEqual(to_belligerent('02'), Belligerents.blue)
+        self.assertEqual(to_belligerent(2), Belligerents.blue)
+        self.assertRaises(ValueError, to_belligerent, 'foo')
 
     def test_to_skill(self):
         self.assertEqual(to_skill('3'), Skills.ace)
 
     def test_to_unit_type(self):
         self.assertEqual(to_unit_type('planes'), UnitTypes.aircraft)
+        self.assertEqual(to_unit_type('Armor'), UnitTypes.armor)
+        self.assertRaises(ValueError, to_unit_type, 'foo')
+
+    def test_to_unit_type_remembers_spellings(self):
+        cache = converters._UNIT_TYPES
+        self.addCleanup(cache.pop, 'Artillery', None)
+        cache.pop('Artillery', None)
+
+        self.assertEqual(to_unit_type('Artillery'), UnitTypes.artillery)
+        self.assertIs(cache['Artillery'], UnitTypes.artillery)
+        self.assertNotIn('foo', cache)
 
     def test_to_air_force(self):
         self.assertIsNone(to_air_force(""))
         self.assertEqual(to_air_force(NULL), AirForces.vvs_rkka)
         self.assertEqual(to_air_force("nn"), AirForces.none)
+        self.assertIsNone(to_air_force(None))
 
     def test_to_time(self):
         self.assertEqual(to_time("11.75"), datetime.time(11, 45))
@@ -0,0 +1,166 @@
+# coding: utf-8
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.exceptions import MissionParsingError
+from il2fb.parsers.mission.index import SectionIndex, SectionIndexEntry
+
+from .mixins import ParserTestCaseMixin
+
+
+MISSION = b"\r\n".join([
+    b"[MAIN]",
+    b"  MAP Moscow/sload.ini",
+    b"  TIME 11.75",
+    b"  CloudType 1",
+    b"  CloudHeight 1500.0",
+    b"  army 1",
+    b"  playerNum 0",
+    b"[SEASON] ; comment",
+    b"  Year 1942",
+    b"  Month 8",
+    b"  Day 25",
+    b"[Wing]",
+    b"  r0100",
+    b"[r0100]",
+    b"  Planes 1",
+    b"  Skill 1",
+    b"  Class air.A_20C",
+    b"  Fuel 100",
+    b"  weapons default",
+    b"[r0100_Way]",
+    b"  NORMFLY 104331.00 105068.00 500.00 300.00 &0",
+    b"[Chiefs]",
+    b"  0_Chief Armor.1-BT7 2",
+    b"[0_Chief_Road]",
+    b"  21380.02 41700.34 120.00 10 3 3.055555582046509",
+    b"  21500.00 41700.00 120.00",
+    b"",
+])
+
+
+@unittest.skipIf(sys.version_info < (3, ), "bytes are text in Python 2")
+class SectionIndexTestCase(ParserTestCaseMixin, unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.parser = MissionParser()
+        self.index = SectionIndex.build(MISSION)
+
+    def test_build(self):
+        self.assertEqual(
+            [entry.name for entry in self.index.entries],
+            ['MAIN', 'SEASON', 'Wing', 'r0100', 'r0100_Way', 'Chiefs', '0_Chief_Road', ],
+        )
+        self.assertEqual(self.index.size, len(MISSION))
+        self.assertEqual(
+            self.index.entries[1],
+            SectionIndexEntry(
+                name='SEASON',
+                offset=MISSION.index(b"[SEASON]"),
+                length=MISSION.index(b"[Wing]") - MISSION.index(b"[SEASON]"),
+                line_number=7,
+                line_count=4,
+            ),
+        )
+        self.assertEqual(self.index.entries[-1].line_count, 3)
+
+    def test_build_without_trailing_newline(self):
+        index = SectionIndex.build(b"[MAIN]\n  foo\n[Wing]\n  r0100")
+        self.assertEqual(
+            index.entries[-1],
+            SectionIndexEntry('Wing', 13, 14, 2, 2),
+        )
+
+    def test_build_from_lines(self):
+        self.assertRaises(TypeError, SectionIndex.build, ["[MAIN]", ])
+
+    def test_serialization(self):
+        data = json.loads(json.dumps(self.index.to_primitive()))
+        self.assertEqual(SectionIndex.from_primitive(data), self.index)
+
+    def test_parse_with_index(self):
+        sections = ['Wing', '*_Way', '*_Chief_Road']
+        expected = self.parser.parse(MISSION, sections=sections)
+        result = self.parser.parse(MISSION, sections=sections, index=self.index)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(result['objects']['flights'][0]['id'], 'r0100')
+        self.assertEqual(len(result['objects']['flights'][0]['route']), 1)
+        self.assertNotIn('conditions', result)
+
+    def test_parse_only_flight_route_with_index(self):
+        result = self.parser.parse(
+            MISSION, sections=['r0100_Way'], index=self.index,
+        )
+
+        self.assertEqual(list(result.keys()), ['objects', ])
+        self.assertEqual(list(result['objects'].keys()), ['flights', ])
+
+        flight = result['objects']['flights'][0]
+        self.assertEqual(flight['id'], 'r0100')
+        self.assertEqual(flight['code'], 'A_20C')
+        self.assertEqual(len(flight['route']), 1)
+
+    def test_parse_only_chief_road_with_index(self):
+        result = self.parser.parse(
+            MISSION, sections=['0_Chief_Road'], index=self.index,
+        )
+        units = result['objects']['moving_units']
+
+        self.assertEqual([unit['id'] for unit in units], ['0_Chief', ])
+        self.assertEqual(len(units[0]['route']), 2)
+        self.assertEqual(
+            result, self.parser.parse(MISSION, sections=['0_Chief_Road']),
+        )
+
+    def test_parse_whole_mission_with_index(self):
+        self.assertEqual(
+            self.parser.parse(MISSION, index=self.index),
+            self.parser.parse(MISSION),
+        )
+
+    def test_parse_file_with_index(self):
+        expected = self.parser.parse(MISSION, sections=['SEASON', ])
+
+        fd, path = tempfile.mkstemp()
+        try:
+            os.write(fd, MISSION)
+            index = SectionIndex.build(path)
+            for use_mmap in (False, True):
+                result = self.parser.parse(
+                    path, sections=['SEASON', ], index=index, use_mmap=use_mmap,
+                )
+                self.assertEqual(result, expected)
+        finally:
+            os.close(fd)
+            os.remove(path)
+
+        result = self.parser.parse(
+            io.BytesIO(MISSION), sections=['SEASON', ], index=self.index,
+        )
+        self.assertEqual(result, expected)
+
+    def test_parse_with_index_line_with_error(self):
+        mission = b"[Unknown]\n  foo\n[MAIN]\n  MAP Moscow/sload.ini\n  foo\n"
+        expected_error_message = (
+            "ValueError in line #4 (\"foo\"): need more than 1 value to unpack"
+            if sys.version_info < (3, 5)
+            else "ValueError in line #4 (\"foo\"): not enough values to unpack (expected 2, got 1)"
+        )
+        self.assertRaisesWithMessage(
+            MissionParsingError,
+            expected_error_message,
+            self.parser.parse, mission, index=SectionIndex.build(mission))
+
+    def test_parse_with_stale_index(self):
+        self.assertRaises(
+            ValueError,
+            self.parser.parse, MISSION + b"\n", index=self.index)
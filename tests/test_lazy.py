@@ -0,0 +1,102 @@
+# coding: utf-8
+
+import datetime
+import sys
+import unittest
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.index import SectionIndex
+from il2fb.parsers.mission.lazy import LazyMapping, LazyMission, MISSING
+
+from .test_index import MISSION
+
+
+class LazyMappingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+        def make_loader(key, value):
+            def load():
+                self.calls.append(key)
+                return value
+            return load
+
+        self.mapping = LazyMapping([
+            ('foo', make_loader('foo', 1)),
+            ('bar', make_loader('bar', MISSING)),
+            ('baz', make_loader('baz', LazyMapping([
+                ('qux', make_loader('qux', 2)),
+            ]))),
+        ])
+
+    def test_getitem(self):
+        self.assertEqual(self.mapping['foo'], 1)
+        self.assertEqual(self.mapping['foo'], 1)
+        self.assertEqual(self.calls, ['foo', ])
+
+        self.assertRaises(KeyError, lambda: self.mapping['bar'])
+        self.assertRaises(KeyError, lambda: self.mapping['unknown'])
+
+    def test_getattr(self):
+        self.assertEqual(self.mapping.baz.qux, 2)
+        self.assertRaises(AttributeError, lambda: self.mapping.bar)
+
+    def test_is_loaded(self):
+        self.assertFalse(self.mapping.is_loaded('foo'))
+        self.mapping.get('foo')
+        self.assertTrue(self.mapping.is_loaded('foo'))
+
+    def test_to_dict(self):
+        self.assertEqual(self.mapping.to_dict(), {'foo': 1, 'baz': {'qux': 2}})
+        self.assertEqual(len(self.mapping), 2)
+
+
+@unittest.skipIf(sys.version_info < (3, ), "bytes are text in Python 2")
+class LazyMissionTestCase(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        class Parser(MissionParser):
+
+            def parse(parser, mission, sections=None, *args, **kwargs):
+                self.parsed_sections.append(sections)
+                return super(Parser, parser).parse(
+                    mission, sections, *args, **kwargs
+                )
+
+        self.parsed_sections = []
+        self.parser = Parser()
+
+    def test_to_dict(self):
+        mission = self.parser.parse_lazy(MISSION)
+        self.assertIsInstance(mission, LazyMission)
+        self.assertEqual(mission.to_dict(), MissionParser().parse(MISSION))
+
+    def test_parse_on_access(self):
+        mission = self.parser.parse_lazy(MISSION, index=SectionIndex.build(MISSION))
+        self.assertEqual(self.parsed_sections, [])
+
+        self.assertEqual(
+            mission['conditions']['time_info']['date'],
+            datetime.date(1942, 8, 25),
+        )
+        self.assertEqual(len(self.parsed_sections), 1)
+
+        flights = mission.objects.flights
+        self.assertEqual(flights[0]['id'], 'r0100')
+        self.assertEqual(len(flights[0]['route']), 1)
+        self.assertEqual(self.parsed_sections[-1], ['Wing', '*_Way', ])
+
+        self.assertIs(mission.objects.flights, flights)
+        self.assertEqual(len(self.parsed_sections), 2)
+        self.assertFalse(mission.objects.is_loaded('moving_units'))
+
+    def test_missing_sections_are_not_parsed(self):
+        mission = self.parser.parse_lazy(MISSION)
+
+        self.assertNotIn('targets', mission)
+        self.assertNotIn('stationary', mission.objects)
+        self.assertEqual(self.parsed_sections, [])
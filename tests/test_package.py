@@ -1,9 +1,11 @@
 # coding: utf-8
 
 import datetime
+import io
 import os
 import sys
 import tempfile
+import threading
 import unittest
 
 from il2fb.commons import Skills, UnitTypes
@@ -11,9 +13,13 @@ from il2fb.commons.organization import AirForces, Belligerents
 from il2fb.commons.spatial import Point2D
 from il2fb.commons.weather import Conditions, Gust, Turbulence
 
-from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission import MissionParser, MissionFeedParser
+from il2fb.parsers.mission.context import ParsingContext
 from il2fb.parsers.mission.exceptions import MissionParsingError
+from il2fb.parsers.mission.sections.base import CollectingParser
+from il2fb.parsers.mission.sections.chiefs import ChiefsSectionParser
 from il2fb.parsers.mission.sections.chiefs import GroundRoutePoint
+from il2fb.parsers.mission.visitors import MissionVisitor
 
 from .mixins import ParserTestCaseMixin
 
@@ -57,6 +63,116 @@ class MissionParserTestCase(ParserTestCaseMixin, unittest.TestCase):
             expected_error_message,
             self.parser.parse_stream, lines)
 
+    def test_parse_batched_line_with_error(self):
+        lines = [
+            "[Buildings]",
+            "  0_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+            "  1_bld House 1 10.00 20.00 360.00",
+            "  2_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+        ]
+        self.assertRaisesWithMessage(
+            MissionParsingError,
+            "IndexError in line #2 (\"1_bld House 1 10.00 20.00 360.00\"): "
+            "list index out of range",
+            self.parser.parse_stream, lines)
+
+    def test_parse_lines_of_section_at_once(self):
+
+        class CustomParser(CollectingParser):
+            input_name = "Custom"
+
+            def check_section_name(self, section_name):
+                return section_name == self.input_name
+
+            def parse_lines(self, lines):
+                self.collect(list(lines))
+
+            def clean(self):
+                return {'player': self.data}
+
+        self.parser.register_parser(CustomParser())
+
+        context = ParsingContext(self.parser)
+        context.process_lines([
+            "[Custom]", "foo", "bar  ; comment", "baz", "[Foo]", "qux",
+            "[Custom]", "quux",
+        ])
+        self.assertEqual(
+            context.finish(),
+            {'player': [['quux', ], ]},
+        )
+
+        context = ParsingContext(self.parser)
+        context.process_lines(["[Custom]", "foo", "bar  ; comment", "baz", ])
+        context.process_lines(["qux", "quux", ], start=4)
+        self.assertEqual(
+            context.finish(),
+            {'player': [['foo', 'bar', 'baz', ], ['qux', 'quux', ], ]},
+        )
+
+    def test_parse_lines_of_section_at_once_with_error(self):
+        lines = [
+            "[Buildings]",
+            "  0_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+            "  1_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+            "  2_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+            "  3_bld House 1 10.00 20.00 360.00",
+            "  4_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+        ]
+        context = ParsingContext(self.parser)
+        self.assertRaisesWithMessage(
+            MissionParsingError,
+            "IndexError in line #4 (\"3_bld House 1 10.00 20.00 360.00\"): "
+            "list index out of range",
+            context.process_lines, lines, 0)
+
+    def test_parse_lines_with_error_before_taking_lines(self):
+
+        class CustomParser(CollectingParser):
+            input_name = "Custom"
+
+            def check_section_name(self, section_name):
+                return section_name == self.input_name
+
+            def parse_lines(self, lines):
+                raise ValueError("foo")
+
+        self.parser.register_parser(CustomParser())
+
+        context = ParsingContext(self.parser)
+        self.assertRaisesWithMessage(
+            MissionParsingError,
+            "ValueError during parsing of \"CustomParser\": foo",
+            context.process_lines, ["[Custom]", "bar", ], 0)
+
+    def test_parse_interns_strings(self):
+        lines = [
+            "[Buildings]",
+            "  0_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+            "  1_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+        ]
+        first, second = self.parser.parse_stream(lines)['objects']['buildings']
+        self.assertEqual(first.code, "Tent_Pyramid_US")
+        self.assertIs(first.code, second.code)
+
+        other = self.parser.parse_stream(lines)['objects']['buildings'][0]
+        self.assertIsNot(other.code, first.code)
+
+    def test_parse_with_shared_strings(self):
+        lines = [
+            "[Buildings]",
+            "  0_bld House$Tent_Pyramid_US 1 10.00 20.00 360.00",
+        ]
+        strings = {}
+        first = self.parser.parse_stream(lines, strings=strings)
+        second = self.parser.parse_stream(lines, strings=strings)
+
+        self.assertIs(
+            first['objects']['buildings'][0].code,
+            second['objects']['buildings'][0].code,
+        )
+        self.assertIn("Tent_Pyramid_US", strings)
+
     def test_parser_finalization_with_error(self):
         lines = [
             "[MAIN]",
@@ -120,6 +236,660 @@ class MissionParserTestCase(ParserTestCaseMixin, unittest.TestCase):
         result = self.parser.parse_stream(lines)
         self.assertEquals(result, {})
 
+    def test_parse_selected_sections(self):
+        lines = [
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[Wing]",
+            "  r0100",
+            "[r0100]",
+            "  Planes 1",
+            "  Skill 1",
+            "  Class air.A_20C",
+            "  Fuel 100",
+            "  weapons default",
+            "[r0100_Way]",
+            "  TAKEOFF 193373.53 99288.17 0 0 &0",
+            "[Buildings]",
+            "  garbage",
+        ]
+        result = self.parser.parse_stream(
+            lines, sections=['SEASON', 'Wing', '*_Way'],
+        )
+
+        self.assertEqual(
+            result['conditions'],
+            {'time_info': {'date': datetime.date(1942, 8, 25)}},
+        )
+        self.assertEqual(len(result['objects']['flights']), 1)
+
+        flight = result['objects']['flights'][0]
+        self.assertEqual(flight['id'], 'r0100')
+        self.assertEqual(len(flight['route']), 1)
+
+        result = self.parser.parse_stream(
+            lines, exclude=['Wing', 'Buildings'],
+        )
+        self.assertEqual(
+            result,
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+
+    child_sections_lines = [
+        "[Chiefs]",
+        "  0_Chief Armor.1-BT7 2",
+        "  1_Chief Vehicles.GAZ67 1",
+        "[0_Chief_Road]",
+        "  21380.02 41700.34 120.00 10 2 3.055555582046509",
+        "[1_Chief_Road]",
+        "  21500.00 41700.00 120.00 10 2 3.055555582046509",
+        "[Wing]",
+        "  r0100",
+        "  r0101",
+        "[r0100]",
+        "  Planes 1",
+        "  Skill 1",
+        "  Class air.A_20C",
+        "  Fuel 100",
+        "  weapons default",
+        "[r0101]",
+        "  Planes 1",
+        "  Skill 1",
+        "  Class air.A_20C",
+        "  Fuel 100",
+        "  weapons default",
+        "[r0100_Way]",
+        "  TAKEOFF 193373.53 99288.17 0 0 &0",
+        "[r0101_Way]",
+        "  TAKEOFF 193373.53 99288.17 0 0 &0",
+        "  NORMFLY 98616.72 78629.31 500.00 300.00 &0",
+        "[BornPlace]",
+        "  1 3000 121601 74883 1 1000 200 0 0 0 5000 50 0 1 1 0 0 3.8 1 0 0 0 0",
+        "  2 3000 121601 74883 1 1000 200 0 0 0 5000 50 0 1 1 0 0 3.8 1 0 0 0 0",
+        "[BornPlace1]",
+        "  Bf-109F-4 -1",
+        "[BornPlaceCountries1]",
+        "  de",
+    ]
+
+    def test_parse_only_flight_route(self):
+        result = self.parser.parse_stream(
+            self.child_sections_lines, sections=['r0101_Way'],
+        )
+
+        self.assertEqual(list(result.keys()), ['objects', ])
+        self.assertEqual(list(result['objects'].keys()), ['flights', ])
+
+        flights = result['objects']['flights']
+        self.assertEqual([flight['id'] for flight in flights], ['r0101', ])
+        self.assertEqual(len(flights[0]['route']), 2)
+
+    def test_parse_only_flight_routes(self):
+        result = self.parser.parse_stream(
+            self.child_sections_lines, sections=['*_Way'],
+        )
+        flights = result['objects']['flights']
+
+        self.assertEqual(
+            [flight['id'] for flight in flights], ['r0100', 'r0101', ],
+        )
+        self.assertEqual(
+            [len(flight['route']) for flight in flights], [1, 2, ],
+        )
+
+    def test_parse_only_flight_routes_with_excluded_wing(self):
+        result = self.parser.parse_stream(
+            self.child_sections_lines, sections=['*_Way'], exclude=['Wing'],
+        )
+        self.assertEqual(result, {})
+
+    def test_parse_only_chief_road(self):
+        result = self.parser.parse_stream(
+            self.child_sections_lines, sections=['1_Chief_Road'],
+        )
+        units = result['objects']['moving_units']
+
+        self.assertEqual(list(result['objects'].keys()), ['moving_units', ])
+        self.assertEqual([unit['id'] for unit in units], ['1_Chief', ])
+        self.assertEqual(
+            units[0]['route'][0].pos, Point2D(21500.00, 41700.00),
+        )
+
+    def test_parse_only_home_base_sections(self):
+        result = self.parser.parse_stream(
+            self.child_sections_lines, sections=['BornPlace1'],
+        )
+        home_bases = result['objects']['home_bases']
+
+        self.assertEqual(list(result['objects'].keys()), ['home_bases', ])
+        self.assertEqual(len(home_bases), 1)
+        self.assertEqual(home_bases[0]['belligerent'], Belligerents.blue)
+        self.assertEqual(
+            home_bases[0].spawning.aircraft_limitations.allowed_aircrafts,
+            [{'code': 'Bf-109F-4', 'limit': None, 'weapon_limitations': []}, ],
+        )
+        self.assertEqual(home_bases[0].spawning.allowed_air_forces, [])
+
+    def test_parse_parent_with_children(self):
+        result = self.parser.parse_stream(
+            self.child_sections_lines, sections=['Chiefs', '0_Chief_Road'],
+        )
+        units = result['objects']['moving_units']
+
+        self.assertEqual(
+            [unit['id'] for unit in units], ['0_Chief', '1_Chief', ],
+        )
+        self.assertEqual(
+            [len(unit['route']) for unit in units], [1, 0, ],
+        )
+
+    @unittest.skipIf(sys.version_info < (3, ), "bytes are text in Python 2")
+    def test_parse_bytes(self):
+        data = u"\r\n".join([
+            u"[SEASON]",
+            u"  Year 1942",
+            u"  Month 8",
+            u"  Day 25",
+            u"[Buildings]",
+            u"  0_bld House$Tent_Pyramid_US 1 43471.34 57962.08 630.00",
+            u"[Wing]",
+            u"  r0100",
+            u"[r0100]",
+            u"  Planes 1",
+            u"  Skill 1",
+            u"  Class air.A_20C",
+            u"  Fuel 100",
+            u"  weapons default",
+            u"  skin0 Пятнистый.bmp",
+        ]).encode('cp1251')
+
+        expected = self.parser.parse(data.decode('cp1251').splitlines())
+        self.assertEqual(
+            expected['objects']['flights'][0]['aircrafts'][0]['aircraft_skin'],
+            u"Пятнистый.bmp",
+        )
+
+        for mission in [
+            data, bytearray(data), memoryview(data), io.BytesIO(data),
+            data.splitlines(True),
+        ]:
+            self.assertEqual(self.parser.parse(mission), expected)
+
+        fd, path = tempfile.mkstemp()
+        try:
+            os.write(fd, data)
+            self.assertEqual(self.parser.parse(path), expected)
+            with open(path, 'rb') as f:
+                self.assertEqual(self.parser.parse(f), expected)
+        finally:
+            os.close(fd)
+            os.remove(path)
+
+    @unittest.skipIf(sys.version_info < (3, ), "bytes are text in Python 2")
+    def test_parse_bytes_decodes_only_parsed_sections(self):
+        data = b"[Unknown]\n  \xff\xfe\n[SEASON]\n  Year 1942\n  Month 8\n  Day 25\n"
+        self.assertEqual(
+            self.parser.parse(data, encoding='ascii'),
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+
+    def test_parse_mmap(self):
+        lines = [
+            "[MAIN]",
+            "  MAP Moscow/sload.ini",
+            "  TIME 11.75",
+            "  CloudType 1",
+            "  CloudHeight 1500.0",
+            "  army 1",
+            "  playerNum 0",
+            "[Unknown]",
+            "  foo",
+            "  bar",
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[Chiefs]",
+            "  0_Chief Armor.1-BT7 2",
+        ]
+        expected = self.parser.parse(lines)
+
+        fd, path = tempfile.mkstemp()
+        try:
+            os.write(fd, "\r\n".join(lines).encode('ascii'))
+            result = self.parser.parse(path, use_mmap=True)
+            events = list(self.parser.iterparse(path, use_mmap=True))
+            head = self.parser.probe(path, use_mmap=True)
+        finally:
+            os.close(fd)
+            os.remove(path)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            [name for name, data in events],
+            ['MAIN', 'SEASON', 'Chiefs', None],
+        )
+        self.assertEqual(head['conditions']['time_info']['time'], datetime.time(11, 45))
+
+    def test_parse_mmap_empty_file(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            self.assertEqual(self.parser.parse(path, use_mmap=True), {})
+        finally:
+            os.close(fd)
+            os.remove(path)
+
+    @unittest.skipIf(sys.version_info < (3, ), "bytes are text in Python 2")
+    def test_parse_buffer_line_with_error(self):
+        data = b"\n".join([
+            b"[Unknown]",
+            b"  foo",
+            b"",
+            b"[Other]",
+            b"  bar",
+            b"[MAIN]",
+            b"  foo",
+        ])
+        expected_error_message = (
+            "ValueError in line #6 (\"foo\"): not enough values to unpack "
+            "(expected 2, got 1)"
+        )
+        self.assertRaisesWithMessage(
+            MissionParsingError,
+            expected_error_message,
+            self.parser.parse, data)
+
+    def test_iterparse(self):
+        lines = [
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[Unknown]",
+            "  foo",
+            "[Chiefs]",
+            "  0_Chief Armor.1-BT7 2",
+            "[0_Chief_Road]",
+            "  21380.02 41700.34 120.00 10 3 3.055555582046509",
+        ]
+        events = list(self.parser.iterparse(lines))
+
+        self.assertEqual(
+            [name for name, data in events],
+            ['SEASON', 'Chiefs', '0_Chief_Road', None],
+        )
+        self.assertEqual(events[0][1], {'date': datetime.date(1942, 8, 25)})
+        self.assertEqual(events[-1][1], self.parser.parse_stream(lines))
+
+    def test_iterparse_by_file_name(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            os.write(fd, b"[SEASON]\n Year 1942\n Month 8\n Day 25\n")
+            events = list(self.parser.iterparse(path))
+        finally:
+            os.close(fd)
+            os.remove(path)
+
+        self.assertEqual(
+            events,
+            [
+                ('SEASON', {'date': datetime.date(1942, 8, 25)}),
+                (None, {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}}),
+            ],
+        )
+
+    def test_iterparse_without_linking(self):
+        lines = [
+            "[Wing]",
+            "  r0100",
+            "[r0100]",
+            "  Planes 1",
+            "  Skill 1",
+            "  Class air.A_20C",
+            "  Fuel 100",
+            "  weapons default",
+        ]
+        events = list(self.parser.iterparse(lines, link=False))
+
+        self.assertEqual(
+            [name for name, data in events],
+            ['Wing', 'r0100', ],
+        )
+        self.assertEqual(events[1][1]['r0100']['code'], 'A_20C')
+
+    def test_iterparse_yields_sections_before_end_of_stream(self):
+        lines = [
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[Wing]",
+        ]
+
+        def generate_lines():
+            for line in lines:
+                yield line
+            self.fail("SEASON section was not yielded in time")
+
+        events = self.parser.iterparse(generate_lines())
+        self.assertEqual(next(events)[0], 'SEASON')
+
+    def test_probe(self):
+        lines = [
+            "[MAIN]",
+            "  MAP Moscow/sload.ini",
+            "  TIME 11.75",
+            "  CloudType 1",
+            "  CloudHeight 1500.0",
+            "  army 1",
+            "  playerNum 0",
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[MDS]",
+            "  MDS_Radar_SetRadarToAdvanceMode 1",
+            "[Wing]",
+        ]
+
+        def generate_lines():
+            for line in lines:
+                yield line
+            self.fail("lines after [Wing] must not be read")
+
+        result = self.parser.probe(generate_lines())
+
+        self.assertEqual(result['location_loader'], 'Moscow/sload.ini')
+        self.assertEqual(
+            result['conditions']['time_info'],
+            {
+                'date': datetime.date(1942, 8, 25),
+                'time': datetime.time(11, 45),
+                'is_fixed': False,
+            },
+        )
+        self.assertNotIn('radar', result['conditions'])
+
+    def test_probe_stops_after_requested_sections(self):
+        lines = [
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[WEATHER]",
+        ]
+
+        def generate_lines():
+            for line in lines:
+                yield line
+            self.fail("lines after [WEATHER] must not be read")
+
+        result = self.parser.probe(generate_lines(), sections=['SEASON', ])
+        self.assertEqual(
+            result,
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+
+    def test_probe_skips_unknown_sections(self):
+        lines = [
+            "[MAIN]",
+            "  MAP Moscow/sload.ini",
+            "  TIME 11.75",
+            "  CloudType 1",
+            "  CloudHeight 1500.0",
+            "  army 1",
+            "  playerNum 0",
+            "[Foo]",
+            "  Bar 1",
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[WEATHER]",
+            "  WindDirection 120",
+            "  WindSpeed 3",
+            "  Gust 0",
+            "  Turbulence 0",
+            "[Wing]",
+        ]
+
+        def generate_lines():
+            for line in lines:
+                yield line
+            self.fail("lines after [Wing] must not be read")
+
+        result = self.parser.probe(generate_lines())
+
+        self.assertEqual(result['location_loader'], 'Moscow/sload.ini')
+        self.assertEqual(
+            result['conditions']['time_info']['date'],
+            datetime.date(1942, 8, 25),
+        )
+        self.assertEqual(
+            result['conditions']['meteorology']['wind']['direction'], 120.0,
+        )
+        self.assertNotIn('Foo', result)
+
+    def test_probe_single_section_given_as_string(self):
+        lines = [
+            "[SEASON]",
+            "  Year 1942",
+            "  Month 8",
+            "  Day 25",
+            "[WEATHER]",
+        ]
+
+        def generate_lines():
+            for line in lines:
+                yield line
+            self.fail("lines after [WEATHER] must not be read")
+
+        result = self.parser.probe(generate_lines(), sections='SEASON')
+        self.assertEqual(
+            result,
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+
+    def test_probe_by_file_name(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            os.write(fd, b"[SEASON]\n Year 1942\n Month 8\n Day 25\n[Wing]\n")
+            result = self.parser.probe(path)
+        finally:
+            os.close(fd)
+            os.remove(path)
+
+        self.assertEqual(
+            result,
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+
+    def test_register_parser(self):
+
+        class CustomParser(CollectingParser):
+            input_name = "Custom"
+
+            def check_section_name(self, section_name):
+                return section_name == self.input_name
+
+            def clean(self):
+                return {'player': self.data}
+
+        self.parser.register_parser(CustomParser())
+
+        lines = [
+            "[Custom]",
+            "  foo",
+            "  bar",
+        ]
+        result = self.parser.parse_stream(lines)
+        self.assertEquals(result, {'player': ['foo', 'bar', ]})
+
+    def test_register_parser_without_name(self):
+
+        class CustomParser(CollectingParser):
+
+            def check_section_name(self, section_name):
+                return section_name == "MAIN"
+
+            def clean(self):
+                return {'player': self.data}
+
+        parser = CustomParser()
+        self.parser.register_parser(parser)
+        self.assertIs(self.parser.parsers[-1], parser)
+
+        lines = [
+            "[MAIN]",
+            "  foo",
+        ]
+        result = self.parser.parse_stream(lines)
+        self.assertEquals(result, {'player': ['foo', ]})
+
+    def test_register_subclass_of_tokenized_parser_with_parse_line(self):
+
+        class CustomChiefsParser(ChiefsSectionParser):
+
+            def parse_line(self, line):
+                if line.startswith("skip"):
+                    return
+                super(CustomChiefsParser, self).parse_line(line)
+
+        self.assertFalse(CustomChiefsParser.tokenized)
+        self.parser.register_parser(CustomChiefsParser())
+
+        lines = [
+            "[Chiefs]",
+            "  skip me",
+            "  0_Chief Armor.1-BT7 2",
+        ]
+        result = self.parser.parse_stream(lines)
+        units = result['objects']['moving_units']
+        self.assertEqual([unit['id'] for unit in units], ['0_Chief', ])
+
+    def test_register_tokenized_parser(self):
+
+        class CustomParser(CollectingParser):
+            input_name = "Custom"
+            tokenized = True
+
+            def check_section_name(self, section_name):
+                return section_name == self.input_name
+
+            def parse_line(self, line):
+                raise AssertionError("Tokens must be passed to parser")
+
+            def parse_tokens(self, tokens):
+                self.collect(tokens)
+
+            def clean(self):
+                return {'player': self.data}
+
+        self.parser.register_parser(CustomParser())
+
+        lines = [
+            "[Custom]",
+            "  foo  bar ; comment",
+            "  baz",
+        ]
+        result = self.parser.parse_stream(lines)
+        self.assertEquals(result, {'player': [['foo', 'bar', ], ['baz', ], ]})
+
+    def test_parse_with_visitor(self):
+
+        class Visitor(MissionVisitor):
+
+            def __init__(self):
+                self.buildings = []
+                self.points = []
+
+            def on_building(self, building):
+                self.buildings.append(building)
+
+            def on_route_point(self, unit_id, point):
+                self.points.append((unit_id, point))
+
+        lines = [
+            "[Chiefs]",
+            "  0_Chief Armor.1-BT7 2",
+            "[0_Chief_Road]",
+            "  21380.02 41700.34 120.00 10 3 3.055555582046509",
+            "[Buildings]",
+            "  0_bld House$Tent_Pyramid_US 1 43471.34 57962.08 630.00",
+            "  1_bld House$Tent_Pyramid_US 1 43471.34 57962.08 630.00",
+        ]
+        visitor = Visitor()
+        result = self.parser.parse_stream(lines, visitor=visitor)
+
+        self.assertEqual(len(visitor.buildings), 2)
+        self.assertEqual(visitor.buildings[1].id, '1_bld')
+        self.assertEqual(
+            visitor.points,
+            [
+                ('0_Chief', GroundRoutePoint(
+                    pos=Point2D(21380.02, 41700.34),
+                    is_checkpoint=True,
+                    delay=10,
+                    section_length=3,
+                    speed=11.0,
+                )),
+            ],
+        )
+
+        objects = result['objects']
+        self.assertEqual(objects['buildings'], [])
+        self.assertNotIn('moving_units', objects)
+
+    def test_parse_concurrently(self):
+        lines = [
+            "[Chiefs]",
+            "  0_Chief Armor.1-BT7 2",
+            "[0_Chief_Road]",
+            "  21380.02 41700.34 120.00 10 3 3.055555582046509",
+            "  21500.00 41700.00 120.00",
+            "[Buildings]",
+        ] + [
+            "  {0}_bld House$Tent_Pyramid_US 1 {0}.00 {0}.00 360.00".format(i)
+            for i in range(1000)
+        ]
+        expected = self.parser.parse_stream(lines)
+        results = []
+
+        def parse():
+            results.append(self.parser.parse_stream(lines))
+
+        threads = [threading.Thread(target=parse) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), len(threads))
+        for result in results:
+            self.assertEqual(result, expected)
+
+    def test_parse_reentrant(self):
+        inner_lines = [
+            "[Chiefs]",
+            "  1_Chief Vehicles.GAZ67 1",
+        ]
+        inner_results = []
+
+        def generate_outer_lines():
+            yield "[Chiefs]"
+            inner_results.append(self.parser.parse_stream(inner_lines))
+            yield "  0_Chief Armor.1-BT7 2"
+
+        result = self.parser.parse_stream(generate_outer_lines())
+
+        units = result['objects']['moving_units']
+        self.assertEqual([unit['id'] for unit in units], ['0_Chief', ])
+
+        units = inner_results[0]['objects']['moving_units']
+        self.assertEqual([unit['id'] for unit in units], ['1_Chief', ])
+
     def test_get_conditions(self):
         lines = [
             "[MAIN]",
@@ -444,3 +1214,64 @@ class MissionParserTestCase(ParserTestCaseMixin, unittest.TestCase):
                 },
             }
         )
+
+
+class MissionFeedParserTestCase(unittest.TestCase):
+
+    lines = [
+        "[MAIN]",
+        "  MAP Moscow/sload.ini",
+        "  TIME 11.75",
+        "  CloudType 1",
+        "  CloudHeight 1500.0",
+        "  army 1",
+        "  playerNum 0",
+        "[SEASON]",
+        "  Year 1942",
+        "  Month 8",
+        "  Day 25",
+        "[Chiefs]",
+        "  0_Chief Armor.1-BT7 2",
+        "[0_Chief_Road]",
+        "  21380.02 41700.34 120.00 10 3 3.055555582046509",
+        "  21500.00 41700.00 120.00",
+    ]
+
+    def test_feed_chunks(self):
+        expected = MissionParser().parse_stream(self.lines)
+        data = "\r\n".join(self.lines).encode('cp1251')
+
+        for size in (1, 7, len(data)):
+            parser = MissionFeedParser()
+            for i in range(0, len(data), size):
+                parser.feed(data[i:i + size])
+            self.assertEqual(parser.close(), expected)
+
+    def test_feed_text(self):
+        parser = MissionFeedParser()
+        parser.feed("[SEASON]\n  Year 19")
+        parser.feed("42\n  Month 8\n  Day 25\n")
+        self.assertEqual(
+            parser.close(),
+            {'conditions': {'time_info': {'date': datetime.date(1942, 8, 25)}}},
+        )
+
+    def test_feed_with_error(self):
+        parser = MissionFeedParser()
+        parser.feed("[MAIN]\n  MAP Moscow/sload.ini\n  fo")
+
+        expected_error_message = (
+            "ValueError in line #2 (\"foo\"): need more than 1 value to unpack"
+            if sys.version_info < (3, 5)
+            else "ValueError in line #2 (\"foo\"): not enough values to unpack (expected 2, got 1)"
+        )
+        with self.assertRaises(MissionParsingError) as context:
+            parser.feed("o\n")
+
+        self.assertEqual(str(context.exception), expected_error_message)
+
+    def test_feed_after_close(self):
+        parser = MissionFeedParser()
+        parser.close()
+        self.assertRaises(ValueError, parser.feed, "[MAIN]")
+        self.assertRaises(ValueError, parser.close)
@@ -0,0 +1,169 @@
+# coding: utf-8
+
+import unittest
+
+from il2fb.commons.spatial import Point2D
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.raw import RawStructure
+from il2fb.parsers.mission.sections.buildings import (
+    Building, BuildingsSectionParser,
+)
+from il2fb.parsers.mission.sections.chiefs import ChiefRoadSectionParser
+from il2fb.parsers.mission.sections.front_marker import (
+    FrontMarkerSectionParser,
+)
+from il2fb.parsers.mission.sections.nstationary import (
+    NStationarySectionParser,
+)
+from il2fb.parsers.mission.sections.rocket import RocketSectionParser
+from il2fb.parsers.mission.sections.wing import FlightRouteSectionParser
+
+
+class RawStructuresTestCase(unittest.TestCase):
+
+    maxDiff = None
+
+    def assertSameAsEager(self, parser_class, section_name, lines):
+        results = []
+
+        for raw in [False, True, ]:
+            parser = parser_class()
+            parser.raw = raw
+            parser.start(section_name)
+            parser.parse_lines(lines)
+            results.append(parser.stop())
+
+        eager, raw = results
+        objects = next(iter(raw.values()))
+
+        self.assertTrue(objects)
+        for obj in objects:
+            self.assertIsInstance(obj, RawStructure)
+
+        self.assertEqual(raw, eager)
+        self.assertEqual(
+            [obj.to_primitive() for obj in next(iter(raw.values()))],
+            [obj.to_primitive() for obj in next(iter(eager.values()))],
+        )
+
+    def test_buildings(self):
+        self.assertSameAsEager(BuildingsSectionParser, "Buildings", [
+            "0_bld House$Tent_Pyramid_US 1 43471.34 57962.08 630.00",
+            "1_bld House$Tent_Pyramid_US 2 43471.34 57962.08 -10.50",
+        ])
+
+    def test_stationary_objects(self):
+        self.assertSameAsEager(NStationarySectionParser, "NStationary", [
+            "0_Static vehicles.aeronautics.Aeronautics$BarrageBalloon_2400m 1 151781.85 89055.58 360.00 0.0",
+            "1_Static vehicles.artillery.Artillery$SdKfz251 2 31333.62 90757.91 600.29 0.0 0 1 1",
+            "58_Static vehicles.artillery.Artillery$Flak18_88mm 2 87591.03 115255.62 690.00 0.0",
+            "3_Static vehicles.planes.Plane$I_16TYPE24 1 134146.89 88005.43 336.92 0.0 null 2 1.0 I-16type24_G1_RoW3.bmp 1",
+            "19_Static vehicles.planes.Plane$JU_87D3 2 153811.08 164330.47 360.00 0.0 null 1",
+            "6_Static ships.Ship$G5 1 83759.05 115021.15 360.00 0.0 60 3 1.4",
+            "7_Static vehicles.unknown.Unknown$Foo 1 83759.05 115021.15 360.00 0.0",
+        ])
+
+    def test_rockets(self):
+        self.assertSameAsEager(RocketSectionParser, "Rocket", [
+            "0_Rocket Fi103_V1_ramp 2 84141.38 114216.82 360.00 60.0 10 80.0 83433.91 115445.49",
+            "1_Rocket Fi103_V1_ramp 2 84141.38 114216.82 360.00 60.0 10 80.0",
+        ])
+
+    def test_front_markers(self):
+        self.assertSameAsEager(FrontMarkerSectionParser, "FrontMarker", [
+            "FrontMarker0 7636.65 94683.02 1",
+            "FrontMarker1 80.15 47851.27 3",
+        ])
+
+    def test_ground_route_points(self):
+        self.assertSameAsEager(ChiefRoadSectionParser, "0_Chief_Road", [
+            "21380.02 41700.34 120.00 10 3 3.055555582046509",
+            "21500.00 41700.00 120.00",
+        ])
+
+    def test_flight_route_points(self):
+        self.assertSameAsEager(FlightRouteSectionParser, "3GvIAP01_Way", [
+            "TAKEOFF 193373.53 99288.17 0 0 &0",
+            "TRIGGERS 0 10 20 0",
+            "NORMFLY 102105.11 129548.84 250.00 300.00",
+            "NORMFLY_401 98616.72 78629.31 500.00 300.00 &0 F2",
+            "TRIGGERS 1 1 25 5 500",
+            "NORMFLY 63028.34 42772.13 500.00 300.00 r0100 1 &0",
+            "GATTACK 99737.30 79106.06 500.00 300.00 0_Chief 0 &0",
+            "LANDING_104 185304.27 54570.12 0 0 &1",
+        ])
+
+    def test_fields_are_converted_on_first_access(self):
+        parser = BuildingsSectionParser()
+        parser.raw = True
+        parser.start("Buildings")
+        parser.parse_line("0_bld House$Tent_Pyramid_US 1 43471.34 57962.08 630.00")
+        building = parser.stop()['buildings'][0]
+
+        slot = Building.pos
+        self.assertRaises(AttributeError, slot.__get__, building, Building)
+
+        self.assertEqual(building.pos, Point2D(43471.34, 57962.08))
+        self.assertIs(slot.__get__(building, Building), building.pos)
+        self.assertEqual(building.rotation_angle, 270.0)
+        self.assertEqual(building.raw_tokens[0], "0_bld")
+
+    def test_extra_fields_are_converted_together(self):
+        parser = NStationarySectionParser()
+        parser.raw = True
+        parser.start("NStationary")
+        parser.parse_line(
+            "3_Static vehicles.planes.Plane$I_16TYPE24 1 134146.89 88005.43 "
+            "336.92 0.0 null 2 1.0 I-16type24_G1_RoW3.bmp 1"
+        )
+        aircraft = parser.stop()['stationary'][0]
+        cls = aircraft.__class__
+        tokens = list(aircraft.raw_tokens)
+
+        self.assertTrue(aircraft.allows_spawning)
+
+        # Flags which share a token are taken from cache, not from tokens
+        tokens[8] = "0"
+        aircraft._tokens = tuple(tokens)
+        self.assertIs(cls.is_restorable.slot.__get__(aircraft, cls), True)
+
+    def test_stationary_objects_share_strings(self):
+        parser = NStationarySectionParser()
+        parser.raw = True
+        parser.start("NStationary")
+        parser.parse_lines([
+            "3_Static vehicles.planes.Plane$I_16TYPE24 1 134146.89 88005.43 "
+            "336.92 0.0 null 2 1.0 I-16type24_G1_RoW3.bmp 1",
+            "4_Static vehicles.planes.Plane$I_16TYPE24 1 134146.89 88005.43 "
+            "336.92 0.0 null 2 1.0 I-16type24_G1_RoW3.bmp 1",
+            "5_Static vehicles.planes.Plane$I_16TYPE24 1 134146.89 88005.43 "
+            "336.92 0.0 I-16type24_G1_RoW3.bmp 1",
+        ])
+        first, second, third = parser.stop()['stationary']
+
+        self.assertEqual(first.code, "I_16TYPE24")
+        self.assertIs(first.code, second.code)
+        self.assertIs(first.code, third.code)
+        self.assertEqual(first.skin, "I-16type24_G1_RoW3.bmp")
+        self.assertIs(first.skin, second.skin)
+        self.assertIs(first.skin, third.skin)
+
+    def test_invalid_number_of_tokens(self):
+        parser = BuildingsSectionParser()
+        parser.raw = True
+        parser.start("Buildings")
+        self.assertRaises(ValueError, parser.parse_line, "0_bld House$Tent 1")
+
+    def test_parse_raw(self):
+        lines = [
+            "[Buildings]",
+            "  0_bld House$Tent_Pyramid_US 1 43471.34 57962.08 630.00",
+        ]
+        parser = MissionParser()
+        result = parser.parse_stream(lines, raw=True)
+        building = result['objects']['buildings'][0]
+
+        self.assertIsInstance(building, RawStructure)
+        self.assertIsInstance(building, Building)
+        self.assertEqual(result, parser.parse_stream(lines))
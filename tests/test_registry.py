@@ -0,0 +1,109 @@
+# coding: utf-8
+
+import re
+import unittest
+
+from il2fb.parsers.mission.registry import SectionParsersRegistry
+from il2fb.parsers.mission.sections.base import ValuesParser
+from il2fb.parsers.mission.sections.born_place import (
+    BornPlaceSectionParser, BornPlaceAircraftsSectionParser,
+    BornPlaceAirForcesSectionParser,
+)
+from il2fb.parsers.mission.sections.chiefs import ChiefRoadSectionParser
+from il2fb.parsers.mission.sections.main import MainSectionParser
+from il2fb.parsers.mission.sections.wing import FlightRouteSectionParser
+
+
+class SectionParsersRegistryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = SectionParsersRegistry([
+            MainSectionParser(),
+            ChiefRoadSectionParser(),
+            BornPlaceSectionParser(),
+            BornPlaceAircraftsSectionParser(),
+            BornPlaceAirForcesSectionParser(),
+            FlightRouteSectionParser(),
+        ])
+
+    def test_get_by_name(self):
+        parser = self.registry.get('MAIN')
+        self.assertIsInstance(parser, MainSectionParser)
+
+        parser = self.registry.get('BornPlace')
+        self.assertIsInstance(parser, BornPlaceSectionParser)
+
+    def test_get_by_pattern(self):
+        parser = self.registry.get('0_Chief_Road')
+        self.assertIsInstance(parser, ChiefRoadSectionParser)
+
+        parser = self.registry.get('r0100_Way')
+        self.assertIsInstance(parser, FlightRouteSectionParser)
+
+        parser = self.registry.get('BornPlace12')
+        self.assertIsInstance(parser, BornPlaceAircraftsSectionParser)
+
+        parser = self.registry.get('BornPlaceCountries12')
+        self.assertIsInstance(parser, BornPlaceAirForcesSectionParser)
+
+    def test_get_unknown(self):
+        self.assertIsNone(self.registry.get('foo'))
+        self.assertIsNone(self.registry.get('X_Chief_Road'))
+        self.assertIsNone(self.registry.get('BornPlaceFoo'))
+
+    def test_unknown_names_are_cached(self):
+        calls = []
+
+        class Parser(ValuesParser):
+
+            def check_section_name(self, section_name):
+                calls.append(section_name)
+                return False
+
+        self.registry.register(Parser())
+
+        self.assertIsNone(self.registry.get('foo'))
+        self.assertIsNone(self.registry.get('foo'))
+        self.assertEqual(calls, ['foo', ])
+
+    def test_register_overrides_previous_parsers(self):
+
+        class MainParser(MainSectionParser):
+            pass
+
+        class RouteParser(FlightRouteSectionParser):
+            input_pattern = re.compile(r"r0100_Way$")
+
+        self.assertIsInstance(self.registry.get('r0100_Way'), FlightRouteSectionParser)
+
+        self.registry.register(MainParser())
+        self.registry.register(RouteParser())
+
+        self.assertIsInstance(self.registry.get('MAIN'), MainParser)
+        self.assertIsInstance(self.registry.get('r0100_Way'), RouteParser)
+        self.assertNotIsInstance(self.registry.get('r0101_Way'), RouteParser)
+
+    def test_parsers_without_name_override_previous_parsers(self):
+
+        class Parser(MainSectionParser):
+            input_name = None
+
+            def check_section_name(self, section_name):
+                return section_name in ['MAIN', 'r0100_Way', ]
+
+        parser = Parser()
+        self.registry.register(parser)
+
+        self.assertIs(self.registry.get('MAIN'), parser)
+        self.assertIs(self.registry.get('r0100_Way'), parser)
+        self.assertIsInstance(self.registry.get('r0101_Way'), FlightRouteSectionParser)
+
+    def test_parsers(self):
+        parser = MainSectionParser()
+        self.registry.register(parser)
+
+        parsers = self.registry.parsers
+        self.assertIsInstance(parsers, tuple)
+        self.assertEqual(len(parsers), 7)
+        self.assertIsInstance(parsers[0], MainSectionParser)
+        self.assertIs(parsers[-1], parser)
@@ -0,0 +1,210 @@
+# coding: utf-8
+
+import unittest
+
+from il2fb.commons.spatial import Point2D
+from il2fb.commons.structures import BaseStructure
+
+from il2fb.parsers.mission.schema import Field, Schema, Variants
+
+from .mixins import ParserTestCaseMixin
+
+
+class Unit(BaseStructure):
+    __slots__ = ['id', 'type', 'code', 'count', ]
+
+    def __init__(self, id, type, code, count):
+        self.id = id
+        self.type = type
+        self.code = code
+        self.count = count
+
+
+def to_type_and_code(value):
+    return value.split('.')
+
+
+class SchemaTestCase(ParserTestCaseMixin, unittest.TestCase):
+
+    @staticmethod
+    def factory(**kwargs):
+        return kwargs
+
+    def test_parse(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+            Field('pos', Point2D, width=2),
+            Field('count', int),
+        ])
+        self.assertEqual(
+            schema.parse(['foo', '1.5', '2.5', '3', ]),
+            {'id': 'foo', 'pos': Point2D(1.5, 2.5), 'count': 3, },
+        )
+
+    def test_parse_without_converter(self):
+        schema = Schema(self.factory, [
+            Field('code'),
+            Field('pos', width=2),
+        ])
+        self.assertEqual(
+            schema.parse(['foo', '1', '2', ]),
+            {'code': 'foo', 'pos': ['1', '2', ], },
+        )
+
+    def test_skip_fields_without_name(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+            Field(None, width=2),
+            Field('count', int),
+        ])
+        self.assertEqual(
+            schema.parse(['foo', 'bar', 'baz', '3', ]),
+            {'id': 'foo', 'count': 3, },
+        )
+
+    def test_optional_fields(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+            Field('pos', Point2D, width=2, optional=True),
+            Field('count', int, optional=True, default=0),
+        ])
+        self.assertEqual(schema.arities, [1, 3, 4, ])
+        self.assertEqual(
+            schema.parse(['foo', ]),
+            {'id': 'foo', 'pos': None, 'count': 0, },
+        )
+        self.assertEqual(
+            schema.parse(['foo', '1', '2', ]),
+            {'id': 'foo', 'pos': Point2D(1, 2), 'count': 0, },
+        )
+        self.assertEqual(
+            schema.parse(['foo', '1', '2', '3', ]),
+            {'id': 'foo', 'pos': Point2D(1, 2), 'count': 3, },
+        )
+
+    def test_invalid_number_of_tokens(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+            Field('pos', Point2D, width=2, optional=True),
+        ])
+        self.assertRaisesWithMessage(
+            ValueError,
+            "expected 1 or 3 tokens, got 2",
+            schema.parse, ['foo', '1', ])
+
+    def test_intern(self):
+        schema = Schema(self.factory, [
+            Field('code', intern=True),
+            Field('skin', optional=True, intern=True),
+        ])
+        strings = {}
+        a = schema.parse(['foo', 'bar'[:2] + 'r', ], strings.setdefault)
+        b = schema.parse(['f' + 'oo', 'bar', ], strings.setdefault)
+        c = schema.parse(['foo', ], strings.setdefault)
+
+        self.assertIs(a['code'], b['code'])
+        self.assertIs(a['skin'], b['skin'])
+        self.assertIsNone(c['skin'])
+        self.assertEqual(strings, {'foo': 'foo', 'bar': 'bar', })
+
+    def test_intern_field_of_several_tokens(self):
+        self.assertRaisesWithMessage(
+            ValueError,
+            "field 'pos' takes several tokens and cannot be interned",
+            Schema, self.factory, [
+                Field('pos', width=2, intern=True),
+            ])
+
+    def test_required_field_after_optional_one(self):
+        self.assertRaisesWithMessage(
+            ValueError,
+            "required field 'count' follows an optional one",
+            Schema, self.factory, [
+                Field('pos', Point2D, width=2, optional=True),
+                Field('count', int),
+            ])
+
+    def test_field_of_several_names(self):
+        schema = Schema(self.factory, [
+            Field(('type', 'code'), to_type_and_code, intern=('code', )),
+            Field(('a', 'b'), width=2, optional=True, default=(None, None)),
+        ])
+        strings = {}
+        a = schema.parse(['tank.T34', ], strings.setdefault)
+        b = schema.parse(['tank.T3' + '4', 'x', 'y', ], strings.setdefault)
+
+        self.assertEqual(a, {
+            'type': 'tank', 'code': 'T34', 'a': None, 'b': None,
+        })
+        self.assertEqual(b, {
+            'type': 'tank', 'code': 'T34', 'a': 'x', 'b': 'y',
+        })
+        self.assertIs(a['code'], b['code'])
+        self.assertEqual(strings, {'T34': 'T34', })
+
+    def test_constants(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+        ], constants={'count': 0, })
+        self.assertEqual(schema.parse(['foo', ]), {'id': 'foo', 'count': 0, })
+
+    def test_extra_tokens(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+            Field('count', int),
+        ], extra_tokens=True)
+        self.assertEqual(
+            schema.parse(['foo', '1', 'bar', 'baz', ]),
+            {'id': 'foo', 'count': 1, },
+        )
+        self.assertRaisesWithMessage(
+            ValueError,
+            "expected at least 2 tokens, got 1",
+            schema.parse, ['foo', ])
+
+    def test_parse_raw(self):
+        schema = Schema(Unit, [
+            Field('id'),
+            Field(('type', 'code'), to_type_and_code, intern=('code', )),
+            Field('count', int),
+        ])
+        strings = {}
+        unit = schema.parse_raw(['foo', 'tank.T34', '3', ], strings.setdefault)
+
+        self.assertEqual(unit.raw_tokens, ('foo', 'tank.T34', '3', ))
+        self.assertIs(unit.code, strings['T34'])
+        self.assertEqual(unit.type, 'tank')
+        self.assertEqual(unit.count, 3)
+        self.assertEqual(unit, Unit('foo', 'tank', 'T34', 3))
+
+    def test_parse_raw_is_not_supported_by_functions(self):
+        schema = Schema(self.factory, [
+            Field('id'),
+        ])
+        self.assertFalse(schema.supports_raw)
+        self.assertEqual(schema.parse_raw(['foo', ]), {'id': 'foo', })
+
+    def test_variants(self):
+        variants = Variants(
+            lambda tokens: tokens[0],
+            {
+                'a': Schema(self.factory, [Field('kind'), Field('x', int)]),
+                'b': Schema(self.factory, [Field('kind'), Field('y')]),
+            },
+        )
+        self.assertEqual(variants.parse(['a', '1', ]), {'kind': 'a', 'x': 1, })
+        self.assertEqual(variants.parse(['b', '1', ]), {'kind': 'b', 'y': '1', })
+        self.assertRaisesWithMessage(
+            ValueError,
+            "unexpected layout of line",
+            variants.parse, ['c', '1', ])
+
+    def test_variants_default(self):
+        variants = Variants(
+            lambda tokens: tokens[0],
+            {
+                'a': Schema(self.factory, [Field('kind'), Field('x', int)]),
+            },
+            default=Schema(self.factory, [Field('kind')], extra_tokens=True),
+        )
+        self.assertEqual(variants.parse(['c', '1', ]), {'kind': 'c', })
@@ -0,0 +1,87 @@
+# coding: utf-8
+
+import bz2
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import lzma
+except ImportError:  # Python 2.7
+    lzma = None
+
+from il2fb.parsers.mission import MissionParser
+from il2fb.parsers.mission.index import SectionIndex
+from il2fb.parsers.mission.sources import detect_compression
+
+from .test_index import MISSION
+
+
+class CompressedMissionTestCase(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.parser = MissionParser()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, opener):
+        path = os.path.join(self.directory, name)
+        f = opener(path, 'wb')
+        try:
+            f.write(MISSION)
+        finally:
+            f.close()
+        return path
+
+    def assert_parsed(self, path, compression):
+        self.assertEqual(detect_compression(path), compression)
+        self.assertEqual(
+            self.parser.parse(path, use_mmap=True),
+            self.parser.parse(MISSION.splitlines()),
+        )
+
+    def test_plain(self):
+        path = self.write('mission.mis', open)
+        self.assert_parsed(path, None)
+
+    def test_gzip(self):
+        path = self.write('mission.mis.gz', gzip.GzipFile)
+        self.assert_parsed(path, 'gzip')
+
+    def test_bz2(self):
+        path = self.write('mission.mis.bz2', bz2.BZ2File)
+        self.assert_parsed(path, 'bz2')
+
+    @unittest.skipIf(lzma is None, "lzma is not available")
+    def test_xz(self):
+        path = self.write('mission.mis', lzma.LZMAFile)
+        self.assert_parsed(path, 'lzma')
+
+    def test_index_compressed(self):
+        path = self.write('mission.mis.gz', gzip.GzipFile)
+        self.assertRaises(ValueError, SectionIndex.build, path)
+
+    @unittest.skipIf(lzma is None, "lzma is not available")
+    def test_legacy_lzma_by_extension(self):
+        path = self.write(
+            'mission.mis.lzma',
+            lambda path, mode: lzma.LZMAFile(
+                path, mode, format=lzma.FORMAT_ALONE,
+            ),
+        )
+        self.assert_parsed(path, 'lzma')
+
+    def test_signature_has_priority_over_extension(self):
+        path = self.write('mission.mis.xz', gzip.GzipFile)
+        self.assert_parsed(path, 'gzip')
+
+    def test_extension_without_signature(self):
+        path = self.write('mission.mis.GZ', open)
+        self.assertEqual(detect_compression(path), 'gzip')
+        self.assertRaises(IOError, self.parser.parse, path)
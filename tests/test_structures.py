@@ -0,0 +1,131 @@
+# coding: utf-8
+
+import json
+import unittest
+
+from il2fb.commons.organization import AirForces
+from il2fb.commons.spatial import Point2D
+from il2fb.commons.targets import TargetTypes, TargetPriorities
+
+from il2fb.parsers.mission.sections.target import (
+    BridgeTarget, ReconTarget, TargetObject,
+)
+from il2fb.parsers.mission.sections.wing import Flight
+
+
+class DictStructureTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.target = ReconTarget(
+            type=TargetTypes.recon,
+            priority=TargetPriorities.primary,
+            in_sleep_mode=True,
+            delay=40,
+            requires_landing=True,
+            pos=Point2D(134459.0, 85239.0),
+            radius=300,
+        )
+
+    def test_item_access(self):
+        self.assertEqual(self.target['radius'], 300)
+        self.assertEqual(self.target.get('radius'), 300)
+        self.assertIn('radius', self.target)
+        self.assertRaises(KeyError, lambda: self.target['unknown'])
+
+    def test_none_fields_are_absent(self):
+        self.assertNotIn('object', self.target)
+        self.assertIsNone(self.target.get('object'))
+        self.assertEqual(self.target.get('object', 1), 1)
+        self.assertRaises(KeyError, lambda: self.target['object'])
+        self.assertEqual(
+            sorted(self.target.keys()),
+            [
+                'delay', 'in_sleep_mode', 'pos', 'priority', 'radius',
+                'requires_landing', 'type',
+            ],
+        )
+
+    def test_mapping_interface(self):
+        keys = [
+            'type', 'priority', 'in_sleep_mode', 'delay', 'requires_landing',
+            'pos', 'radius',
+        ]
+
+        self.assertEqual(list(self.target), keys)
+        self.assertEqual(len(self.target), 7)
+        self.assertEqual(self.target.values()[-1], 300)
+        self.assertEqual(dict(self.target), dict(self.target.items()))
+        self.assertEqual(sorted(dict(self.target)), sorted(keys))
+
+        self.target.object = TargetObject(
+            id='1_Chief', pos=Point2D(134360.0, 85346.0), waypoint=0,
+        )
+        self.assertEqual(len(self.target), 8)
+        self.assertEqual(len(self.target.object), 3)
+
+    def test_item_assignment(self):
+        with self.assertRaises(TypeError):
+            self.target['radius'] = 500
+
+    def test_to_dict(self):
+        target = BridgeTarget(
+            type=TargetTypes.cover_bridge,
+            priority=TargetPriorities.hidden,
+            in_sleep_mode=True,
+            delay=30,
+            pos=Point2D(135896.0, 84536.0),
+            object=TargetObject(
+                id='Bridge84',
+                pos=Point2D(135764.0, 84636.0),
+            ),
+        )
+        expected = {
+            'type': TargetTypes.cover_bridge,
+            'priority': TargetPriorities.hidden,
+            'in_sleep_mode': True,
+            'delay': 30,
+            'pos': Point2D(135896.0, 84536.0),
+            'object': {
+                'id': 'Bridge84',
+                'pos': Point2D(135764.0, 84636.0),
+            },
+        }
+        result = target.to_dict()
+
+        self.assertIs(type(result), dict)
+        self.assertIs(type(result['object']), dict)
+        self.assertEqual(result, expected)
+        self.assertEqual(target, expected)
+        self.assertEqual(dict(target)['delay'], 30)
+
+    def test_equality(self):
+        other = ReconTarget(**self.target.to_dict())
+
+        self.assertEqual(self.target, other)
+        self.assertEqual(hash(self.target), hash(other))
+
+        other.radius = 500
+        self.assertNotEqual(self.target, other)
+        self.assertNotEqual(self.target, other.to_dict())
+
+    def test_to_primitive(self):
+        primitive = self.target.to_primitive()
+
+        self.assertNotIn('object', primitive)
+        self.assertEqual(primitive['type'], self.target.type.to_primitive())
+        self.assertEqual(primitive['radius'], 300)
+        self.assertEqual(json.loads(json.dumps(primitive)), primitive)
+
+    def test_nullable_keys(self):
+        flight = Flight(
+            id='r0100', air_force=AirForces.vvs_rkka, regiment=None,
+            squadron_index=0, flight_index=0, ai_only=False, code='A_20C',
+            fuel=100, with_parachutes=True, count=1, weapons='default',
+            aircrafts=[],
+        )
+
+        self.assertIn('regiment', flight)
+        self.assertIsNone(flight['regiment'])
+        self.assertNotIn('route', flight)
+        self.assertIn('regiment', flight.to_dict())
+        self.assertIn('regiment', flight.to_primitive())
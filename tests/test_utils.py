@@ -5,7 +5,7 @@ import unittest
 
 from il2fb.parsers.mission.constants import COMMENT_MARKERS
 from il2fb.parsers.mission.utils import (
-    move_if_present, set_if_present, strip_comments,
+    move_if_present, patterns_overlap, set_if_present, strip_comments,
 )
 
 
@@ -53,3 +53,23 @@ class UtilsTestCase(unittest.TestCase):
         for combination in itertools.permutations(COMMENT_MARKERS):
             line = "  123 {:} 456 ".format(''.join(combination))
             self.assertEqual(strip_comments(line), "123")
+
+    def test_patterns_overlap(self):
+        cases = [
+            ('r0100_Way', '*_Way', True),
+            ('*', '*_Way', True),
+            ('MDS_Scouts_*', '*[0-9][0-9]', True),
+            ('BornPlace*', 'BornPlace[0-9]*', True),
+            ('0_Chief_Road', '*_Chief_Road', True),
+            ('?', '[!a]', True),
+            ('[]]', ']', True),
+            ('SEASON', '*_Way', False),
+            ('SEASON', '*[0-9][0-9]', False),
+            ('BornPlace', 'BornPlace[0-9]*', False),
+            ('*_Way', '*_Chief_Road', False),
+            ('a', '[!a]', False),
+            ('[!]]', ']', False),
+        ]
+        for a, b, expected in cases:
+            self.assertEqual(patterns_overlap(a, b), expected, (a, b))
+            self.assertEqual(patterns_overlap(b, a), expected, (b, a))